@@ -3,14 +3,25 @@
 # See LICENSE for more details
 
 from pymongo import MongoClient
+from bson.codec_options import CodecOptions
 from bson.objectid import ObjectId
+from bson.raw_bson import RawBSONDocument
 from abc import ABC
+import copy
 from typing import Any, Callable
-from pymongo.errors import PyMongoError
+from pymongo.errors import BulkWriteError, PyMongoError
 from functools import wraps
 from all_the_buzz.utilities.logger import LoggerFactory
-from all_the_buzz.utilities.error_handler import ResponseCode
+from all_the_buzz.utilities.error_handler import ResponseCode, describe_error_tag
 from all_the_buzz.entities.credentials_entity import Credentials
+from all_the_buzz.database_operations.read_cache import ReadCache, cached_read
+from all_the_buzz.database_operations.index_manager import indexed_filter_fields
+
+#Server error codes of individual bulk write failures mapped to error_handler tags
+_WRITE_ERROR_TAGS = {11000: "DuplicateKeyError", 121: "CollectionInvalid"}
+
+#Reads with raw=True return RawBSONDocuments, which keep the undecoded BSON bytes of each document
+_RAW_CODEC_OPTIONS = CodecOptions(document_class=RawBSONDocument)
 
 def mongo_safe(func):
     '''
@@ -52,6 +63,14 @@ class DatabaseAccessObject(ABC):
         "delete": ["Employee", "Manager"]
     }
 
+    #Top-level fields a caller may request with fields=; _id is always returned. Override in subclass
+    PROJECTABLE_FIELDS: frozenset[str] = frozenset()
+
+    #Serve idempotent reads from an in-process cache that every write invalidates. Override in subclass
+    CACHE_READS: bool = False
+    READ_CACHE_SIZE: int = 256
+    READ_CACHE_TTL_SECONDS: float = 60.0
+
     def __init__(self, table_name: str, client: MongoClient, database_name: str):
         '''
         Args:
@@ -63,6 +82,11 @@ class DatabaseAccessObject(ABC):
         self._collection = self.__db[table_name]
         self.__logger = LoggerFactory.get_general_logger()
         self.__credentials = None
+        #Shared by every credential-bound view, since with_credentials() makes a shallow copy
+        self._read_cache = ReadCache(self.READ_CACHE_SIZE, self.READ_CACHE_TTL_SECONDS) if self.CACHE_READS else None
+        #Filter fields no declared index serves are logged once each; the set is shared by credential-bound views
+        self._indexed_fields = indexed_filter_fields(table_name)
+        self._reported_unindexed: set[str] = set()
 
     def get_credentials(self):
         return self.__credentials
@@ -93,6 +117,33 @@ class DatabaseAccessObject(ABC):
             return wrapper
         return decorator
 
+    def _projection(self, fields: list[str] = None):
+        '''
+        Builds a Mongo projection from requested field names, allowing only names in PROJECTABLE_FIELDS
+        
+        Args:
+            fields (list[str] | str optional): the field names to return, as a list or comma-separated string
+
+        Returns:
+            projection (dict[str, int] | None | ResponseCode): the projection, None if no fields were requested
+            or an InvalidFilter ResponseCode if a field is not allowed
+        '''
+        if not fields:
+            return None
+        if isinstance(fields, str):
+            fields = fields.split(",")
+        fields = [field.strip() for field in fields if field.strip()]
+        unknown = [field for field in fields if field not in self.PROJECTABLE_FIELDS]
+        if unknown:
+            return ResponseCode("InvalidFilter", f"Fields cannot be selected: {', '.join(unknown)}")
+        projection = {"_id": 1}
+        projection.update({field: 1 for field in fields})
+        return projection
+
+    def _reader(self, raw: bool = False):
+        #The collection to read from; raw reads skip decoding documents into dicts
+        return self._collection.with_options(codec_options=_RAW_CODEC_OPTIONS) if raw else self._collection
+
     #Hook method; this should set any default field values; just override it
     def _prepare_entry(self, entry: dict[str, Any]) -> dict[str, Any]:
         '''
@@ -106,6 +157,15 @@ class DatabaseAccessObject(ABC):
         '''
         return entry  #Default: no changes
     
+    def _report_unindexed(self, filter: dict[str, Any]) -> None:
+        #The API accepts a filter on any field, so warn the first time one is used that no index can serve
+        for field in filter:
+            if field.startswith("$") or field in self._indexed_fields or field in self._reported_unindexed:
+                continue
+            self._reported_unindexed.add(field)
+            self.__logger.warning("Filter on %s.%s is not served by any index; declare one in db_schemas/index_specs.py if it is common.",
+                                  self._collection.name, field)
+
     def set_credentials(self, credentials: Credentials) -> None:
         '''
         Sets the current credentials of the DAO
@@ -121,54 +181,96 @@ class DatabaseAccessObject(ABC):
         '''
         self.__credentials = None
 
+    def _invalidate_reads(self) -> None:
+        '''
+        Drops every cached read of this collection; called after each successful write
+        '''
+        if self._read_cache is not None:
+            self._read_cache.invalidate_all()
+
+    def with_credentials(self, credentials: Credentials) -> "DatabaseAccessObject":
+        '''
+        Returns a request-scoped view of this DAO bound to the given credentials. The view is a shallow
+        copy, so it shares the collection handle (and its connection pool) with the original, but setting
+        or clearing its credentials never affects the shared DAO or any other request.
+        
+        Args:
+            credentials (Credentials): the credentials given by the authorization server to use for role-based access control
+
+        Returns:
+            view (DatabaseAccessObject): a DAO of the same type whose credentials are set to the given credentials
+        '''
+        view = copy.copy(self)
+        view.__credentials = credentials
+        return view
+
     @rbac_action("read")
-    def get_by_key(self, ID: str) -> ResponseCode:
+    @cached_read
+    def get_by_key(self, ID: str, fields: list[str] = None) -> ResponseCode:
         '''
         Return MongoDB document by ID
         
         Args:
             ID (str): a string corresponding to a MongoDB _id value
+            fields (list[str] optional): the fields to return; all fields are returned if None
 
         Returns:
             ResponseCode (ResponseCode): After being wrapped, it will return a ResponseCode
             with the JSON document as data
         '''
-        self.__logger.debug(f"Getting {self.__class__.__name__} record by ID {ID}.")
-        document = self._collection.find_one({"_id": ObjectId(ID)})
+        projection = self._projection(fields)
+        if isinstance(projection, ResponseCode):
+            return projection
+        self.__logger.debug("Getting %s record by ID %s.", self.__class__.__name__, ID)
+        document = self._collection.find_one({"_id": ObjectId(ID)}, projection)
         if document is None:
             return ResponseCode(error_tag="ResourceNotFound")
         return document
 
     @rbac_action("read")
-    def get_by_fields(self, filter: dict[str, Any]) -> ResponseCode:
+    @cached_read
+    def get_by_fields(self, filter: dict[str, Any], fields: list[str] = None, raw: bool = False) -> ResponseCode:
         '''
         Return MongoDB documents by given fields
         
         Args:
             filter (dict[str, Any]): a dictionary corresponding to the fields to check and the values by which to filter
+            fields (list[str] optional): the fields to return; all fields are returned if None
+            raw (bool optional): return read-only RawBSONDocuments instead of dicts, for callers that only
+            serialize the documents. Defaults to False
 
         Returns:
             ResponseCode (ResponseCode): After being wrapped, it will return a ResponseCode with the JSON
             documents as data
         '''
-        self.__logger.debug(f"Getting {self.__class__.__name__} record by fields {filter}.")
-        document_list = list(self._collection.find(filter))
+        projection = self._projection(fields)
+        if isinstance(projection, ResponseCode):
+            return projection
+        self.__logger.debug("Getting %s record by fields %s.", self.__class__.__name__, filter)
+        self._report_unindexed(filter)
+        document_list = list(self._reader(raw).find(filter, projection))
         return document_list
     
     @rbac_action("read")
-    def get_all_records(self, limit: int = None) -> ResponseCode:
+    @cached_read
+    def get_all_records(self, limit: int = None, fields: list[str] = None, raw: bool = False) -> ResponseCode:
         '''
         Return all (or the first x) MongoDB documents from a collection
         
         Args:
             limit (int optional): an integer that determines the number of records to send back. By default, it is set to None and returns the entire set of documents
+            fields (list[str] optional): the fields to return; all fields are returned if None
+            raw (bool optional): return read-only RawBSONDocuments instead of dicts. Defaults to False
 
         Returns:
             ResponseCode (ResponseCode): After being wrapped, it will return a ResponseCode with the JSON
             documents from the collection as data
         '''
-        self.__logger.debug(f"Getting all {self.__class__.__name__} records with limit {limit}.")
-        cursor = self._collection.find({})
+        projection = self._projection(fields)
+        if isinstance(projection, ResponseCode):
+            return projection
+        self.__logger.debug("Getting all %s records with limit %s.", self.__class__.__name__, limit)
+        cursor = self._reader(raw).find({}, projection)
         if limit is not None:
             cursor = cursor.limit(limit)
         documents = list(cursor)
@@ -176,30 +278,108 @@ class DatabaseAccessObject(ABC):
             return ResponseCode(error_tag="ResourceNotFound")
         return documents
     
+    @staticmethod
+    def _after_filter(filter: dict[str, Any], after: str = None) -> dict[str, Any]:
+        #Adds an _id range condition so that reads resume after the given cursor (keyset pagination)
+        if after is None:
+            return filter
+        return {"$and": [filter, {"_id": {"$gt": ObjectId(after)}}]} if filter else {"_id": {"$gt": ObjectId(after)}}
+
     @rbac_action("read")
-    def get_random(self, numReturned: int = 1, filter: dict[str, Any] = None) -> ResponseCode:
+    @cached_read
+    def get_page(self, filter: dict[str, Any] = None, after: str = None, limit: int = 100,
+                 fields: list[str] = None, raw: bool = False) -> ResponseCode:
+        '''
+        Return one page of MongoDB documents ordered by _id. Pages are read with an _id range scan,
+        so every page costs the same no matter how deep into the collection it is.
+        
+        Args:
+            filter (dict[str, Any] optional): a dictionary corresponding to the fields to check and the values by which to filter
+            after (str optional): the next_cursor of the previous page; the first page is returned if it is None
+            limit (int optional): the maximum number of documents on the page. Defaults to 100
+            fields (list[str] optional): the fields to return; all fields are returned if None
+            raw (bool optional): return read-only RawBSONDocuments instead of dicts. Defaults to False
+
+        Returns:
+            page (dict[str, Any]): {'records': <documents>, 'next_cursor': <_id string or None if this is the last page>}
+            or a ResponseCode if the cursor is not a valid ObjectId
+        '''
+        filter = filter or {}
+        if after is not None and not ObjectId.is_valid(after):
+            return ResponseCode("InvalidFilter", "after must be a valid ObjectId.")
+        projection = self._projection(fields)
+        if isinstance(projection, ResponseCode):
+            return projection
+        self.__logger.debug("Getting page of %s %s records after %s by fields %s.", limit, self.__class__.__name__, after, filter)
+        self._report_unindexed(filter)
+        #Read one extra document to know whether another page follows without a second query
+        documents = list(self._reader(raw).find(self._after_filter(filter, after), projection).sort("_id", 1).limit(limit + 1))
+        next_cursor = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            next_cursor = str(documents[-1]["_id"])
+        return {"records": documents, "next_cursor": next_cursor}
+
+    @rbac_action("read")
+    def iter_records(self, filter: dict[str, Any] = None, after: str = None, batch_size: int = 500,
+                     fields: list[str] = None, raw: bool = False):
+        '''
+        Return a cursor over MongoDB documents ordered by _id so that they can be streamed to the client
+        without holding the whole result in memory
+        
+        Args:
+            filter (dict[str, Any] optional): a dictionary corresponding to the fields to check and the values by which to filter
+            after (str optional): only documents with an _id greater than this one are returned
+            batch_size (int optional): how many documents the driver fetches per round trip. Defaults to 500
+            fields (list[str] optional): the fields to return; all fields are returned if None
+            raw (bool optional): yield read-only RawBSONDocuments instead of dicts. Defaults to False
+
+        Returns:
+            cursor (Cursor): a lazily evaluated cursor over the matching documents or a ResponseCode if
+            the cursor is not a valid ObjectId
+        '''
+        filter = filter or {}
+        if after is not None and not ObjectId.is_valid(after):
+            return ResponseCode("InvalidFilter", "after must be a valid ObjectId.")
+        projection = self._projection(fields)
+        if isinstance(projection, ResponseCode):
+            return projection
+        self.__logger.debug("Streaming %s records after %s by fields %s.", self.__class__.__name__, after, filter)
+        self._report_unindexed(filter)
+        return self._reader(raw).find(self._after_filter(filter, after), projection).sort("_id", 1).batch_size(batch_size)
+
+    @rbac_action("read")
+    def get_random(self, numReturned: int = 1, filter: dict[str, Any] = None, fields: list[str] = None) -> ResponseCode:
         '''
         Return a set number of random records given an optional filter
         
         Args:
             numReturned (int optional): an integer that determines the number of documents returned. Defaults to 1
             filter (dict[str, Any] optional): a dictionary corresponding to the fields to check and the values by which to filter
+            fields (list[str] optional): the fields to return; all fields are returned if None
 
         Returns:
             ResponseCode (ResponseCode): After being wrapped, it will return a ResponseCode with the JSON documents as data
         '''
         filter = filter or {}
-        self.__logger.debug(f"Getting {numReturned} random {self.__class__.__name__} record by fields {filter}.")
-        random_documents = list(self._collection.aggregate([
+        projection = self._projection(fields)
+        if isinstance(projection, ResponseCode):
+            return projection
+        self.__logger.debug("Getting %s random %s record by fields %s.", numReturned, self.__class__.__name__, filter)
+        pipeline = [
             {"$match": filter},
             {"$sample": {"size": numReturned}}
-        ]))
+        ]
+        if projection:
+            pipeline.append({"$project": projection})
+        random_documents = list(self._collection.aggregate(pipeline))
         if len(random_documents) < numReturned:
             self.__logger.warning(f"Requested {numReturned}, but only returned {len(random_documents)} records.")
         return random_documents
     
     @rbac_action("read")
-    def get_short_record(self, numReturned: int, filter: dict[str, Any] = None, max_length: int = 80) -> ResponseCode:
+    def get_short_record(self, numReturned: int, filter: dict[str, Any] = None, max_length: int = 80,
+                         fields: list[str] = None) -> ResponseCode:
         '''
         Return a set number of random records given an optional filter that also have a content less than
         the given max_length
@@ -208,12 +388,16 @@ class DatabaseAccessObject(ABC):
             numReturned (int optional): an integer that determines the number of documents returned. Defaults to 1
             filter (dict[str, Any] optional): a dictionary corresponding to the fields to check and the values by which to filter
             max_length (int optional): an integer that determines the max_length of the content field. Defaults to 80
+            fields (list[str] optional): the fields to return; all fields are returned if None
 
         Returns:
             ResponseCode (ResponseCode): After being wrapped, it will return a ResponseCode with the JSON documents as data
         '''
         filter = filter or {}
-        self.__logger.debug(f"Getting  {numReturned} random short (less than {max_length} characters) {self.__class__.__name__} record by fields {filter}.")
+        projection = self._projection(fields)
+        if isinstance(projection, ResponseCode):
+            return projection
+        self.__logger.debug("Getting  %s random short (less than %s characters) %s record by fields %s.", numReturned, max_length, self.__class__.__name__, filter)
         #randomizes the result, because I guess it does not matter?
         pipeline = [
         {
@@ -231,6 +415,8 @@ class DatabaseAccessObject(ABC):
         },
         { "$sample": { "size": numReturned } }
         ]
+        if projection:
+            pipeline.append({"$project": projection})
         result = list(self._collection.aggregate(pipeline))
         if len(result) < numReturned:
             self.__logger.warning(f"Requested {numReturned}, but only returned {len(result)} records.")
@@ -252,11 +438,12 @@ class DatabaseAccessObject(ABC):
         '''
         if not updates:
             return ResponseCode("MalformedContent", "Update payload must not be empty.")
-        self.__logger.debug(f"Updating {self.__class__.__name__} with ID {ID}: {updates}.")
+        self.__logger.debug("Updating %s with ID %s: %s.", self.__class__.__name__, ID, updates)
         update_op = {"$set": updates}
         result = self._collection.update_one({"_id": ObjectId(ID)}, update_op)
         if result.matched_count == 0:
             return ResponseCode(error_tag="ResourceNotFound")
+        self._invalidate_reads()
         return ID
     
     @rbac_action("create")
@@ -272,11 +459,59 @@ class DatabaseAccessObject(ABC):
             ResponseCode (ResponseCode): After being wrapped, it will return a ResponseCode with InsertOneResult
         '''
         entry = self._prepare_entry(entry) #Determines if there should be default field values; override in subclass
-        self.__logger.debug(f"Creating {self.__class__.__name__} record: {entry}.")
+        self.__logger.debug("Creating %s record: %s.", self.__class__.__name__, entry)
         result = self._collection.insert_one(entry)
-        self.__logger.debug(f"Created! New ID {str(result.inserted_id)}")
+        self._invalidate_reads()
+        self.__logger.debug("Created! New ID %s", result.inserted_id)
         return ResponseCode("PostSuccess", str(result.inserted_id))
 
+    @rbac_action("create")
+    @mongo_safe
+    def create_records(self, entries: list[dict[str, Any]], chunk_size: int = 1000) -> ResponseCode:
+        '''
+        Creates many records with unordered insert_many calls of at most chunk_size documents. A failed
+        document does not stop the others; its error is reported from the BulkWriteError details.
+        
+        Args:
+            entries (list[dict[str, Any]]): the documents to add to the collection (they are not modified)
+            chunk_size (int optional): the most documents sent in one insert_many
+
+        Returns:
+            ResponseCode (ResponseCode): PostSuccess if every document was inserted, BulkPartialSuccess if
+            some were, otherwise BulkWriteError. data is {"inserted": int, "failed": int, "results": [...]}
+            where each result is {"index", "status": "inserted", "id"} or {"index", "status": "failed",
+            "code_tag", "message"}, in input order
+        '''
+        if chunk_size <= 0:
+            return ResponseCode("InvalidFilter", "chunk_size must be a positive integer.")
+        self.__logger.debug("Creating %d %s records in chunks of %d.", len(entries), self.__class__.__name__, chunk_size)
+        results = []
+        inserted = 0
+        for start in range(0, len(entries), chunk_size):
+            #insert_many adds _id to each document, so copies are sent
+            chunk = [self._prepare_entry(dict(entry)) for entry in entries[start:start + chunk_size]]
+            try:
+                self._collection.insert_many(chunk, ordered=False)
+                write_errors = {}
+            except BulkWriteError as e:
+                write_errors = {error["index"]: error for error in e.details.get("writeErrors", [])}
+            for offset, document in enumerate(chunk):
+                error = write_errors.get(offset)
+                if error is None:
+                    results.append({"index": start + offset, "status": "inserted", "id": str(document["_id"])})
+                    inserted += 1
+                else:
+                    code_tag = _WRITE_ERROR_TAGS.get(error.get("code"), "WriteError")
+                    results.append({"index": start + offset, "status": "failed", "code_tag": code_tag,
+                                    "message": describe_error_tag(code_tag)[1]})
+        if inserted:
+            self._invalidate_reads()
+        failed = len(results) - inserted
+        summary = {"inserted": inserted, "failed": failed, "results": results}
+        if not failed:
+            return ResponseCode("PostSuccess", summary)
+        return ResponseCode("BulkPartialSuccess" if inserted else "BulkWriteError", summary)
+
     @rbac_action("delete")
     @mongo_safe
     def delete_record(self, ID: str) -> ResponseCode:
@@ -290,8 +525,9 @@ class DatabaseAccessObject(ABC):
             ResponseCode (ResponseCode): After being wrapped, it will return a ResponseCode with the
             deleted_count ({1}) as data
         '''
-        self.__logger.debug(f"Deleting {self.__class__.__name__} record.")
+        self.__logger.debug("Deleting %s record.", self.__class__.__name__)
         result = self._collection.delete_one({"_id": ObjectId(ID)})
+        self._invalidate_reads()
         if result.deleted_count == 0:
             return ResponseCode(error_tag="ResourceNotFound")
         return {"deleted_count": result.deleted_count}
@@ -313,6 +549,7 @@ class DatabaseAccessObject(ABC):
             return ResponseCode("MalformedContent", "Delete filter must not be empty.")
         if len(filter) > 1:
             return ResponseCode("MalformedContent", "Delete filter must contain only one field.")
-        self.__logger.debug(f"Deleting {self.__class__.__name__} record by filter {filter}.")
+        self.__logger.debug("Deleting %s record by filter %s.", self.__class__.__name__, filter)
         result = self._collection.delete_many(filter)
+        self._invalidate_reads()
         return {"deleted_count": result.deleted_count}
\ No newline at end of file
@@ -0,0 +1,270 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+from typing import Any, Optional
+from bson.objectid import ObjectId
+from pymongo import UpdateOne
+from pymongo.client_session import ClientSession
+from pymongo.errors import BulkWriteError, OperationFailure, PyMongoError
+from all_the_buzz.database_operations.abstract_record import DatabaseAccessObject, mongo_safe, _WRITE_ERROR_TAGS
+from all_the_buzz.entities.batch_validation import get_batch_validator
+from all_the_buzz.utilities.error_handler import ResponseCode, describe_error_tag
+from all_the_buzz.utilities.logger import LoggerFactory
+
+'''
+approval_service.py
+
+This module approves pending records. Approving moves a record from a private (pending) collection to
+its public collection: a new record is inserted and an edit is merged into the record it edits. The
+move runs inside a client session transaction, so it either happens completely or not at all. On a
+deployment without transactions (a standalone server) it falls back to find_one_and_delete followed by
+an upsert keyed by the pending record's _id, which is two round trips and can be retried safely.
+
+Moderation queues can also be cleared in batches: approve_many reads every pending record with one
+query, validates them together and publishes them with one unordered bulk_write before removing them
+with one delete_many, and deny_many removes many pending records at once. Both report an outcome per ID.
+
+Classes:
+    ApprovalService: moves approved records from a private DAO's collection to a public DAO's collection
+'''
+
+#The most IDs accepted by approve_many and deny_many
+MAX_BATCH_IDS = 1000
+
+#IllegalOperation: returned by a standalone server when a transaction is started
+_TRANSACTIONS_NOT_SUPPORTED = 20
+
+class _ApprovalAborted(Exception):
+    #Raised inside a transaction to roll it back and end the approval with the given response
+    def __init__(self, response: ResponseCode):
+        super().__init__(response.get_error_tag())
+        self.response = response
+
+def _allowed(dao: DatabaseAccessObject, action: str) -> bool:
+    credentials = dao.get_credentials()
+    return credentials is not None and credentials.title in dao.ROLE_MATRIX.get(action, [])
+
+def _failed(error_tag: str, **details: Any) -> dict[str, Any]:
+    return {"status": "failed", "code_tag": error_tag, "message": describe_error_tag(error_tag)[1], **details}
+
+def _parse_batch(IDs: list[str]) -> tuple[list[str], dict[str, ObjectId]]:
+    #Drops repeated IDs (keeping the first) and maps every valid ID to its ObjectId
+    IDs = list(dict.fromkeys(IDs))
+    return IDs, {ID: ObjectId(ID) for ID in IDs if ObjectId.is_valid(ID)}
+
+def _batch_response(IDs: list[str], object_ids: dict[str, ObjectId], outcomes: dict[ObjectId, dict[str, Any]],
+                    done_status: str) -> ResponseCode:
+    results = []
+    for ID in IDs:
+        if ID not in object_ids:
+            outcome = _failed("MalformedContent")
+        else:
+            outcome = outcomes.get(object_ids[ID]) or _failed("ResourceNotFound")
+        results.append({"id": ID, **outcome})
+    done = sum(1 for result in results if result["status"] == done_status)
+    summary = {done_status: done, "failed": len(results) - done, "results": results}
+    if done == len(results):
+        return ResponseCode("GeneralSuccess", summary)
+    return ResponseCode("BulkPartialSuccess" if done else "BulkWriteError", summary)
+
+class ApprovalService:
+    '''
+    Approves records of one type. Both DAOs must be bound to the approver's credentials (see
+    DatabaseAccessObject.with_credentials); the approver needs delete on the private DAO and create and
+    update on the public DAO.
+    '''
+    def __init__(self, entity_class: type, public_dao: DatabaseAccessObject, private_dao: DatabaseAccessObject):
+        '''
+        Args:
+            entity_class (type): Joke, Trivia, Quote or Bio; validates the pending record before it is published
+            public_dao (DatabaseAccessObject): the DAO of the public collection
+            private_dao (DatabaseAccessObject): the DAO of the private (pending) collection
+        '''
+        self.__entity_class = entity_class
+        self.__public_dao = public_dao
+        self.__private_dao = private_dao
+        self.__logger = LoggerFactory.get_general_logger()
+
+    @mongo_safe
+    def approve(self, ID: str) -> ResponseCode:
+        '''
+        Publishes the pending record with the given ID and removes it from the private collection
+
+        Args:
+            ID (str): a string corresponding to the MongoDB _id of the pending record
+
+        Returns:
+            ResponseCode (ResponseCode): GeneralSuccess with {"public_id", "deleted_count"} as data, where
+            public_id is the _id of the new record (the pending record's _id) or of the edited record.
+            ResourceNotFound if the pending record or the record it edits does not exist, InvalidRecord if
+            the pending record does not validate and PermissionIncongruency if the credentials do not allow
+            the move. Nothing is changed when an error is returned.
+        '''
+        if not (_allowed(self.__private_dao, "delete") and _allowed(self.__public_dao, "create")
+                and _allowed(self.__public_dao, "update")):
+            return ResponseCode("PermissionIncongruency", "Approving requires delete on the pending collection and create and update on the public collection.")
+        if not ObjectId.is_valid(ID):
+            return ResponseCode("MalformedContent", "The record ID must be a valid ObjectId.")
+        pending_id = ObjectId(ID)
+        client = self.__public_dao._collection.database.client
+        try:
+            if client.topology_description.topology_type_name == "Single":
+                public_id = self._move_without_transaction(pending_id)
+            else:
+                try:
+                    public_id = self._move_in_transaction(client, pending_id)
+                except OperationFailure as e:
+                    if e.code != _TRANSACTIONS_NOT_SUPPORTED:
+                        raise
+                    public_id = self._move_without_transaction(pending_id)
+        except _ApprovalAborted as e:
+            return e.response
+        self.__public_dao._invalidate_reads()
+        self.__private_dao._invalidate_reads()
+        self.__logger.debug("Approved %s %s as %s.", self.__entity_class.__name__, ID, public_id)
+        return {"public_id": public_id, "deleted_count": 1}
+
+    @mongo_safe
+    def approve_many(self, IDs: list[str]) -> ResponseCode:
+        '''
+        Publishes many pending records: one find reads them, the batch validator checks them together,
+        one unordered bulk_write publishes them (upserts keyed by the pending _id for new records, $set on
+        the original for edits) and one delete_many removes the published ones from the private collection.
+        A record that fails is left pending. Every write is idempotent, so the batch can be retried.
+
+        Args:
+            IDs (list[str]): strings corresponding to the MongoDB _ids of the pending records (at most MAX_BATCH_IDS)
+
+        Returns:
+            ResponseCode (ResponseCode): GeneralSuccess if every record was approved, BulkPartialSuccess if
+            some were, otherwise BulkWriteError. data is {"approved": int, "failed": int, "results": [...]}
+            where each result is {"id", "status": "approved", "public_id"} or {"id", "status": "failed",
+            "code_tag", "message"}, in input order
+        '''
+        if not (_allowed(self.__private_dao, "delete") and _allowed(self.__public_dao, "create")
+                and _allowed(self.__public_dao, "update")):
+            return ResponseCode("PermissionIncongruency", "Approving requires delete on the pending collection and create and update on the public collection.")
+        if not IDs or len(IDs) > MAX_BATCH_IDS:
+            return ResponseCode("MalformedContent", f"Between 1 and {MAX_BATCH_IDS} IDs must be given.")
+        IDs, object_ids = _parse_batch(IDs)
+        outcomes = {}
+        private_collection = self.__private_dao._collection
+        public_collection = self.__public_dao._collection
+        documents = list(private_collection.find({"_id": {"$in": list(object_ids.values())}}))
+        validation = get_batch_validator(self.__entity_class).validate(documents)
+        for index, messages in validation.errors.items():
+            outcomes[documents[index]["_id"]] = _failed("InvalidRecord", errors=messages)
+
+        #(pending _id, public write, public _id) of every record that passed validation
+        writes = []
+        for fields, index in zip(validation.documents, validation.indexes):
+            pending_id = documents[index]["_id"]
+            is_edit = fields.pop("is_edit", None)
+            original_id = fields.pop("original_id", None)
+            fields.pop("id", None)
+            #Publishing never changes whether a quote was used; new quotes get it from _prepare_entry
+            fields.pop("used_date", None)
+            if is_edit == True:
+                writes.append((pending_id, UpdateOne({"_id": ObjectId(original_id)}, {"$set": fields}), original_id))
+            else:
+                writes.append((pending_id, UpdateOne({"_id": pending_id}, {"$setOnInsert": self.__public_dao._prepare_entry(fields)},
+                                                      upsert=True), str(pending_id)))
+        #bulk_write only reports total match counts, so edits of records that no longer exist are found first
+        original_ids = [ObjectId(public_id) for pending_id, write, public_id in writes if public_id != str(pending_id)]
+        if original_ids:
+            existing = {str(document["_id"]) for document in public_collection.find({"_id": {"$in": original_ids}}, {"_id": 1})}
+            for pending_id, write, public_id in writes:
+                if public_id != str(pending_id) and public_id not in existing:
+                    outcomes[pending_id] = _failed("ResourceNotFound")
+            writes = [write for write in writes if write[0] not in outcomes]
+
+        write_errors = {}
+        if writes:
+            try:
+                public_collection.bulk_write([write for pending_id, write, public_id in writes], ordered=False)
+            except BulkWriteError as e:
+                write_errors = {error["index"]: error for error in e.details.get("writeErrors", [])}
+        approved = []
+        for position, (pending_id, write, public_id) in enumerate(writes):
+            error = write_errors.get(position)
+            if error is None:
+                outcomes[pending_id] = {"status": "approved", "public_id": public_id}
+                approved.append(pending_id)
+            else:
+                outcomes[pending_id] = _failed(_WRITE_ERROR_TAGS.get(error.get("code"), "WriteError"))
+        if approved:
+            private_collection.delete_many({"_id": {"$in": approved}})
+            self.__public_dao._invalidate_reads()
+            self.__private_dao._invalidate_reads()
+        self.__logger.debug("Approved %d of %d %s records.", len(approved), len(IDs), self.__entity_class.__name__)
+        return _batch_response(IDs, object_ids, outcomes, "approved")
+
+    @mongo_safe
+    def deny_many(self, IDs: list[str]) -> ResponseCode:
+        '''
+        Removes many pending records with one delete_many
+
+        Args:
+            IDs (list[str]): strings corresponding to the MongoDB _ids of the pending records (at most MAX_BATCH_IDS)
+
+        Returns:
+            ResponseCode (ResponseCode): GeneralSuccess if every record was denied, BulkPartialSuccess if
+            some were, otherwise BulkWriteError. data is {"denied": int, "failed": int, "results": [...]}
+            where each result is {"id", "status": "denied"} or {"id", "status": "failed", "code_tag", "message"}
+        '''
+        if not _allowed(self.__private_dao, "delete"):
+            return ResponseCode("PermissionIncongruency", "Denying requires delete on the pending collection.")
+        if not IDs or len(IDs) > MAX_BATCH_IDS:
+            return ResponseCode("MalformedContent", f"Between 1 and {MAX_BATCH_IDS} IDs must be given.")
+        IDs, object_ids = _parse_batch(IDs)
+        private_collection = self.__private_dao._collection
+        #Per-ID outcomes need to know which records exist; delete_many only returns a count
+        found = [document["_id"] for document in private_collection.find({"_id": {"$in": list(object_ids.values())}}, {"_id": 1})]
+        if found:
+            private_collection.delete_many({"_id": {"$in": found}})
+            self.__private_dao._invalidate_reads()
+        return _batch_response(IDs, object_ids, {pending_id: {"status": "denied"} for pending_id in found}, "denied")
+
+    def _move_in_transaction(self, client, pending_id: ObjectId) -> str:
+        def move(session: ClientSession) -> str:
+            document = self.__private_dao._collection.find_one_and_delete({"_id": pending_id}, session=session)
+            return self._publish(document, session)
+        with client.start_session() as session:
+            #with_transaction retries transient errors and aborts if move raises
+            return session.with_transaction(move)
+
+    def _move_without_transaction(self, pending_id: ObjectId) -> str:
+        document = self.__private_dao._collection.find_one_and_delete({"_id": pending_id})
+        try:
+            return self._publish(document, None)
+        except (_ApprovalAborted, PyMongoError):
+            #Put the pending record back so the approval can be retried; the upsert is keyed by its _id,
+            #so a retry never creates a second public record
+            if document is not None:
+                self.__private_dao._collection.insert_one(document)
+            raise
+
+    def _publish(self, document: Optional[dict[str, Any]], session: Optional[ClientSession]) -> str:
+        if document is None:
+            raise _ApprovalAborted(ResponseCode("ResourceNotFound"))
+        try:
+            #Rows written before bodies were sanitized on create may still hold raw content
+            record = self.__entity_class.from_json_object(document)
+        except ValueError as e:
+            raise _ApprovalAborted(ResponseCode("InvalidRecord", str(e)))
+        is_edit, original_id = record.is_edit, record.ref_id
+        record.is_edit = None
+        record.ref_id = None
+        fields = record.to_json_object()
+        fields.pop("id", None)
+        public_collection = self.__public_dao._collection
+        if is_edit == True:
+            result = public_collection.update_one({"_id": ObjectId(original_id)}, {"$set": fields}, session=session)
+            if result.matched_count == 0:
+                raise _ApprovalAborted(ResponseCode("ResourceNotFound", f"The edited record {original_id} does not exist."))
+            return original_id
+        #The public record takes the pending record's _id, so publishing it twice changes nothing
+        public_collection.update_one({"_id": document["_id"]}, {"$setOnInsert": self.__public_dao._prepare_entry(fields)},
+                                     upsert=True, session=session)
+        return str(document["_id"])
@@ -14,6 +14,9 @@ class PublicBioDAO(DatabaseAccessObject):
         "delete": ["Manager"]
     }
 
+    PROJECTABLE_FIELDS = frozenset({"name", "summary", "paragraph", "source_url", "birth_year", "death_year", "language"})
+    CACHE_READS = True
+
     def __init__(self, client: MongoClient, database_name: str):
         '''
         Args:
@@ -30,6 +33,8 @@ class PrivateBioDAO(DatabaseAccessObject):
         "delete": ["Manager"]
     }
 
+    PROJECTABLE_FIELDS = frozenset({"name", "summary", "paragraph", "source_url", "birth_year", "death_year", "language", "is_edit", "original_id"})
+
     def __init__(self, client: MongoClient, database_name: str):
         '''
         Args:
@@ -0,0 +1,305 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import argparse
+import codecs
+import json
+import os
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, IO, Iterable, Iterator, Optional
+from dotenv import load_dotenv
+from pymongo import MongoClient
+from pymongo.server_api import ServerApi
+from all_the_buzz.database_operations.abstract_record import DatabaseAccessObject
+from all_the_buzz.entities.batch_validation import get_batch_validator
+from all_the_buzz.entities.credentials_entity import Credentials
+from all_the_buzz.entities.record_entities import Joke, Trivia, Quote, Bio
+from all_the_buzz.utilities.error_handler import ResponseCode
+from all_the_buzz.utilities.logger import LoggerFactory
+
+'''
+bulk_import.py
+
+This module loads many records at once. The input (a JSON array or newline-delimited JSON) is parsed
+as a stream, validated in batches with the batch validators and written with unordered insert_many
+calls, so memory use is bounded by the batch size rather than the input size. It backs the
+/<type>/bulk endpoints and a command line loader.
+
+Classes:
+    MalformedRecord: stands in for an NDJSON line that is not valid JSON
+
+Functions:
+    -iter_json_records: yields the records of a JSON array or NDJSON stream one at a time
+    -import_records: validates and writes records in batches and reports every record that was not written
+    -main: command line entry point (python -m all_the_buzz.database_operations.bulk_import)
+'''
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_CHUNK_SIZE = 1000
+_READ_SIZE = 64 * 1024
+_JSON_WHITESPACE = " \t\r\n"
+#Characters that can continue a JSON number (a fraction, an exponent or more digits)
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+#Record type names used by the endpoints and the command line, mapped to (entity, public DAO, private DAO)
+RECORD_TYPES = {
+    "jokes": (Joke, "PublicJokeDAO", "PrivateJokeDAO"),
+    "quotes": (Quote, "PublicQuoteDAO", "PrivateQuoteDAO"),
+    "trivias": (Trivia, "PublicTriviaDAO", "PrivateTriviaDAO"),
+    "bios": (Bio, "PublicBioDAO", "PrivateBioDAO"),
+}
+
+class MalformedRecord:
+    '''
+    Placeholder yielded for an NDJSON line that could not be parsed, so the line is reported instead of
+    stopping the whole import
+    '''
+    __slots__ = ("message",)
+
+    def __init__(self, message: str):
+        self.message = message
+
+def _read_text(stream: IO) -> Iterator[str]:
+    #Reads a binary or text stream in chunks, decoding UTF-8 across chunk boundaries
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    while True:
+        chunk = stream.read(_READ_SIZE)
+        if not chunk:
+            break
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+def _parse_line(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as e:
+        return MalformedRecord(f"Malformed JSON: {e.msg}")
+
+def _iter_lines(chunks: Iterator[str], buffer: str) -> Iterator[Any]:
+    pending = buffer
+    for chunk in chain([""], chunks):
+        lines = (pending + chunk).split("\n")
+        pending = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield _parse_line(line)
+    if pending.strip():
+        yield _parse_line(pending)
+
+def _may_continue(value: Any, buffer: str, end: int) -> bool:
+    #Only numbers have no closing delimiter; one can continue if nothing but number characters follow it
+    if type(value) not in (int, float):
+        return False
+    while end < len(buffer) and buffer[end] in _NUMBER_CHARS:
+        end += 1
+    return end == len(buffer)
+
+def _iter_array(chunks: Iterator[str], buffer: str) -> Iterator[Any]:
+    #Decodes one value at a time with raw_decode. Positions are tracked instead of slicing the buffer;
+    #the buffer is only rebuilt when a value runs past its end and more input is read.
+    decoder = json.JSONDecoder()
+    position = buffer.index("[") + 1
+    exhausted = False
+    state = "first" #first: a value or ']'; value: a value; separator: ',' or ']'
+    while True:
+        while position < len(buffer) and buffer[position] in _JSON_WHITESPACE:
+            position += 1
+        if position == len(buffer):
+            more = next(chunks, None)
+            if more is None:
+                raise ValueError("JSON array is not closed")
+            buffer, position = more, 0
+            continue
+        char = buffer[position]
+        if char == "]" and state != "value":
+            return
+        if state == "separator":
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' in JSON array, found {char!r}")
+            position += 1
+            state = "value"
+            continue
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+            #A number cut off by the end of the buffer (e.g. "1" of "1.5") may continue in the next chunk
+            complete = exhausted or not _may_continue(value, buffer, end)
+        except json.JSONDecodeError:
+            if exhausted:
+                raise ValueError("JSON array is malformed")
+            complete = False
+        if not complete:
+            more = next(chunks, None)
+            if more is None:
+                exhausted = True
+            else:
+                buffer, position = buffer[position:] + more, 0
+            continue
+        yield value
+        position = end
+        state = "separator"
+
+def iter_json_records(stream: IO) -> Iterator[Any]:
+    '''
+    Yields the records of a stream holding either a JSON array of records or one JSON record per line
+    (NDJSON). The format is chosen by the first non-whitespace character.
+
+    Args:
+        stream (IO): a binary or text file-like object
+
+    Returns:
+        records (Iterator[Any]): the parsed records; an unparsable NDJSON line is yielded as a MalformedRecord
+
+    Exceptions:
+        ValueError: a JSON array is malformed (an array cannot be resynchronized after an error); it is
+        raised when the bad part is reached, after the records before it were yielded
+    '''
+    chunks = _read_text(stream)
+    buffer = ""
+    while not buffer.strip():
+        more = next(chunks, None)
+        if more is None:
+            return
+        buffer += more
+    if buffer.lstrip().startswith("["):
+        yield from _iter_array(chunks, buffer)
+    else:
+        yield from _iter_lines(chunks, buffer)
+
+def import_records(dao: DatabaseAccessObject, entity_class: type, records: Iterable[Any],
+                   batch_size: int = DEFAULT_BATCH_SIZE, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   overrides: Optional[dict[str, Any]] = None) -> ResponseCode:
+    '''
+    Validates records in batches of batch_size and writes the valid ones with dao.create_records
+
+    Args:
+        dao (DatabaseAccessObject): a DAO with credentials that allow create
+        entity_class (type): Joke, Trivia, Quote or Bio
+        records (Iterable[Any]): the records, for example from iter_json_records
+        batch_size (int optional): the number of records validated at a time
+        chunk_size (int optional): the most documents sent in one insert_many
+        overrides (dict optional): fields set on every record before validation (for example is_edit)
+
+    Returns:
+        ResponseCode (ResponseCode): PostSuccess if every record was written, BulkPartialSuccess if some
+        were and BulkWriteError if none were, with data {"received", "inserted", "invalid", "failed",
+        "errors"}. errors lists every record that was not written as {"index", "status", ...}. If a JSON
+        array turns out to be malformed, the records before the error are still written and the error is
+        listed at the index that follows them; MalformedContent is returned if nothing was written.
+        A DAO error that is not about individual records (for example permissions) is returned as is.
+    '''
+    logger = LoggerFactory.get_general_logger()
+    if batch_size <= 0 or chunk_size <= 0:
+        return ResponseCode("InvalidFilter", "batch_size and chunk_size must be positive integers.")
+    validator = get_batch_validator(entity_class)
+    summary = {"received": 0, "inserted": 0, "invalid": 0, "failed": 0, "errors": []}
+    iterator = iter(records)
+    parse_error = None
+    while parse_error is None:
+        #A malformed JSON array raises part way through; the records before it are still written
+        batch = []
+        try:
+            batch.extend(islice(iterator, batch_size))
+        except ValueError as e:
+            parse_error = str(e)
+        if not batch:
+            break
+        offset = summary["received"]
+        summary["received"] += len(batch)
+        rows = []
+        for position, record in enumerate(batch):
+            if isinstance(record, MalformedRecord):
+                summary["errors"].append({"index": offset + position, "status": "invalid", "errors": [record.message]})
+                summary["invalid"] += 1
+                record = None
+            elif overrides and isinstance(record, dict):
+                record = {**record, **overrides}
+            rows.append(record)
+        #Malformed lines were already reported; keep them out of the validator's report
+        malformed = {position for position, record in enumerate(batch) if isinstance(record, MalformedRecord)}
+        result = validator.validate(rows)
+        for position, messages in result.errors.items():
+            if position not in malformed:
+                summary["errors"].append({"index": offset + position, "status": "invalid", "errors": messages})
+                summary["invalid"] += 1
+        if not result.documents:
+            continue
+        response = dao.create_records(result.documents, chunk_size)
+        data = response.get_data()
+        if not isinstance(data, dict) or "results" not in data:
+            return response
+        for item in data["results"]:
+            if item["status"] == "inserted":
+                summary["inserted"] += 1
+            else:
+                summary["failed"] += 1
+                summary["errors"].append(dict(item, index=offset + result.indexes[item["index"]]))
+    if parse_error is not None:
+        #Everything from the first unreadable record on is reported as one entry
+        summary["errors"].append({"index": summary["received"], "status": "invalid", "errors": [parse_error]})
+        summary["invalid"] += 1
+    summary["errors"].sort(key=lambda item: item["index"])
+    logger.info("Bulk import of %d records: %d inserted, %d invalid, %d failed.",
+                summary["received"], summary["inserted"], summary["invalid"], summary["failed"])
+    if parse_error is not None and not summary["inserted"]:
+        return ResponseCode("MalformedContent", summary)
+    if not summary["errors"]:
+        return ResponseCode("PostSuccess", summary)
+    return ResponseCode("BulkPartialSuccess" if summary["inserted"] else "BulkWriteError", summary)
+
+def main(argv: list[str] = None) -> int:
+    '''
+    Command line entry point. Loads a JSON array or NDJSON file into the public (or, with --pending,
+    the private) collection of a record type and prints the summary.
+
+    Returns:
+        exit_code (int): 0 if every record was written, 1 otherwise
+    '''
+    parser = argparse.ArgumentParser(description="Load records from a JSON array or NDJSON file")
+    parser.add_argument("record_type", choices=sorted(RECORD_TYPES), help="the type of record in the file")
+    parser.add_argument("file", help="path to a .json (array) or .ndjson file; - reads standard input")
+    parser.add_argument("--database", default="team_white_database", help="database name")
+    parser.add_argument("--pending", action="store_true", help="load into the pending (private) collection")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="records validated at a time")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="documents per insert_many")
+    args = parser.parse_args(argv)
+
+    load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+    uri = os.getenv("ATLAS_URI")
+    if not uri:
+        print("ATLAS_URI environment variable not set. Check your .env file.")
+        return 1
+
+    from all_the_buzz.database_operations.dao_factory import _DAO_REGISTRY
+    entity_class, public_dao_name, private_dao_name = RECORD_TYPES[args.record_type]
+    client = MongoClient(uri, server_api=ServerApi("1"))
+    try:
+        dao = _DAO_REGISTRY[private_dao_name if args.pending else public_dao_name](client, args.database)
+        #The loader acts as a manager so it may write to either collection
+        dao.set_credentials(Credentials(id=0, fName="Bulk", lName="Loader", dept="Operations",
+                                        title="Manager", loc="Local"))
+        overrides = {"is_edit": False} if args.pending else None
+        stream = os.fdopen(os.dup(0), "rb") if args.file == "-" else open(args.file, "rb")
+        with stream:
+            response = import_records(dao, entity_class, iter_json_records(stream),
+                                      args.batch_size, args.chunk_size, overrides)
+    finally:
+        client.close()
+
+    data = response.get_data()
+    if isinstance(data, dict) and "received" in data:
+        print(f"{data['received']} received, {data['inserted']} inserted, {data['invalid']} invalid, {data['failed']} failed")
+        for item in data["errors"]:
+            print(json.dumps(item))
+    else:
+        print(f"{response.get_error_tag()}: {response.get_message()}")
+    return 0 if response.get_success() and not (isinstance(data, dict) and data.get("errors")) else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
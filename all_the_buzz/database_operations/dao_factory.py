@@ -21,6 +21,7 @@ Functions:
     -create_dao <classmethod>: creates a DAO for the specified type and returns it; it will raise an
     error if one exists 
     -get_dao <classmethod>: returns the DAO of a given type if it exists
+    -get_client <classmethod>: returns the shared MongoClient
     -reset <classmethod>: if (for whatever unknown reason???) you need to reset the DAOs, you can clarify
     which one or reset all
 '''
@@ -84,6 +85,15 @@ class DAOFactory:
         except PyMongoError as e:
             raise e
 
+    @classmethod
+    def get_client(cls) -> MongoClient:
+        '''
+        Returns the shared client set by set_client(); raises an error if it has not been set
+        '''
+        if(cls._client is None):
+            raise RuntimeError("Client not found. Please set client using set_client().")
+        return cls._client
+
     @classmethod
     def create_dao(cls, dao_class_name: str, database_name: str) -> DatabaseAccessObject:
         '''
@@ -0,0 +1,144 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import argparse
+import os
+from pathlib import Path
+from typing import Any
+from dotenv import load_dotenv
+from pymongo import IndexModel, MongoClient
+from pymongo.database import Database
+from pymongo.errors import PyMongoError
+from pymongo.server_api import ServerApi
+from all_the_buzz.db_schemas.index_specs import INDEX_SPECS, FILTERABLE_FIELDS
+from all_the_buzz.utilities.logger import LoggerFactory
+
+'''
+index_manager.py
+
+This module creates the indexes declared in db_schemas/index_specs.py. Creating an index that already
+exists with the same name and options does nothing, so ensure_indexes can run on every startup.
+
+Functions:
+    -ensure_indexes: creates every declared index on the given database and reports what happened
+    -indexed_filter_fields: lists the fields a filter on one collection can be served from an index by
+    -uncovered_filters: lists the API filter fields that no declared index can serve
+    -main: command line entry point (python -m all_the_buzz.database_operations.index_manager)
+'''
+
+def _index_model(spec: dict[str, Any]) -> IndexModel:
+    options = {key: value for key, value in spec.items() if key != "keys"}
+    return IndexModel(spec["keys"], **options)
+
+def ensure_indexes(database: Database, specs: dict[str, list[dict[str, Any]]] = None) -> dict[str, dict[str, list[str]]]:
+    '''
+    Creates every declared index. Each index is created on its own so that one conflicting index
+    (for example an existing index with the same name but different options) does not stop the rest.
+    
+    Args:
+        database (Database): the database holding the collections
+        specs (dict optional): index specs keyed by collection name; defaults to INDEX_SPECS
+
+    Returns:
+        report (dict[str, dict[str, list[str]]]): per collection, the names of the indexes that are in place
+        ("ensured") and those that could not be created ("failed")
+    '''
+    logger = LoggerFactory.get_general_logger()
+    specs = INDEX_SPECS if specs is None else specs
+    report = {}
+    for collection_name, collection_specs in specs.items():
+        collection = database[collection_name]
+        ensured, failed = [], []
+        for spec in collection_specs:
+            try:
+                collection.create_indexes([_index_model(spec)])
+                ensured.append(spec["name"])
+            except PyMongoError as e:
+                logger.error(f"Could not create index {spec['name']} on {collection_name}: {e}")
+                failed.append(spec["name"])
+        logger.info(f"Indexes on {collection_name}: {len(ensured)} ensured, {len(failed)} failed.")
+        report[collection_name] = {"ensured": ensured, "failed": failed}
+    return report
+
+def indexed_filter_fields(collection_name: str, specs: dict[str, list[dict[str, Any]]] = None) -> frozenset[str]:
+    '''
+    Lists the fields of a collection that an equality filter can be served from an index by: the first
+    key of every index without a partial filter (a partial index only serves queries that also match its
+    filter), plus _id.
+
+    Args:
+        collection_name (str): the name of the collection
+        specs (dict optional): index specs keyed by collection name; defaults to INDEX_SPECS
+
+    Returns:
+        fields (frozenset[str]): the indexed filter fields of the collection
+    '''
+    specs = INDEX_SPECS if specs is None else specs
+    prefixes = {spec["keys"][0][0] for spec in specs.get(collection_name, [])
+                if "partialFilterExpression" not in spec}
+    return frozenset(prefixes | {"_id"})
+
+def uncovered_filters(specs: dict[str, list[dict[str, Any]]] = None,
+                      filterable_fields: dict[str, list[str]] = None) -> dict[str, list[str]]:
+    '''
+    Lists the filter fields the API accepts that no index can serve. A field counts as covered when it
+    is the first key of an index without a partial filter (a partial index only serves queries that
+    also match its filter).
+    
+    Args:
+        specs (dict optional): index specs keyed by collection name; defaults to INDEX_SPECS
+        filterable_fields (dict optional): filter fields keyed by collection name; defaults to FILTERABLE_FIELDS
+
+    Returns:
+        uncovered (dict[str, list[str]]): the uncovered fields of every collection that has any
+    '''
+    filterable_fields = FILTERABLE_FIELDS if filterable_fields is None else filterable_fields
+    uncovered = {}
+    for collection_name, fields in filterable_fields.items():
+        prefixes = indexed_filter_fields(collection_name, specs)
+        missing = [field for field in fields if field not in prefixes]
+        if missing:
+            uncovered[collection_name] = missing
+    return uncovered
+
+def main(argv: list[str] = None) -> int:
+    '''
+    Command line entry point. Ensures every declared index (unless --report-only is given) and prints
+    the uncovered filter report.
+
+    Returns:
+        exit_code (int): 0 on success, 1 if any index could not be created or a filter is uncovered
+    '''
+    parser = argparse.ArgumentParser(description="Create the MongoDB indexes declared in db_schemas/index_specs.py")
+    parser.add_argument("--database", default="team_white_database", help="database name")
+    parser.add_argument("--report-only", action="store_true", help="only print the uncovered filter report")
+    args = parser.parse_args(argv)
+
+    exit_code = 0
+    if not args.report_only:
+        load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+        uri = os.getenv("ATLAS_URI")
+        if not uri:
+            print("ATLAS_URI environment variable not set. Check your .env file.")
+            return 1
+        client = MongoClient(uri, server_api=ServerApi("1"))
+        try:
+            for collection_name, result in ensure_indexes(client[args.database]).items():
+                print(f"{collection_name}: ensured {', '.join(result['ensured']) or '-'}"
+                      + (f"; FAILED {', '.join(result['failed'])}" if result["failed"] else ""))
+                if result["failed"]:
+                    exit_code = 1
+        finally:
+            client.close()
+
+    uncovered = uncovered_filters()
+    for collection_name, fields in uncovered.items():
+        print(f"{collection_name}: no index for filter(s) {', '.join(fields)}")
+        exit_code = 1
+    if not uncovered:
+        print("Every API filter is covered by an index.")
+    return exit_code
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -13,6 +13,9 @@ class PublicJokeDAO(DatabaseAccessObject):
         "delete": ["Manager"]
     }
 
+    PROJECTABLE_FIELDS = frozenset({"level", "content", "explanation", "language"})
+    CACHE_READS = True
+
     def __init__(self, client: MongoClient, database_name: str):
         '''
         Args:
@@ -29,6 +32,8 @@ class PrivateJokeDAO(DatabaseAccessObject):
         "delete": ["Manager"]
     }
 
+    PROJECTABLE_FIELDS = frozenset({"level", "content", "explanation", "language", "is_edit", "original_id"})
+
     def __init__(self, client: MongoClient, database_name: str):
         '''
         Args:
@@ -4,9 +4,12 @@
 
 from all_the_buzz.database_operations.abstract_record import DatabaseAccessObject, mongo_safe
 from all_the_buzz.utilities.error_handler import ResponseCode
-from typing import Any
+from all_the_buzz.utilities.logger import LoggerFactory
+from all_the_buzz.database_operations.read_cache import seconds_until_midnight
+from typing import Any, Optional
 from datetime import date
-from pymongo import MongoClient
+import threading
+from pymongo import MongoClient, ReturnDocument
 
 class PublicQuoteDAO(DatabaseAccessObject):
     ROLE_MATRIX = {
@@ -16,6 +19,9 @@ class PublicQuoteDAO(DatabaseAccessObject):
         "delete": ["Manager"]
     }
 
+    PROJECTABLE_FIELDS = frozenset({"content", "author", "category", "language", "used_date"})
+    CACHE_READS = True
+
     def __init__(self, client: MongoClient, database_name: str):
         '''
         Args:
@@ -23,6 +29,9 @@ class PublicQuoteDAO(DatabaseAccessObject):
             database_name (str): the name of the actual database that all of the collections are held in
         '''
         super().__init__("quotes_public", client, database_name)
+        self.__logger = LoggerFactory.get_general_logger()
+        #Only one thread per process picks today's quote; the rest wait and read it from the read cache
+        self._daily_quote_lock = threading.Lock()
 
     #used_date should default to none when added!
     def _prepare_entry(self, entry: dict[str, Any]) -> dict[str, Any]:
@@ -38,44 +47,83 @@ class PublicQuoteDAO(DatabaseAccessObject):
             ResponseCode (ResponseCode): After being wrapped, it will return a ResponseCode with the 
             UpdateResult object
         '''
-        self.__logger.debug(f"Reseting all quotes...")
+        self.__logger.debug("Reseting all quotes...")
         result = self._collection.update_many({}, {"$set": {"used_date": ""}})
+        self._invalidate_reads()
         return result
     
+    @staticmethod
+    def _daily_rank(today: date, num_unused_quotes: int) -> int:
+        #Knuth multiplication method; reduced to 32 bit hash-space; spreads out values well
+        #Unique value for each day...
+        seed = 10000*today.year + 100*today.month + today.day
+        hashed = (seed * 2654435761) % 2**32
+        return hashed % num_unused_quotes
+
+    def _claim_quote_of_day(self, today: date, today_string: str) -> Optional[dict[str, Any]]:
+        '''
+        Picks today's quote among the unused ones and marks it as used. The rank is applied server-side
+        with skip/limit on the (used_date, _id) index so only one _id is transferred, and the quote is
+        claimed with a conditional find_one_and_update so that two workers cannot both mark a quote.
+
+        Returns:
+            record (dict[str, Any] | None): the claimed quote, or None if no quote is left to claim
+        '''
+        for _ in range(3):
+            num_unused_quotes = self._collection.count_documents({"used_date": ""})
+            if num_unused_quotes == 0:
+                return None
+            rank = self._daily_rank(today, num_unused_quotes)
+            candidate = next(iter(self._collection.find({"used_date": ""}, {"_id": 1})
+                                  .sort("_id", 1).skip(rank).limit(1)), None)
+            if candidate is not None:
+                record = self._collection.find_one_and_update(
+                    {"_id": candidate["_id"], "used_date": ""},
+                    {"$set": {"used_date": today_string}},
+                    return_document=ReturnDocument.AFTER)
+                if record is not None:
+                    #used_date changed, so cached listings are stale
+                    self._invalidate_reads()
+                    return record
+            #Another worker claimed a quote first; use theirs if it was for today
+            existing_record = self._collection.find_one({"used_date": today_string}, sort=[("_id", 1)])
+            if existing_record is not None:
+                return existing_record
+        return None
+
     @DatabaseAccessObject.rbac_action("read")
     @mongo_safe
     def get_quote_of_day(self) -> ResponseCode:
         '''
         Gets the quote of the day using today's date. After that date is used, it is marked. On New Year's
-        all of the quotes are unmarked back to being "unused"
+        all of the quotes are unmarked back to being "unused". The result is kept in the read cache,
+        keyed by date, until midnight, so the database is only asked once a day per process.
  
         Returns:
             ResponseCode (ResponseCode): After being wrapped, it will return a ResponseCode with the
             JSON document
         '''
-        #Check to see if there are any unused quotes
-        num_unused_quotes = self._collection.count_documents({"used_date": ""})
         today = date.today()
         today_string = today.strftime("%m/%d/%Y")
-        existing_record = self._collection.find_one({"used_date": today_string})
-        #if there is a quote being used for today, just return that one
-        if(existing_record is not None):
-            return existing_record
-        #If it is a new year OR all of the quotes have been used, reset and get total number of quotes
-        if((today.month == 1 and today.day == 1) or (num_unused_quotes == 0)):
-            self._reset_quotes()
-            num_unused_quotes = self._collection.count_documents({"used_date": ""})
-        #Knuth multiplication method; reduced to 32 bit hash-space; spreads out values well
-        #Unique value for each day...
-        seed = 10000*today.year + 100*today.month + today.day
-        hashed = (seed * 2654435761) % 2**32
-        unused_list = list(self._collection.find({"used_date": ""}))
-        if num_unused_quotes == 0 or not unused_list:
-            return ResponseCode("ResourceNotFound", "No unused quotes found in the database and reset failed.", data=[])
-        #Obtain a record using a hashed value so that it is unified across users and not random per session
-        record = unused_list[hashed % num_unused_quotes]
-        self.update_record(record["_id"], {"used_date": today_string})
-        return record
+        cache_key = ("quote_of_day", today_string)
+        with self._daily_quote_lock:
+            if self._read_cache is not None:
+                cached = self._read_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+            #if there is a quote being used for today, just return that one
+            record = self._collection.find_one({"used_date": today_string}, sort=[("_id", 1)])
+            if record is None:
+                #If it is a new year OR all of the quotes have been used, reset before picking
+                if (today.month == 1 and today.day == 1) or self._collection.count_documents({"used_date": ""}, limit=1) == 0:
+                    self._reset_quotes()
+                #Obtain a record using a hashed value so that it is unified across users and not random per session
+                record = self._claim_quote_of_day(today, today_string)
+            if record is None:
+                return ResponseCode("ResourceNotFound", "No unused quotes found in the database and reset failed.")
+            if self._read_cache is not None:
+                self._read_cache.set(cache_key, record, ttl_seconds=seconds_until_midnight())
+            return record
     
 class PrivateQuoteDAO(DatabaseAccessObject):
     ROLE_MATRIX = {
@@ -85,6 +133,8 @@ class PrivateQuoteDAO(DatabaseAccessObject):
         "delete": ["Manager"]
     }
 
+    PROJECTABLE_FIELDS = frozenset({"content", "author", "category", "language", "used_date", "is_edit", "original_id"})
+
     def __init__(self, client: MongoClient, database_name: str):
         '''
         Args:
@@ -0,0 +1,149 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional
+from all_the_buzz.utilities.error_handler import ResponseCode
+from all_the_buzz.utilities.ttl_cache import TTLCache
+
+'''
+read_cache.py
+
+This module contains the read-through cache used by DAOs whose reads are idempotent (the public
+collections). Results are kept in memory until their time-to-live runs out or a write to the same
+collection invalidates them.
+
+Classes:
+    ReadCache: size-bounded, TTL-bound cache of read results with whole-cache invalidation
+
+Functions:
+    make_key: builds a cache key from a method name and its (normalized) arguments
+    cached_read: decorator that serves a DAO read method through the DAO's read cache
+    seconds_until_midnight: seconds left in the current local day
+'''
+
+_MISS = object()
+
+def make_key(name: str, *args, **kwargs) -> str:
+    '''
+    Builds a cache key from a method name and its arguments. Filter dictionaries are normalized by
+    sorting their keys so that the same filter always maps to the same key.
+
+    Returns:
+        key (str): a string that identifies the read
+    '''
+    return json.dumps([name, args, kwargs], sort_keys=True, default=str)
+
+def seconds_until_midnight(now: Optional[datetime] = None) -> float:
+    '''
+    Returns:
+        seconds (float): the number of seconds until the local date changes
+    '''
+    now = now or datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return max((midnight - now).total_seconds(), 0.001)
+
+class ReadCache:
+    '''
+    Read-through cache for DAO reads. Every write to the collection calls invalidate_all(); a
+    generation counter makes sure a read that started before the write cannot store its (stale)
+    result after the invalidation. Cached values are shared between callers and must not be mutated.
+    '''
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        '''
+        Args:
+            max_size (int optional): the maximum number of cached reads before the LRU one is evicted
+            ttl_seconds (float optional): how long a cached read stays valid without a write
+            clock (Callable optional): monotonic time source; only overridden in tests
+        '''
+        self.__cache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds, clock=clock)
+        self.__lock = threading.Lock()
+        self.__generation = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self.__cache.get(key, default)
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None,
+            generation: Optional[int] = None) -> None:
+        '''
+        Stores value under key unless the cache was invalidated since generation was read
+
+        Args:
+            key (Hashable): the cache key
+            value (Any): the read result
+            ttl_seconds (float optional): overrides the default time-to-live for this entry
+            generation (int optional): the value of generation() before the read started
+        '''
+        with self.__lock:
+            if generation is not None and generation != self.__generation:
+                return
+            self.__cache.set(key, value, ttl_seconds=ttl_seconds)
+
+    def generation(self) -> int:
+        with self.__lock:
+            return self.__generation
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl_seconds: Optional[float] = None) -> Any:
+        '''
+        Returns the cached result for key or calls loader and caches what it returns. ResponseCode
+        results (errors) are never cached.
+
+        Args:
+            key (Hashable): the cache key
+            loader (Callable): performs the read on a miss
+            ttl_seconds (float optional): overrides the default time-to-live for this entry
+
+        Returns:
+            result (Any): the cached or freshly loaded result
+        '''
+        cached = self.__cache.get(key, _MISS)
+        if cached is not _MISS:
+            return cached
+        generation = self.generation()
+        result = loader()
+        if not isinstance(result, ResponseCode):
+            self.set(key, result, ttl_seconds=ttl_seconds, generation=generation)
+        return result
+
+    def invalidate_all(self) -> None:
+        '''
+        Drops every cached read; called after any write to the collection
+        '''
+        with self.__lock:
+            self.__generation += 1
+            self.__cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        '''
+        Returns:
+            stats (dict[str, int]): the counters of the underlying TTLCache plus the invalidation generation
+        '''
+        stats = self.__cache.stats()
+        stats["generation"] = self.generation()
+        return stats
+
+def cached_read(func: Callable) -> Callable:
+    '''
+    Wraps a DAO read method so that it is served from the DAO's read cache (self._read_cache) when
+    the DAO has one. Apply it below rbac_action so permissions are still checked on every call.
+
+    Args:
+        func (Callable): the read method to wrap
+
+    Returns:
+        wrapper (function): the read method served through the cache
+    '''
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = getattr(self, "_read_cache", None)
+        if cache is None:
+            return func(self, *args, **kwargs)
+        key = make_key(func.__name__, *args, **kwargs)
+        return cache.get_or_load(key, lambda: func(self, *args, **kwargs))
+    return wrapper
@@ -12,6 +12,9 @@ class PublicTriviaDAO(DatabaseAccessObject):
         "delete": ["Manager"]
     }
 
+    PROJECTABLE_FIELDS = frozenset({"question", "answer", "language"})
+    CACHE_READS = True
+
     def __init__(self, client: MongoClient, database_name: str):
         '''
         Args:
@@ -28,6 +31,8 @@ class PrivateTriviaDAO(DatabaseAccessObject):
         "delete": ["Manager"]
     }
 
+    PROJECTABLE_FIELDS = frozenset({"question", "answer", "language", "is_edit", "original_id"})
+
     def __init__(self, client: MongoClient, database_name: str):
         '''
         Args:
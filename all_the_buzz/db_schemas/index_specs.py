@@ -0,0 +1,68 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+'''
+index_specs.py
+
+Declarative index definitions for every collection described by the *_schema.py files in this folder.
+Unlike the schema files, this module has no side effects on import; it is read by
+database_operations/index_manager.py, which creates the indexes at startup or from the command line.
+
+Each index is a dictionary with:
+    "name": a stable index name (so re-running is idempotent)
+    "keys": a list of (field, direction) pairs; more than one pair makes a compound index
+    any other key (e.g. "partialFilterExpression", "unique", "sparse") is passed to Mongo as an index option
+
+FILTERABLE_FIELDS lists the query-string filters each collection is expected to serve from an index;
+the index manager reports any of them that no (non-partial) index can serve. The API accepts a filter on
+any field, so the DAOs also log every other filter field that no index covers the first time it is used.
+'''
+
+INDEX_SPECS = {
+    "jokes_public": [
+        {"name": "level_language", "keys": [("level", 1), ("language", 1)]},
+        {"name": "language", "keys": [("language", 1)]},
+    ],
+    "jokes_private": [
+        {"name": "is_edit", "keys": [("is_edit", 1)]},
+    ],
+    "quotes_public": [
+        {"name": "category_language", "keys": [("category", 1), ("language", 1)]},
+        {"name": "language", "keys": [("language", 1)]},
+        #Quote of the day: counting and picking unused quotes only touches the unused ones
+        {"name": "unused_quotes", "keys": [("used_date", 1), ("_id", 1)],
+         "partialFilterExpression": {"used_date": ""}},
+        #Quote of the day: finding the quote already used today
+        {"name": "used_quotes_by_date", "keys": [("used_date", 1)],
+         "partialFilterExpression": {"used_date": {"$gt": ""}}},
+    ],
+    "quotes_private": [
+        {"name": "is_edit", "keys": [("is_edit", 1)]},
+    ],
+    "trivia_public": [
+        {"name": "language", "keys": [("language", 1)]},
+    ],
+    "trivia_private": [
+        {"name": "is_edit", "keys": [("is_edit", 1)]},
+    ],
+    "bios_public": [
+        {"name": "birth_year", "keys": [("birth_year", 1)]},
+        {"name": "death_year", "keys": [("death_year", 1)]},
+        {"name": "language", "keys": [("language", 1)]},
+    ],
+    "bios_private": [
+        {"name": "is_edit", "keys": [("is_edit", 1)]},
+    ],
+}
+
+FILTERABLE_FIELDS = {
+    "jokes_public": ["level", "language"],
+    "jokes_private": ["is_edit"],
+    "quotes_public": ["category", "language"],
+    "quotes_private": ["is_edit"],
+    "trivia_public": ["language"],
+    "trivia_private": ["is_edit"],
+    "bios_public": ["birth_year", "death_year", "language"],
+    "bios_private": ["is_edit"],
+}
@@ -1,3 +1,4 @@
 from .credentials_entity import Credentials, Token
 from .record_entities import BaseRecord, Joke, Trivia, Quote, Bio
+from .batch_validation import BatchValidationResult, get_batch_validator
 # from .record_entities import ThisHasntBeenMadeYet
\ No newline at end of file
@@ -0,0 +1,370 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any, Callable, Optional
+from bson.objectid import ObjectId
+from all_the_buzz.entities.record_entities import Joke, Trivia, Quote, Bio, _OBJECT_ID_PATTERN, _is_valid_url, normalize_used_date
+from all_the_buzz.utilities.sanitize import sanitize_many
+"""
+batch_validation.py
+
+This module validates many records at once, for bulk imports and migrations. Instead of building
+one entity per record and stopping at the first ValueError, each field is checked as a column across
+the whole batch and every problem is reported per row. The rules and messages are the same as the
+setters in record_entities.py, and valid rows come out in the same format as to_json_object.
+
+Classes:
+    BatchValidationResult: the valid documents of a batch and the errors of every invalid row
+    JokeBatchValidator: validates a batch of joke records
+    TriviaBatchValidator: validates a batch of trivia records
+    QuoteBatchValidator: validates a batch of quote records
+    BioBatchValidator: validates a batch of bio records
+
+Functions:
+    get_batch_validator: returns the batch validator for an entity class
+    """
+
+#Marks a field that is not present in a row
+_MISSING = object()
+
+class BatchValidationResult:
+    """
+    Result of validating a batch. documents holds the valid rows in
+    to_json_object format, indexes holds the position of each of them
+    in the input, and errors maps the position of every invalid row to
+    its error messages.
+    """
+    __slots__ = ("documents", "indexes", "errors")
+
+    def __init__(self):
+        self.documents = []
+        self.indexes = []
+        self.errors = {}
+
+    def error_report(self):
+        """
+        Returns:
+            a list of {"index": <row position>, "errors": [<message>, ...]} sorted by position
+            """
+        return [{"index": index, "errors": messages} for index, messages in sorted(self.errors.items())]
+
+def _record_id_error(value, type_message):
+    #Same checks as the BaseRecord id and ref_id setters
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        return type_message
+    if _OBJECT_ID_PATTERN.fullmatch(value) is None:
+        return "Invalid Record ID"
+    return None
+
+def _language_error(value):
+    if value is None:
+        return "Language can not be none"
+    if not isinstance(value, str):
+        return "Language must be a string"
+    return None
+
+def _string_error(message):
+    return lambda value: None if isinstance(value, str) else message
+
+class _BatchValidator(ABC):
+    """
+    Shared batch validation. Subclasses list their required fields and
+    add their own column checks and document layout.
+    """
+    REQUIRED_FIELDS: tuple[str, ...] = ()
+
+    def validate(self, rows: list[Any], sanitize: bool = True) -> BatchValidationResult:
+        """
+        Validates a batch of records.
+
+        Args:
+            rows: the records to validate, normally dictionaries parsed from JSON
+            sanitize: sanitize the whole batch first (only set to False for rows that are known to be clean)
+
+        Returns:
+            a BatchValidationResult with the valid documents and the errors of every invalid row
+            """
+        if sanitize:
+            rows = sanitize_many(rows)
+        errors: list[list[str]] = [[] for _ in rows]
+
+        #Structural checks; rows failing them are not checked further
+        active = []
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                errors[index].append("Must be dictionary input")
+            elif "mesg" in row:
+                errors[index].append(str(row["mesg"]))
+            elif not all(field in row for field in self.REQUIRED_FIELDS):
+                errors[index].append("Missing required fields")
+            else:
+                active.append(index)
+        active_rows = [rows[index] for index in active]
+        columns = _Columns(active, active_rows, errors)
+
+        ids = columns.get("id", None, _to_string_id)
+        columns.check(ids, lambda value: _record_id_error(value, "Record ID must be either string or None"))
+        ref_ids = columns.get("original_id", None, _to_string_id)
+        columns.check(ref_ids, lambda value: _record_id_error(value, "Reference ID must be either string or None"))
+        is_edits = columns.get("is_edit", None)
+        columns.check_rows([is_edits, ref_ids], lambda is_edit, ref_id:
+                           "Reference ID is required for edits" if is_edit == True and ref_id is None else None)
+        columns.check(columns.get("language"), _language_error)
+        self._check_columns(columns)
+
+        result = BatchValidationResult()
+        for position, index in enumerate(active):
+            if errors[index]:
+                continue
+            document = self._build_document(columns, position)
+            if ids[position] is not None:
+                document["id"] = ids[position]
+            if ref_ids[position] is not None:
+                document["original_id"] = ref_ids[position]
+            if is_edits[position] is not None:
+                document["is_edit"] = is_edits[position]
+            self._finish_document(columns, position, document)
+            result.documents.append(document)
+            result.indexes.append(index)
+        result.errors = {index: messages for index, messages in enumerate(errors) if messages}
+        return result
+
+    @abstractmethod
+    def _check_columns(self, columns: "_Columns") -> None:
+        """Adds the errors of the subclass's own fields."""
+
+    @abstractmethod
+    def _build_document(self, columns: "_Columns", position: int) -> dict[str, Any]:
+        """Returns the subclass's fields of a valid row, in to_json_object order."""
+
+    def _finish_document(self, columns: "_Columns", position: int, document: dict[str, Any]) -> None:
+        #Fields that to_json_object adds after id, original_id and is_edit
+        pass
+
+def _to_string_id(value):
+    return str(value) if isinstance(value, ObjectId) else value
+
+class _Columns:
+    """
+    Column access for the rows that passed the structural checks. Each
+    column is extracted once and kept, so checks and document building
+    share it.
+    """
+    def __init__(self, active: list[int], rows: list[dict[str, Any]], errors: list[list[str]]):
+        self.__active = active
+        self.__rows = rows
+        self.__errors = errors
+        self.__columns: dict[str, list[Any]] = {}
+
+    def get(self, field: str, default: Any = _MISSING, convert: Optional[Callable[[Any], Any]] = None) -> list[Any]:
+        if field not in self.__columns:
+            column = [row.get(field, default) for row in self.__rows]
+            if convert is not None:
+                column = [convert(value) for value in column]
+            self.__columns[field] = column
+        return self.__columns[field]
+
+    def check(self, column: list[Any], check: Callable[[Any], Optional[str]]) -> None:
+        errors = self.__errors
+        for index, value in zip(self.__active, column):
+            message = check(value)
+            if message is not None:
+                errors[index].append(message)
+
+    def check_rows(self, columns: list[list[Any]], check: Callable[..., Optional[str]]) -> None:
+        errors = self.__errors
+        for index, values in zip(self.__active, zip(*columns)):
+            message = check(*values)
+            if message is not None:
+                errors[index].append(message)
+
+def _difficulty_error(level):
+    if level is None:
+        return "Difficulty level is required"
+    if not isinstance(level, int):
+        return "Difficulty must be an integer"
+    if level not in (1, 2, 3):
+        return "Difficulty must be either 1, 2, or 3"
+    return None
+
+def _joke_content_error(content):
+    if not isinstance(content, dict):
+        return "Content must be a dictionary"
+    if "type" not in content:
+        return "Joke content missing required fields"
+    if content["type"] not in ("one_liner", "qa"):
+        return "Not a valid type"
+    if content["type"] == "one_liner":
+        if "text" not in content:
+            return "Missing text field for one liner joke"
+        if content["text"] is None:
+            return "One liner joke text field cannot be none"
+        if not isinstance(content["text"], str):
+            return "One liner joke text must be a string"
+        return None
+    if not all(key in content for key in ("question", "answer")):
+        return "Missing required fields"
+    if not isinstance(content["question"], str):
+        return "Question for joke must be a string"
+    if len(content["question"].strip()) == 0:
+        return "Joke must have a question"
+    if not isinstance(content["answer"], str):
+        return "Answer for joke must be a string"
+    if len(content["answer"].strip()) == 0:
+        return "Joke must have an answer"
+    return None
+
+def _explanation_error(explanation, level):
+    if not isinstance(explanation, str) and explanation is not None:
+        return "Not the proper explanation type"
+    if level == 3 and (explanation is None or len(explanation.strip()) == 0):
+        return "Jokes must have an explanation when difficulty is 3"
+    return None
+
+class JokeBatchValidator(_BatchValidator):
+    """
+    Batch version of Joke.from_json_object.
+    """
+    REQUIRED_FIELDS = ("level", "content", "language")
+
+    def _check_columns(self, columns):
+        levels = columns.get("level")
+        columns.check(levels, _difficulty_error)
+        columns.check(columns.get("content"), _joke_content_error)
+        columns.check_rows([columns.get("explanation", ""), levels], _explanation_error)
+
+    def _build_document(self, columns, position):
+        return {"level": columns.get("level")[position], "content": columns.get("content")[position],
+                "explanation": columns.get("explanation", "")[position], "language": columns.get("language")[position]}
+
+def _bounded_text_error(type_message, blank_message, long_message):
+    def check(value):
+        if not isinstance(value, str):
+            return type_message
+        if blank_message is not None and len(value.strip()) == 0:
+            return blank_message
+        if len(value) > 1000:
+            return long_message
+        return None
+    return check
+
+class TriviaBatchValidator(_BatchValidator):
+    """
+    Batch version of Trivia.from_json_object.
+    """
+    REQUIRED_FIELDS = ("question", "answer", "language")
+
+    def _check_columns(self, columns):
+        columns.check(columns.get("question"), _bounded_text_error(
+            "Trivia question must be a string", "Trivia question cannot be blank", "Trivia question too long"))
+        columns.check(columns.get("answer"), _bounded_text_error(
+            "Trivia answer must be a string", None, "Trivia answer too long"))
+
+    def _build_document(self, columns, position):
+        return {"question": columns.get("question")[position], "answer": columns.get("answer")[position],
+                "language": columns.get("language")[position]}
+
+def _used_date_error(used_date):
+    #"" is how the quote collections store a quote that has not been used yet
+    if used_date is _MISSING or used_date == "":
+        return None
+    if not isinstance(used_date, str):
+        return "Used Status variable must be a string"
+    if normalize_used_date(used_date) is None:
+        return "Used Status must be a valid date string in a recognized format"
+    return None
+
+class QuoteBatchValidator(_BatchValidator):
+    """
+    Batch version of Quote.from_json_object. Like the entity, a missing
+    category defaults to "category" and used_date is checked and
+    normalized to mm/dd/yyyy; an empty used_date (not used yet) is kept.
+    """
+    REQUIRED_FIELDS = ("content", "author", "language")
+
+    def _check_columns(self, columns):
+        columns.check(columns.get("content"), _bounded_text_error(
+            "Quote content must be a string", "Quote content cannot be empty", "Quote content is too many characters"))
+        columns.check(columns.get("author"), _string_error("Author must be a string"))
+        columns.check(columns.get("category", "category"), _string_error("Category must be a string"))
+        columns.check(columns.get("used_date"), _used_date_error)
+
+    def _build_document(self, columns, position):
+        return {"content": columns.get("content")[position], "author": columns.get("author")[position],
+                "language": columns.get("language")[position]}
+
+    def _finish_document(self, columns, position, document):
+        document["category"] = columns.get("category", "category")[position].lower()
+        used_date = columns.get("used_date")[position]
+        if used_date is not _MISSING:
+            document["used_date"] = used_date and normalize_used_date(used_date)
+
+def _year_error(this_year):
+    def check(year):
+        if not isinstance(year, int) and year is not None:
+            return None #Reported by the type check
+        if isinstance(year, int) and year > this_year:
+            return "Invalid year"
+        return None
+    return check
+
+def _source_url_error(source_url):
+    if source_url is None:
+        return "Source URL cannot be none"
+    if not isinstance(source_url, str):
+        return "Source URL must be a string"
+    if not _is_valid_url(source_url):
+        return "Invalid url"
+    return None
+
+class BioBatchValidator(_BatchValidator):
+    """
+    Batch version of Bio.from_json_object. Like the entity, missing
+    birth_year, death_year and summary default to 1900, 2020 and "summary".
+    """
+    REQUIRED_FIELDS = ("name", "paragraph", "language", "source_url")
+
+    def _check_columns(self, columns):
+        this_year = date.today().year
+        columns.check(columns.get("name"), _string_error("Author of bio's name must be a string"))
+        columns.check(columns.get("paragraph"), _string_error("Bio paragraph must be a string"))
+        columns.check(columns.get("source_url"), _source_url_error)
+        for field, label in (("birth_year", "Birth year"), ("death_year", "Death year")):
+            column = columns.get(field, 1900 if field == "birth_year" else 2020)
+            columns.check(column, lambda year, label=label: None if isinstance(year, int) or year is None
+                          else f"{label} must be integer or None")
+            columns.check(column, _year_error(this_year))
+        columns.check(columns.get("summary", "summary"), _string_error("Bio summary must be a string"))
+
+    def _build_document(self, columns, position):
+        return {"name": columns.get("name")[position], "paragraph": columns.get("paragraph")[position],
+                "source_url": columns.get("source_url")[position], "language": columns.get("language")[position]}
+
+    def _finish_document(self, columns, position, document):
+        for field, default in (("birth_year", 1900), ("death_year", 2020), ("summary", "summary")):
+            value = columns.get(field, default)[position]
+            if value is not None:
+                document[field] = value
+
+_BATCH_VALIDATORS = {Joke: JokeBatchValidator, Trivia: TriviaBatchValidator,
+                     Quote: QuoteBatchValidator, Bio: BioBatchValidator}
+
+def get_batch_validator(entity_class: type) -> _BatchValidator:
+    """
+    Returns the batch validator for an entity class.
+
+    Args:
+        entity_class: Joke, Trivia, Quote or Bio
+
+    Returns:
+        a new batch validator for that record type
+
+    Exceptions:
+        KeyError: there is no batch validator for entity_class
+        """
+    return _BATCH_VALIDATORS[entity_class]()
@@ -5,7 +5,9 @@
 # house all entity classes
 from abc import ABC, abstractmethod
 from datetime import date
-from datetime import datetime
+from functools import lru_cache
+import calendar
+import re
 import validators
 from bson.objectid import ObjectId
 from all_the_buzz.utilities.sanitize import sanitize_json
@@ -21,6 +23,65 @@ Classes:
     Quotes: An entity class for storing and validating quotes
     Bios: An entity class for storing and validating bio records
     """
+#Compiled once; a MongoDB ObjectId is exactly 24 hexadecimal characters
+_HEX_PATTERN = re.compile(r"[0-9a-fA-F]+")
+_OBJECT_ID_PATTERN = re.compile(r"[0-9a-fA-F]{24}")
+
+@lru_cache(maxsize=1024)
+def _is_valid_url(url):
+    """
+    Cached wrapper around validators.url; the same source URLs are checked
+    again every time a record is read, approved or edited.
+    """
+    return bool(validators.url(url))
+
+#used_date formats in the order they used to be tried with datetime.strptime. Fields are matched with
+#the same patterns strptime uses (%d also accepts a space-padded day, \d accepts any Unicode digit).
+_DAY = r"3[01]|[12]\d|0[1-9]|[1-9]| [1-9]"
+_MONTH = r"1[0-2]|0[1-9]|[1-9]"
+_USED_DATE_PATTERN = re.compile(r"(\d{1,4}| [1-9])([-/])(\d{1,4}| [1-9])\2(\d{1,4}| [1-9])")
+_FIELD_PATTERNS = {"d": re.compile(_DAY), "m": re.compile(_MONTH), "Y": re.compile(r"\d{4}"), "y": re.compile(r"\d{2}")}
+_USED_DATE_ORDERS = {
+    "-": ("Ymd", "mdY", "dmY", "mdy", "dmy"),
+    "/": ("mdY", "dmY", "mdy", "dmy"),
+}
+
+@lru_cache(maxsize=4096)
+def normalize_used_date(used_date):
+    """
+    Converts a date string in any of the accepted used_date formats to mm/dd/yyyy.
+    The separator and fields are found with one compiled pattern and the formats
+    are checked in the same order as before: %Y-%m-%d, %m-%d-%Y, %m/%d/%Y,
+    %d-%m-%Y, %d/%m/%Y, %m-%d-%y, %d-%m-%y, %m/%d/%y, %d/%m/%y.
+
+    Args:
+        used_date: the date string
+
+    Returns:
+        the date as an mm/dd/yyyy string, or None if it is not a valid date
+        in a recognized format
+        """
+    match = _USED_DATE_PATTERN.fullmatch(used_date.strip())
+    if match is None:
+        return None
+    fields = (match.group(1), match.group(3), match.group(4))
+    for order in _USED_DATE_ORDERS[match.group(2)]:
+        if not all(_FIELD_PATTERNS[kind].fullmatch(field) for kind, field in zip(order, fields)):
+            continue
+        values = dict(zip(order, fields))
+        if "Y" in values:
+            year = int(values["Y"])
+        else:
+            #Same pivot as strptime: 69-99 are 1969-1999, 00-68 are 2000-2068
+            year = int(values["y"])
+            year += 1900 if year >= 69 else 2000
+        month = int(values["m"])
+        day = int(values["d"])
+        if year < 1 or day > calendar.monthrange(year, month)[1]:
+            continue
+        return date(year, month, day).strftime("%m/%d/%Y")
+    return None
+
 class BaseRecord(ABC):
     """
     Abstract record entity class. All other classes
@@ -28,6 +89,8 @@ class BaseRecord(ABC):
     fields and methods include id, ref_id, is_edit, and
     language. 
     """
+    __slots__ = ("__id", "__ref_id", "__is_edit", "__language")
+
     def __init__(self, id=None, ref_id=None, is_edit=None,
                   language="english"):
         self.id=id
@@ -51,11 +114,7 @@ class BaseRecord(ABC):
         Exceptions:
             ValueError: String is not hexadecimal
         """
-        try:
-            int(s,16)
-            return True
-        except ValueError:
-            return False
+        return isinstance(s, str) and _HEX_PATTERN.fullmatch(s) is not None
         
     @property
     def id(self):
@@ -79,7 +138,7 @@ class BaseRecord(ABC):
             raise ValueError("Record ID must be either string or None")
         elif isinstance(id, str) and len(id) != 24:
             raise ValueError("Invalid Record ID")
-        elif isinstance(id, str) and not self.hexadecimal_test(id):
+        elif isinstance(id, str) and _OBJECT_ID_PATTERN.fullmatch(id) is None:
             raise ValueError("Invalid Record ID")
         else:
             self.__id=id
@@ -105,7 +164,7 @@ class BaseRecord(ABC):
             raise ValueError("Reference ID must be either string or None")
         elif isinstance(ref_id, str) and len(ref_id) != 24:
             raise ValueError("Invalid Record ID")
-        elif isinstance(ref_id, str) and not self.hexadecimal_test(ref_id):
+        elif isinstance(ref_id, str) and _OBJECT_ID_PATTERN.fullmatch(ref_id) is None:
             raise ValueError("Invalid Record ID")
         else:
             self.__ref_id=ref_id
@@ -169,6 +228,8 @@ class Joke(BaseRecord):
 
     The fields: 'level', 'content', 'language' are all required.
     """
+    __slots__ = ("__difficulty", "__content", "__explanation")
+
     def __init__(self, id=None, ref_id=None, is_edit=None,
                  difficulty=1, content={"type":"one_liner","text": "Haha"}, explanation="",
                  language="english"):
@@ -279,7 +340,20 @@ class Joke(BaseRecord):
             ValueError: Missing required fields
             ValueError: Content not in dictionary format
             """
-        content=sanitize_json(content)
+        return Joke.from_trusted_document(sanitize_json(content))
+
+    @staticmethod
+    def from_trusted_document(content):
+        """
+        Method for converting a document read from one of our own
+        collections to a Joke object. Only the field validation runs; the
+        document is not sanitized, so never pass it content that came from
+        a request (use from_json_object for that).
+        
+        Excpetions: 
+            ValueError: Not proper format
+            ValueError: Missing required fields
+            """
         requried_fields=['level', 'content', 'language']
         error_field='mesg'
         if not isinstance(content, dict):
@@ -291,8 +365,9 @@ class Joke(BaseRecord):
         elif not isinstance(content['content'], dict):
             raise ValueError("Content must be a dictionary")
         else:
+            #The explanation is passed to the constructor so level 3 jokes are validated against it
             joke_object=Joke(difficulty=content['level'], content=content['content'], 
-                        language=content["language"])
+                        explanation=content.get("explanation", ""), language=content["language"])
             if "id" in content:
 
                 joke_object.id=content["id"] 
@@ -300,8 +375,6 @@ class Joke(BaseRecord):
                 joke_object.ref_id=content["original_id"]
             if "is_edit" in content:
                 joke_object.is_edit=content["is_edit"]
-            if "explanation" in content:
-                joke_object.explanation=content["explanation"]
             return joke_object
                 
 
@@ -334,6 +407,8 @@ class Trivia(BaseRecord):
 
     The fields: 'question', 'answer', 'language' are all required.
     """
+    __slots__ = ("__question", "__answer")
+
     def __init__(self, id=None, ref_id=None, is_edit=None, question="Question", answer="Answer", language="english"):
         super().__init__(id,ref_id,is_edit,language)
         self.question=question
@@ -386,7 +461,20 @@ class Trivia(BaseRecord):
             ValueError: Not proper format
             ValueError: Missing required fields
             """
-        content=sanitize_json(content)
+        return Trivia.from_trusted_document(sanitize_json(content))
+
+    @staticmethod
+    def from_trusted_document(content):
+        """
+        Method for converting a document read from one of our own
+        collections to a Trivia object. Only the field validation runs; the
+        document is not sanitized, so never pass it content that came from
+        a request (use from_json_object for that).
+        
+        Excpetions: 
+            ValueError: Not proper format
+            ValueError: Missing required fields
+            """
         requried_fields=['question', 'answer','language']
         error_field='mesg'
         if not isinstance(content, dict):
@@ -434,6 +522,8 @@ class Quote(BaseRecord):
 
     The fields: 'content','author', 'language' are all required.
     """
+    __slots__ = ("__category", "__content", "__author", "__used_date")
+
     def __init__(self, id=None, ref_id=None, is_edit=None, category="category",
                  content="stuff",author="Joe", used_date="03/15/2020", language="english" ):
         super().__init__(id,ref_id,is_edit,language)
@@ -513,33 +603,14 @@ class Quote(BaseRecord):
             in one of the possible formats
             """
         
-        possible_formats = [
-                "%Y-%m-%d",    # 2025-11-04
-                "%m-%d-%Y",    # 11-04-2025
-                "%m/%d/%Y",    # 11/04/2025
-                "%d-%m-%Y",    # 04-11-2025
-                "%d/%m/%Y",    # 04/11/2025
-                "%m-%d-%y",    # 11-04-25
-                "%d-%m-%y",    # 04-11-25
-                "%m/%d/%y",    # 11/04/25
-                "%d/%m/%y"     # 04/11/25
-            ]
-
         if not isinstance(used_date, str):
             raise ValueError("Used Status variable must be a string")
         
-        parsed_date = None
-        for fmt in possible_formats:
-            try:
-                parsed_date = datetime.strptime(used_date.strip(), fmt)
-                break
-            except ValueError:
-                continue
-        
-        if parsed_date is None:
+        normalized_date = normalize_used_date(used_date)
+        if normalized_date is None:
             raise ValueError("Used Status must be a valid date string in a recognized format")
 
-        self.__used_date = parsed_date.strftime("%m/%d/%Y")
+        self.__used_date = normalized_date
         
     @staticmethod
     def from_json_object(content):
@@ -550,7 +621,20 @@ class Quote(BaseRecord):
             ValueError: Not proper format
             ValueError: Missing required fields
             """
-        content=sanitize_json(content)
+        return Quote.from_trusted_document(sanitize_json(content))
+
+    @staticmethod
+    def from_trusted_document(content):
+        """
+        Method for converting a document read from one of our own
+        collections to a Quote object. Only the field validation runs; the
+        document is not sanitized, so never pass it content that came from
+        a request (use from_json_object for that).
+        
+        Excpetions: 
+            ValueError: Not proper format
+            ValueError: Missing required fields
+            """
         requried_fields=['content', 'author', 'language']
         error_field='mesg'
         if not isinstance(content, dict):
@@ -601,6 +685,8 @@ class Bio(BaseRecord):
 
     The fields: 'name','paragraph','language','source_url' are all required.
     """
+    __slots__ = ("__birth_year", "__death_year", "__name", "__paragraph", "__summary", "__source_url")
+
     def __init__(self, id=None, ref_id=None, is_edit=None, language="English", 
                  birth_year=1900, death_year=2020, name="Bob Lastname", 
                  paragraph="Bio stuff", summary="summary", source_url="https://fake-url.com" ):
@@ -719,7 +805,7 @@ class Bio(BaseRecord):
             raise ValueError("Source URL cannot be none")
         elif not isinstance(source_url, str):
             raise ValueError("Source URL must be a string")
-        elif not validators.url(source_url):
+        elif not _is_valid_url(source_url):
             raise ValueError("Invalid url")
         else:
             self.__source_url=source_url
@@ -733,7 +819,20 @@ class Bio(BaseRecord):
             ValueError: Not proper format
             ValueError: Missing required fields
             """
-        content=sanitize_json(content)
+        return Bio.from_trusted_document(sanitize_json(content))
+
+    @staticmethod
+    def from_trusted_document(content):
+        """
+        Method for converting a document read from one of our own
+        collections to a Bio object. Only the field validation runs; the
+        document is not sanitized, so never pass it content that came from
+        a request (use from_json_object for that).
+        
+        Excpetions: 
+            ValueError: Not proper format
+            ValueError: Missing required fields
+            """
         requried_fields=['name','paragraph','language','source_url']
         error_field='mesg'
         if not isinstance(content, dict):
@@ -2,16 +2,14 @@
 # Licensed under the MIT License
 # See LICENSE for more details
 
-from flask import Flask, request, jsonify, make_response
-import json
-from typing import Callable, Any
+from flask import Flask, Response, g, request, make_response
+from typing import Callable, Any, Optional
 from functools import wraps
 from pymongo.errors import PyMongoError
 import os
 import sys
 from dotenv import load_dotenv
 from pathlib import Path
-from bson.json_util import dumps
 from bson.objectid import ObjectId
 
 
@@ -23,23 +21,18 @@ from all_the_buzz.utilities.authentication import authentication
 from all_the_buzz.entities.credentials_entity import Credentials, Token
 from all_the_buzz.entities.record_entities import Joke, Trivia, Quote, Bio
 from all_the_buzz.utilities.error_handler import ResponseCode
+from all_the_buzz.database_operations.abstract_record import DatabaseAccessObject
 from all_the_buzz.database_operations.dao_factory import DAOFactory
+from all_the_buzz.database_operations.index_manager import ensure_indexes
+from all_the_buzz.database_operations.approval_service import ApprovalService
+from all_the_buzz.database_operations.bulk_import import RECORD_TYPES, DEFAULT_CHUNK_SIZE, import_records, iter_json_records
+from all_the_buzz.utilities.json_encoder import JSONResponseEncoder, EXTENDED
 from all_the_buzz.utilities.logger import LoggerFactory
+from all_the_buzz.utilities.sanitize import sanitize_json
+from all_the_buzz.utilities.structured_logging import start_request, end_request, set_log_context, get_log_context
 
 global mongo_client
 
-global public_jokes_dao
-global private_jokes_dao
-
-global public_quotes_dao
-global private_quotes_dao
-
-global public_trivias_dao
-global private_trivias_dao
-
-global public_bios_dao
-global private_bios_dao
-
 BASE_DIR = Path(__file__).resolve().parent
 dotenv_path = BASE_DIR / '.env'
 
@@ -49,6 +42,10 @@ load_dotenv(dotenv_path)
 ATLAS_URI = os.getenv("ATLAS_URI") 
 DATABASE_NAME = "team_white_database"
 SERVER_VER = '1'
+MAX_BULK_CHUNK_SIZE = 10000
+#extended writes ObjectId/datetime as relaxed extended JSON ($oid/$date); plain writes them as plain strings
+JSON_OUTPUT_MODE = os.getenv("JSON_OUTPUT_MODE", EXTENDED)
+RESPONSE_ENCODER = JSONResponseEncoder(JSON_OUTPUT_MODE)
 def create_client_connection(server_version: str = SERVER_VER) -> ResponseCode:
     try:
         client = DAOFactory.set_client(ATLAS_URI, server_version)
@@ -56,6 +53,44 @@ def create_client_connection(server_version: str = SERVER_VER) -> ResponseCode:
     except Exception as e:
         return ResponseCode(e, f"Failed to connect to MongoDB: {str(e)}")
 
+def ensure_database_indexes() -> ResponseCode:
+    """Creates any missing indexes declared in db_schemas/index_specs.py; a failure does not stop startup."""
+    try:
+        report = ensure_indexes(DAOFactory.get_client()[DATABASE_NAME])
+        return ResponseCode("GeneralSuccess", data=report)
+    except Exception as e:
+        return ResponseCode(e.__class__.__name__, f"Failed to ensure indexes: {str(e)}")
+
+
+def begin_request_log_context() -> None:
+    """Starts the structured log context (request id, route and timer) of the incoming request."""
+    route = request.url_rule.rule if request.url_rule is not None else request.path
+    g.log_context_token = start_request(route, request.headers.get("X-Request-ID"))
+
+def finish_request_log_context(response: Response) -> Response:
+    """Logs the outcome of the request and returns its request id to the caller."""
+    context = get_log_context()
+    if context is not None:
+        if context["outcome"] is None:
+            set_log_context(outcome=str(response.status_code))
+        response.headers["X-Request-ID"] = context["request_id"]
+        LoggerFactory.get_general_logger().debug("Request finished with status %d", response.status_code)
+    return response
+
+def clear_request_log_context(error: Optional[BaseException] = None) -> None:
+    """Discards the structured log context once the request is torn down."""
+    token = g.pop("log_context_token", None)
+    if token is not None:
+        end_request(token)
+
+
+def json_response(body: Any, status_code: int = 200) -> Response:
+    """
+    Encodes a response body (records or a ResponseCode body) with
+    RESPONSE_ENCODER and writes the bytes straight into a JSON Response.
+    """
+    return Response(RESPONSE_ENCODER.encode(body), status=status_code, mimetype="application/json")
+
 
 class MyFlask(Flask):
     def add_url_rule(self, rule, endpoint=None, view_func=None, **options):
@@ -80,7 +115,7 @@ def authentication_middleware(f: Callable) -> Callable:
             #send back a credentials missing response
             missing_token_result = ResponseCode("InvalidToken")
             status_code, body = missing_token_result.to_http_response()
-            return json.dumps(body), status_code, {"Content-Type": "application/json"}        
+            return json_response(body, status_code)
         token_dict = {'token': str(user_token)}
         try:
             logger.debug("Trying authentication")
@@ -88,12 +123,12 @@ def authentication_middleware(f: Callable) -> Callable:
             logger.debug("Successfuly obtained credentials")
         except Exception as e:
             logger.error(str(e))
-            status_code, body = ResponseCode("AuthServerError")
-            return jsonify(body), status_code
+            status_code, body = ResponseCode("AuthServerError").to_http_response()
+            return json_response(body, status_code)
         #if the authentication result is an error code
         if isinstance(authentication_result, ResponseCode):
             status_code, body = authentication_result.to_http_response()
-            return jsonify(body), status_code
+            return json_response(body, status_code)
         #if the authentication result is valid credentials
         if isinstance(authentication_result, Credentials):
             kwargs['credentials'] = authentication_result
@@ -101,26 +136,33 @@ def authentication_middleware(f: Callable) -> Callable:
             return f(*args, **kwargs)
         #returns 500 error if authentication result is something other than a ResponseCode object or a Credentials object
         status_code, body = ResponseCode("AuthServerError").to_http_response()
-        return jsonify(body), status_code
+        return json_response(body, status_code)
     return decorated_function
 
-def get_dao_set_credentials(credentials: Credentials, dao_classname: str):
+def get_dao_set_credentials(credentials: Credentials, dao: str | DatabaseAccessObject):
     """
     A helper function that returns a dao object after
-    setting it's credentials 
+    setting it's credentials. The shared DAO is never modified; the
+    returned object is a view bound to this request's credentials, so
+    concurrent requests cannot see each other's credentials.
 
     Args:
         credentials: The authenticated user's credentials object, injected by
         the authentication_middleware.
+        dao: The shared DAO bound at startup (see Resource), or the DAOFactory
+        name of the DAO to look up.
     Returns:
-        A (DatabaseAccessObject): a DatabaseAccessObject of the given dao_class_name string
+        A (DatabaseAccessObject): a request-scoped DatabaseAccessObject bound to the credentials
     """
     logger=LoggerFactory.get_general_logger()
-    logger.debug("Using DAO factory to intialize mongodb collection")
-    dao = DAOFactory.get_dao(dao_classname)
+    if isinstance(dao, str):
+        logger.debug("Using DAO factory to intialize mongodb collection")
+        set_log_context(dao=dao)
+        dao = DAOFactory.get_dao(dao)
+    else:
+        set_log_context(dao=type(dao).__name__)
     logger.debug("setting credentials in dao")
-    dao.set_credentials(credentials)
-    return dao
+    return dao.with_credentials(credentials)
 
 def convert_filter_types(filter_dict: dict[str, str]) -> dict[str, Any]:
     """Converts string values in the filter dictionary to their required types (e.g., int)."""
@@ -134,7 +176,7 @@ def convert_filter_types(filter_dict: dict[str, str]) -> dict[str, Any]:
             try:
                 type_safe_filter[key] = int(value)
             except ValueError:
-                logger.debug(f"Warning filter '{key}' recieved non-integer value '{value}'. Skipping")
+                logger.debug("Warning filter '%s' recieved non-integer value '%s'. Skipping", key, value)
                 continue
         elif key in bool_fields:
             lower_value = value.lower()
@@ -143,1835 +185,726 @@ def convert_filter_types(filter_dict: dict[str, str]) -> dict[str, Any]:
             elif lower_value in ('false','', ' '):
                 type_safe_filter[key] = False
             else:
-                logger.debug(f"WARNING: Filter '{key}' received non-bool value '{value}'. Skipping.")
+                logger.debug("WARNING: Filter '%s' received non-bool value '%s'. Skipping.", key, value)
                 continue
         else:
             type_safe_filter[key] = value
             
     return type_safe_filter
 
-@authentication_middleware
-def retrieve_public_jokes_collection(credentials: Credentials):
-    """Retrieves the collection of public (approved) jokes.
+#Query parameters that control paging/streaming; they are never treated as record filters
+PAGING_ARGS = ("after", "limit", "stream")
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+STREAM_FORMATS = {"ndjson": "application/x-ndjson", "json": "application/json"}
 
-    This endpoint serves two functions via the GET /jokes route:
-    1. **Retrieve All:** Returns ALL public jokes if no query parameters are provided (GET /jokes).
-    2. **Filter by Fields:** Returns a filtered list of public jokes if query 
-       parameters are provided (e.g., GET /jokes?difficulty=2&category=tech).
+def split_paging_args(filter_dict: dict[str, str]) -> dict[str, str]:
+    """Removes the paging/streaming query parameters from filter_dict and returns them."""
+    return {key: filter_dict.pop(key) for key in PAGING_ARGS if key in filter_dict}
 
-    Args:
-        credentials: The authenticated user's credentials object, injected by
-            the authentication_middleware. This is used to confirm the user is 
-            authorized for read access.
+def split_fields_arg(filter_dict: dict[str, str]) -> Optional[list[str]]:
+    """Removes the fields= query parameter from filter_dict and returns the requested field names."""
+    fields = filter_dict.pop("fields", None)
+    return [field for field in fields.split(",") if field] if fields else None
 
-    Returns:
-        A tuple containing:
-        * The JSON string representation of the jokes (filtered or all) and a 200 HTTP status code,
-          if the user is authenticated.
-        * A tuple containing a JSON error response and a 401 HTTP status code,
-          if the user is unauthorized (handled by the credential check).
+def stream_documents(cursor, stream_format: str):
     """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Retrievign public jokes collection")
-    if credentials.title == 'Employee' or credentials.title == 'Manager':
-        public_jokes_dao = get_dao_set_credentials(credentials, "PublicJokeDAO")
-        filter_dict = request.args.to_dict()
-        if filter_dict:
-            type_safe_filter = convert_filter_types(filter_dict)
-            if type_safe_filter:
-                all_jokes = public_jokes_dao.get_by_fields(type_safe_filter)
-            else:
-                all_jokes = []
-                public_jokes_dao.clear_credentials()
-                status_code, body = ResponseCode("InvalidFilter").to_http_response()
-                return jsonify(body), status_code 
-        else:
-            all_jokes = public_jokes_dao.get_all_records()
-        public_jokes_dao.clear_credentials()
-        json_string = dumps(all_jokes)
-        ResponseCode("GeneralSuccess", json_string)
-        return json_string, 200
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-
-@authentication_middleware
-def create_a_new_joke(credentials: Credentials):
-    
+    Generator that serializes documents from a Mongo cursor one at a time, either as
+    newline-delimited JSON or as the chunks of a single JSON array.
     """
-    Handles the creation of a new joke record (POST /jokes).
+    if stream_format == "ndjson":
+        for document in cursor:
+            yield RESPONSE_ENCODER.encode(document) + b"\n"
+        return
+    yield b"["
+    first = True
+    for document in cursor:
+        yield RESPONSE_ENCODER.encode(document) if first else b"," + RESPONSE_ENCODER.encode(document)
+        first = False
+    yield b"]"
 
-    The behavior and target collection are strictly determined by the authenticated
-    user's title:
-
-    1.  **Manager ('Manager'):** The joke is created directly in the PublicJokeDAO
-        collection. This action constitutes immediate approval.
-    2.  **Employee ('Employee'):** The joke is created in the PrivateJokeDAO
-        collection as a proposal (`is_edit` is set to False), requiring subsequent
-        review and approval.
+def read_collection_page(dao, filter_dict: dict[str, str], paging_args: dict[str, str], fields: Optional[list[str]] = None):
+    """
+    Serves a collection read with keyset pagination or streaming.
 
-    The request body is first parsed and validated against the Joke entity schema.
+    GET /<collection>?limit=N&after=<ObjectId> returns {"records": [...], "next_cursor": <id or null>};
+    pass next_cursor as after to read the following page. GET /<collection>?stream=ndjson (or
+    stream=json) writes the records straight from the Mongo cursor in a chunked response.
 
     Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware. Used to determine the appropriate DAO
-            and access level.
+        dao: a credential-bound DatabaseAccessObject for the collection
+        filter_dict: the remaining query parameters, used as record filters
+        paging_args: the parameters returned by split_paging_args
+        fields: the field names returned by split_fields_arg, or None for whole documents
 
     Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON body, 200/201/202): Success response based on the underlying DAO
-            operation (typically 201 for Manager/Public creation, or a status code
-            indicating successful proposal submission for Employee/Private).
-        * (JSON body, 400): If the JSON request body fails validation via
-            `Joke.from_json_object()`.
-        * (JSON body, 401/500): If the user title is unrecognized ('InvalidEmployee'),
-            or if an exception occurs during the DAO operation (translated via
-            ResponseCode error).
+        A Flask response, or a JSON error body and 400 if a parameter is invalid.
     """
     logger=LoggerFactory.get_general_logger()
-    logger.debug("creating new joke")
-    if credentials.title == 'Employee':
-        logger.debug("New joke as employee")
-        private_jokes_dao = get_dao_set_credentials(credentials, "PrivateJokeDAO")
-        request_body = request.get_json()
-        request_body["is_edit"] = False
-        try:
-            new_joke = Joke.from_json_object(request_body)
-        except Exception as e:
-            private_jokes_dao.clear_credentials()
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        if isinstance(new_joke, Joke):
-            try:
-                dao_response = private_jokes_dao.create_record(request_body)
-                assert isinstance(dao_response, ResponseCode) == True
-            except Exception as e:
-                private_jokes_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-            private_jokes_dao.clear_credentials()
-            status_code, body = dao_response.to_http_response()
-            return jsonify(body), status_code
-        else:
-            private_jokes_dao.clear_credentials()
-            status_code, body = ResponseCode("InvalidRecord").to_http_response()
-            return jsonify(body), status_code
-        
-    elif credentials.title == 'Manager':
-        logger.debug("New joke as a manager")
-        public_jokes_dao = get_dao_set_credentials(credentials, 'PublicJokeDAO')
-        request_body = request.get_json()
-        try:
-            new_joke = Joke.from_json_object(request_body)
-        except Exception as e:
-            public_jokes_dao.clear_credentials()
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        if isinstance(new_joke, Joke):
-            try:
-                dao_response = public_jokes_dao.create_record(request_body)
-                assert isinstance(dao_response, ResponseCode)
-            except Exception as e:
-                public_jokes_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-            public_jokes_dao.clear_credentials()
-            status_code, body = dao_response.to_http_response()
-            return jsonify(body), status_code
-        else:
-            public_jokes_dao.clear_credentials()
-            status_code, body = ResponseCode("InvalidRecord").to_http_response()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-    
-
-
-
-
-@authentication_middleware
-def create_a_new_quote(credentials: Credentials): #employee credentials create in private, manager's create in public
-    
-    """
-    Handles the creation of a new quote record (POST /quote).
-
-    The behavior and target collection are strictly determined by the authenticated
-    user's title:
-
-    1.  **Manager ('Manager'):** The joke is created directly in the PublicQuoteDAO
-        collection. This action constitutes immediate approval.
-    2.  **Employee ('Employee'):** The joke is created in the PrivateQuoteDAO
-        collection as a proposal (`is_edit` is set to False), requiring subsequent
-        review and approval.
-
-    The request body is first parsed and validated against the Quote entity schema.
+    type_safe_filter = {}
+    if filter_dict:
+        type_safe_filter = convert_filter_types(filter_dict)
+        if not type_safe_filter:
+            status_code, body = ResponseCode("InvalidFilter").to_http_response()
+            return json_response(body, status_code)
+    after = paging_args.get("after")
+    stream_format = paging_args.get("stream")
+    if stream_format is not None:
+        if stream_format not in STREAM_FORMATS:
+            status_code, body = ResponseCode("InvalidFilter", "stream must be ndjson or json.").to_http_response()
+            return json_response(body, status_code)
+        cursor = dao.iter_records(type_safe_filter, after=after, fields=fields, raw=True)
+        if isinstance(cursor, ResponseCode):
+            status_code, body = cursor.to_http_response()
+            return json_response(body, status_code)
+        logger.debug("Streaming records as %s", stream_format)
+        return Response(stream_documents(cursor, stream_format), status=200, mimetype=STREAM_FORMATS[stream_format])
+    try:
+        limit = int(paging_args.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        limit = 0
+    if limit <= 0:
+        status_code, body = ResponseCode("InvalidFilter", "limit must be a positive integer.").to_http_response()
+        return json_response(body, status_code)
+    page = dao.get_page(type_safe_filter, after=after, limit=min(limit, MAX_PAGE_SIZE), fields=fields, raw=True)
+    if isinstance(page, ResponseCode):
+        status_code, body = page.to_http_response()
+        return json_response(body, status_code)
+    logger.debug("Returning page of %d records", len(page['records']))
+    return json_response(page)
+
+
+class Resource:
+    """
+    One content type served by the API: its URL name, entity class and the
+    public and private DAOs. Every resource gets the same generic handlers
+    (see RESOURCE_ROUTES), so a new content type only needs an entry in
+    RESOURCES.
+
+    The DAO names are resolved to DAO instances once at startup by
+    establish_all_daos; until then (e.g. in tests) the names are used and
+    get_dao_set_credentials looks them up per request.
+    """
+    def __init__(self, name: str, label: str, entity_class: type, public_dao_name: str,
+                 private_dao_name: str, extra_routes: tuple = ()):
+        """
+        Args:
+            name: the plural URL name, e.g. "jokes"
+            label: the singular name used in log messages and handler names, e.g. "joke"
+            entity_class: the record entity that validates request bodies
+            public_dao_name: the DAOFactory name of the public collection
+            private_dao_name: the DAOFactory name of the private (pending) collection
+            extra_routes: (rule, view function, methods) of routes only this resource has
+        """
+        self.name = name
+        self.label = label
+        self.entity_class = entity_class
+        self.public_dao_name = public_dao_name
+        self.private_dao_name = private_dao_name
+        self.extra_routes = extra_routes
+        self.__public_dao = None
+        self.__private_dao = None
+        #View functions by name, and the (rule, view, methods) routes registered by create_app
+        self.views = {}
+        self.routes = []
+        for rule, handler, view_name, methods in RESOURCE_ROUTES:
+            view = resource_view(handler, self, view_name.format(name=name, label=label))
+            self.views[view.__name__] = view
+            self.routes.append((rule.format(name=name), view, methods))
+        self.routes.extend(extra_routes)
+
+    @property
+    def public_dao(self):
+        """The bound public DAO, or its name if establish_all_daos has not run."""
+        return self.__public_dao if self.__public_dao is not None else self.public_dao_name
+
+    @property
+    def private_dao(self):
+        """The bound private DAO, or its name if establish_all_daos has not run."""
+        return self.__private_dao if self.__private_dao is not None else self.private_dao_name
+
+    def bind(self, public_dao, private_dao) -> None:
+        """Binds the shared DAO instances so handlers skip the DAOFactory lookup."""
+        self.__public_dao = public_dao
+        self.__private_dao = private_dao
+
+
+def resource_view(handler: Callable, resource: Resource, name: str) -> Callable:
+    """
+    Binds a generic handler to one resource and returns it as an
+    authenticated Flask view function called name (also its endpoint).
+    """
+    def view(**kwargs):
+        return handler(resource, **kwargs)
+    view.__name__ = view.__qualname__ = name
+    view.__doc__ = handler.__doc__
+    return authentication_middleware(view)
+
+
+def retrieve_public_collection(resource: Resource, credentials: Credentials):
+    """
+    Retrieves the public collection of a resource (GET /<type>).
+
+    Query parameters are record filters (typed by convert_filter_types),
+    except `fields`, which selects the returned fields, and the paging
+    parameters (`limit`, `after`, `stream`), which hand the read to
+    read_collection_page. Records are read as RawBSONDocuments and only
+    decoded while RESPONSE_ENCODER writes them.
 
     Args:
+        resource: The Resource bound to the route.
         credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware. Used to determine the appropriate DAO
-            and access level.
+            the authentication_middleware.
 
     Returns:
         A tuple containing a JSON response body and an HTTP status code:
-        * (JSON body, 200/201/202): Success response based on the underlying DAO
-            operation (typically 201 for Manager/Public creation, or a status code
-            indicating successful proposal submission for Employee/Private).
-        * (JSON body, 400): If the JSON request body fails validation via
-            `Quote.from_json_object()`.
-        * (JSON body, 401/500): If the user title is unrecognized ('InvalidEmployee'),
-            or if an exception occurs during the DAO operation (translated via
-            ResponseCode error).
+        * (JSON string, 200): The matching records.
+        * (JSON body, 400): If the filters are invalid.
+        * (JSON body, 401): If the user is not an Employee or a Manager.
+        * (JSON body, 404): If no records were found.
     """
     logger=LoggerFactory.get_general_logger()
-    logger.debug("Creating new quote")
-    if credentials.title == 'Employee':
-        logger.debug("Creating new quote as employee")
-        private_quotes_dao = get_dao_set_credentials(credentials, "PrivateQuoteDAO")
-        request_body = request.get_json()
-        request_body["is_edit"] = False
-        try:
-            new_quote = Quote.from_json_object(request_body)
-        except Exception as e:
-            private_quotes_dao.clear_credentials()
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        if isinstance(new_quote, Quote):
-            try:
-                dao_response = private_quotes_dao.create_record(request_body)
-                assert isinstance(dao_response, ResponseCode) == True
-            except Exception as e:
-                private_quotes_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-            private_quotes_dao.clear_credentials()
-            status_code, body = dao_response.to_http_response()
-            return jsonify(body), status_code
-        else:
-            private_quotes_dao.clear_credentials()
-            status_code, body = ResponseCode("InvalidRecord").to_http_response()
-            return jsonify(body), status_code
-        
-    elif credentials.title == 'Manager':
-        logger.debug("New quote as a manager")
-        public_quotes_dao = get_dao_set_credentials(credentials, 'PublicQuoteDAO')
-        request_body = request.get_json()
-        try:
-            new_quote = Quote.from_json_object(request_body)
-        except Exception as e:
-            public_quotes_dao.clear_credentials()
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        if isinstance(new_quote, Quote):
-            try:
-                dao_response = public_quotes_dao.create_record(request_body)
-                assert isinstance(dao_response, ResponseCode)
-            except Exception as e:
-                public_quotes_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-            public_quotes_dao.clear_credentials()
-            status_code, body = dao_response.to_http_response()
-            return jsonify(body), status_code
-        else:
-            public_quotes_dao.clear_credentials()
-            status_code, body = ResponseCode("InvalidRecord").to_http_response()
-            return jsonify(body), status_code
-    else:
+    logger.debug("Retrieving public %s collection", resource.name)
+    if credentials.title not in ('Employee', 'Manager'):
         status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-    
-
-    
+        return json_response(body, status_code)
+    public_dao = get_dao_set_credentials(credentials, resource.public_dao)
+    try:
+        filter_dict = request.args.to_dict()
+        fields = split_fields_arg(filter_dict)
+        paging_args = split_paging_args(filter_dict)
+        if paging_args:
+            return read_collection_page(public_dao, filter_dict, paging_args, fields)
+        if filter_dict:
+            type_safe_filter = convert_filter_types(filter_dict)
+            if not type_safe_filter:
+                status_code, body = ResponseCode("InvalidFilter").to_http_response()
+                return json_response(body, status_code)
+            records = public_dao.get_by_fields(type_safe_filter, fields=fields, raw=True)
+        else:
+            records = public_dao.get_all_records(fields=fields, raw=True)
+    finally:
+        public_dao.clear_credentials()
+    if isinstance(records, ResponseCode):
+        status_code, body = records.to_http_response()
+        return json_response(body, status_code)
+    ResponseCode("GeneralSuccess", records)
+    return json_response(records)
 
 
-@authentication_middleware
-def create_a_new_trivia(credentials: Credentials): #employee credentials create in private, manager's create in public
-    
+def retrieve_private_collection(resource: Resource, credentials: Credentials):
     """
-    Handles the creation of a new trivia record (POST /trivias).
-
-    The behavior and target collection are strictly determined by the authenticated
-    user's title:
-
-    1.  **Manager ('Manager'):** The trivia is created directly in the PublicTriviaDAO
-        collection. This action constitutes immediate approval.
-    2.  **Employee ('Employee'):** The trivia is created in the PublicTriviaDAO
-        collection as a proposal (`is_edit` is set to False), requiring subsequent
-        review and approval.
-
-    The request body is first parsed and validated against the trivia entity schema.
+    Retrieves the pending (private) records of a resource (GET /pending-<type>).
+    Managers only; `limit`, `after` and `stream` page or stream the records.
 
     Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware. Used to determine the appropriate DAO
-            and access level.
+        resource: The Resource bound to the route.
+        credentials: The authenticated user's Credentials object.
 
     Returns:
         A tuple containing a JSON response body and an HTTP status code:
-        * (JSON body, 200/201/202): Success response based on the underlying DAO
-            operation (typically 201 for Manager/Public creation, or a status code
-            indicating successful proposal submission for Employee/Private).
-        * (JSON body, 400): If the JSON request body fails validation via
-            `trivia.from_json_object()`.
-        * (JSON body, 401/500): If the user title is unrecognized ('InvalidEmployee'),
-            or if an exception occurs during the DAO operation (translated via
-            ResponseCode error).
+        * (JSON string, 200): The pending records.
+        * (JSON body, 401): If the user is **not a Manager**.
+        * (JSON body, 404): If there are no pending records.
     """
     logger=LoggerFactory.get_general_logger()
-    logger.debug("Creating a new trivia")
-    if credentials.title == 'Employee':
-        logger.debug("Create a new trvia as employee")
-        private_trivias_dao = get_dao_set_credentials(credentials, "PrivateTriviaDAO")
-        request_body = request.get_json()
-        request_body["is_edit"] = False
-        try:
-            new_trivia = Trivia.from_json_object(request_body)
-        except Exception as e:
-            private_trivias_dao.clear_credentials()
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        if isinstance(new_trivia, Trivia):
-            try:
-                dao_response = private_trivias_dao.create_record(request_body)
-                assert isinstance(dao_response, ResponseCode) == True
-            except Exception as e:
-                private_trivias_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-            private_trivias_dao.clear_credentials()
-            status_code, body = dao_response.to_http_response()
-            return jsonify(body), status_code
-        else:
-            private_trivias_dao.clear_credentials()
-            status_code, body = ResponseCode("InvalidRecord").to_http_response()
-            return jsonify(body), status_code
-        
-    elif credentials.title == 'Manager':
-        logger.debug("Create a new trivia as a manager")
-        public_trivias_dao = get_dao_set_credentials(credentials, 'PublicTriviaDAO')
-        request_body = request.get_json()
-        try:
-            new_trivia = Trivia.from_json_object(request_body)
-        except Exception as e:
-            print(f"PRINT E ON LINE 436 {str(e)}")
-            public_trivias_dao.clear_credentials()
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        if isinstance(new_trivia, Trivia):
-            try:
-                dao_response = public_trivias_dao.create_record(request_body)
-                assert isinstance(dao_response, ResponseCode)
-            except Exception as e:
-                public_trivias_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-            public_trivias_dao.clear_credentials()
-            status_code, body = dao_response.to_http_response()
-            return jsonify(body), status_code
-        else:
-            public_trivias_dao.clear_credentials()
-            status_code, body = ResponseCode("InvalidRecord").to_http_response()
-            return jsonify(body), status_code
-    else:
+    logger.debug("Retrieving private %s collection", resource.name)
+    if credentials.title != 'Manager':
         status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-
-
+        return json_response(body, status_code)
+    private_dao = get_dao_set_credentials(credentials, resource.private_dao)
+    try:
+        paging_args = split_paging_args(request.args.to_dict())
+        if paging_args:
+            return read_collection_page(private_dao, {}, paging_args)
+        records = private_dao.get_all_records(raw=True)
+    finally:
+        private_dao.clear_credentials()
+    if isinstance(records, ResponseCode):
+        status_code, body = records.to_http_response()
+        return json_response(body, status_code)
+    ResponseCode("GeneralSuccess", records)
+    return json_response(records)
 
 
-@authentication_middleware
-def create_a_new_bio(credentials: Credentials): #employee credentials create in private, manager's create in public
-    
+def create_new_record(resource: Resource, credentials: Credentials):
     """
-    Handles the creation of a new bio record (POST /bio).
+    Creates a record (POST /<type>). The target collection is determined by
+    the authenticated user's title:
 
-    The behavior and target collection are strictly determined by the authenticated
-    user's title:
+    1.  **Manager:** the record is created directly in the public collection.
+        This action constitutes immediate approval.
+    2.  **Employee:** the record is created in the private collection as a
+        proposal (`is_edit` is set to False) and waits for approval.
 
-    1.  **Manager ('Manager'):** The bio is created directly in the PublicBioDAO
-        collection. This action constitutes immediate approval.
-    2.  **Employee ('Employee'):** The bio is created in the PublicBioDAO
-        collection as a proposal (`is_edit` is set to False), requiring subsequent
-        review and approval.
-
-    The request body is first parsed and validated against the bio entity schema.
+    The request body is sanitized and validated against the resource's entity
+    first; the sanitized body is what gets stored.
 
     Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware. Used to determine the appropriate DAO
-            and access level.
+        resource: The Resource bound to the route.
+        credentials: The authenticated user's Credentials object.
 
     Returns:
         A tuple containing a JSON response body and an HTTP status code:
-        * (JSON body, 200/201/202): Success response based on the underlying DAO
-            operation (typically 201 for Manager/Public creation, or a status code
-            indicating successful proposal submission for Employee/Private).
-        * (JSON body, 400): If the JSON request body fails validation bio.from_json_object()`.
-        * (JSON body, 401/500): If the user title is unrecognized ('InvalidEmployee'),
-            or if an exception occurs during the DAO operation (translated via
-            ResponseCode error).
+        * (JSON body, 201/202): The record was created or proposed.
+        * (JSON body, 400/500): If validation or the DAO operation fails.
+        * (JSON body, 401): If the user title is not Employee or Manager.
     """
     logger=LoggerFactory.get_general_logger()
-    logger.debug("Create a new bio")
     if credentials.title == 'Employee':
-        logger.debug("Create a new bio as employee")
-        private_bios_dao = get_dao_set_credentials(credentials, "PrivateBioDAO")
-        request_body = request.get_json()
-        request_body["is_edit"] = False
-        try:
-            new_bio = Bio.from_json_object(request_body)
-        except Exception as e:
-            private_bios_dao.clear_credentials()
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        if isinstance(new_bio, Bio):
-            try:
-                dao_response = private_bios_dao.create_record(request_body)
-                assert isinstance(dao_response, ResponseCode) == True
-            except Exception as e:
-                private_bios_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-            private_bios_dao.clear_credentials()
-            status_code, body = dao_response.to_http_response()
-            return jsonify(body), status_code
-        else:
-            private_bios_dao.clear_credentials()
-            status_code, body = ResponseCode("InvalidRecord").to_http_response()
-            return jsonify(body), status_code
-        
+        logger.debug("New %s as employee", resource.label)
+        dao = get_dao_set_credentials(credentials, resource.private_dao)
     elif credentials.title == 'Manager':
-        logger.debug("Create a new bio as a manager")
-        public_bios_dao = get_dao_set_credentials(credentials, 'PublicBioDAO')
-        request_body = request.get_json()
+        logger.debug("New %s as a manager", resource.label)
+        dao = get_dao_set_credentials(credentials, resource.public_dao)
+    else:
+        status_code, body = ResponseCode("Unauthorized").to_http_response()
+        return json_response(body, status_code)
+    try:
+        #The stored body is the sanitized one; approval copies pending records to the public collection
+        request_body = sanitize_json(request.get_json())
+        if credentials.title == 'Employee' and isinstance(request_body, dict):
+            request_body["is_edit"] = False
         try:
-            new_bio = Bio.from_json_object(request_body)
+            new_record = resource.entity_class.from_json_object(request_body)
         except Exception as e:
-            public_bios_dao.clear_credentials()
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        if isinstance(new_bio, Bio):
-            try:
-                dao_response = public_bios_dao.create_record(request_body)
-                assert isinstance(dao_response, ResponseCode)
-            except Exception as e:
-                public_bios_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-            public_bios_dao.clear_credentials()
-            status_code, body = dao_response.to_http_response()
-            return jsonify(body), status_code
+            dao_response = ResponseCode(str(e))
         else:
-            public_bios_dao.clear_credentials()
-            status_code, body = ResponseCode("InvalidRecord").to_http_response()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-
+            if isinstance(new_record, resource.entity_class):
+                dao_response = dao.create_record(request_body)
+            else:
+                dao_response = ResponseCode("InvalidRecord")
+    except Exception as e:
+        dao_response = ResponseCode(str(e))
+    finally:
+        dao.clear_credentials()
+    status_code, body = dao_response.to_http_response()
+    return json_response(body, status_code)
 
 
-        
-@authentication_middleware
-def update_joke(joke_id: str, credentials: Credentials):
+def update_existing_record(resource: Resource, credentials: Credentials, record_id: str):
     """
-    (PUT /jokes/<joke_id>) for updating or proposing an edit.
-    
-    The function validates the incoming JSON request body against the Joke entity 
-    schema for all users. The target action is strictly determined by the authenticated
-    user's title:
+    Updates a record (PUT /<type>/<record_id>).
 
-    1.  **Manager ('Manager'):** Executes a direct `update_record` on the specified 
-        public joke ID within the PublicJokeDAO collection.
-    2.  **Employee ('Employee'):** Executes a `create_record` (submission) in the 
-        PrivateJokeDAO collection. The request body is tagged with the original 
-        `joke_id` (as 'original_id') and flagged as an edit (`is_edit=True`).
+    1.  **Manager:** the public record is updated directly.
+    2.  **Employee:** the edit is stored in the private collection (with
+        `original_id` and `is_edit` set) and waits for approval.
 
     Args:
-        joke_id: The unique identifier (ID) of the public joke targeted for update.
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to determine write authority.
+        resource: The Resource bound to the route.
+        credentials: The authenticated user's Credentials object.
+        record_id: The id of the public record to update.
 
     Returns:
         A tuple containing a JSON response body and an HTTP status code:
-        * (JSON body, 200): Successful **direct update** by a Manager.
-        * (JSON body, 202): Successful submission of a **pending edit proposal** by an Employee.
-        * (JSON body, 400): If the request body fails entity validation 
-        (`Joke.from_json_object`) or is an otherwise invalid record.
-        * (JSON body, 401/500): If the user is unauthorized or if a database 
-        exception occurs during the DAO operation (translated via ResponseCode).
+        * (JSON body, 200): The public record was updated (Manager).
+        * (JSON body, 202): The edit is pending approval (Employee).
+        * (JSON body, 400/404/500): If validation or the DAO operation fails.
+        * (JSON body, 401): If the user title is not Employee or Manager.
     """
     logger=LoggerFactory.get_general_logger()
-    logger.debug("Update a joke")
-    request_body = request.get_json()
+    logger.debug("Update a %s", resource.label)
     if credentials.title == 'Manager':
-        logger.debug("Update record as manager")
-        public_jokes_dao = get_dao_set_credentials(credentials, "PublicJokeDAO")
-        #entity validation
-        try:
-            updated_joke = Joke.from_json_object(request_body)
-        except Exception as e:
-            #entity validation fails
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        #actual database update
-        if isinstance(updated_joke, Joke):
-            try:
-                print(joke_id)
-                get_response = public_jokes_dao.get_by_fields({'_id': str(joke_id)})
-                print(get_response)
-                dao_response = public_jokes_dao.update_record(str(joke_id), request_body)
-                public_jokes_dao.clear_credentials()
-                status_code, body = dao_response.to_http_response()
-                return jsonify(body), status_code
-            except Exception as e:
-                public_jokes_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-        else:
-            public_jokes_dao.clear_credentials()
-            status_code, body = ResponseCode("InvalidRecord").to_http_response()
-            return jsonify(body), status_code
+        dao = get_dao_set_credentials(credentials, resource.public_dao)
     elif credentials.title == 'Employee':
-        logger.debug("Create new record as employee")
-        private_jokes_dao = DAOFactory.get_dao('PrivateJokeDAO')
-        private_jokes_dao.set_credentials(credentials)
-        #setting the OG id of the record to edit and setting is edit to true
-        request_body["original_id"] = joke_id
-        request_body["is_edit"] = True
-        try:
-            new_edit = Joke.from_json_object(request_body)
-        except Exception as e:
-            private_jokes_dao.clear_credentials()
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        if isinstance(new_edit, Joke):
-            try:
-                #calling create record on the private database 
-                request_body["original_id"] = ObjectId(joke_id)
-                dao_response = private_jokes_dao.create_record(request_body)
-                private_jokes_dao.clear_credentials()
-                status_code, body = ResponseCode("PendingSuccess").to_http_response()
-                return jsonify(body), status_code 
-            except Exception as e:
-                private_jokes_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
+        dao = get_dao_set_credentials(credentials, resource.private_dao)
     else:
         status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-    
+        return json_response(body, status_code)
+    try:
+        #The stored body is the sanitized one; approval copies pending records to the public collection
+        request_body = sanitize_json(request.get_json())
+        if credentials.title == 'Employee' and isinstance(request_body, dict):
+            #setting the OG id of the record to edit and setting is edit to true
+            request_body["original_id"] = record_id
+            request_body["is_edit"] = True
+        try:
+            updated_record = resource.entity_class.from_json_object(request_body)
+        except Exception as e:
+            dao_response = ResponseCode(str(e))
+        else:
+            if not isinstance(updated_record, resource.entity_class):
+                dao_response = ResponseCode("InvalidRecord")
+            elif credentials.title == 'Manager':
+                dao_response = dao.update_record(str(record_id), request_body)
+            else:
+                request_body["original_id"] = ObjectId(record_id)
+                dao_response = dao.create_record(request_body)
+                if dao_response.get_success():
+                    dao_response = ResponseCode("PendingSuccess")
+    except Exception as e:
+        dao_response = ResponseCode(str(e))
+    finally:
+        dao.clear_credentials()
+    status_code, body = dao_response.to_http_response()
+    return json_response(body, status_code)
 
 
-@authentication_middleware #this does not work yet
-def update_trivia(trivia_id: str, credentials: Credentials):
+def approve_pending_record(resource: Resource, credentials: Credentials, id: str):
     """
-    (PUT /trivia/<trivia_id>) for updating or proposing an edit.
-    
-    The function validates the incoming JSON request body against the Trivia entity 
-    schema for all users. The target action is strictly determined by the authenticated
-    user's title:
+    Approves a pending record (POST /<type>/<id>/approve).
 
-    1.  **Manager ('Manager'):** Executes a direct `update_record` on the specified 
-        public trivia ID within the PublicTriviaDAO collection.
-    2.  **Employee ('Employee'):** Executes a `create_record` (submission) in the 
-        PrivateTriviaDAO collection. The request body is tagged with the original 
-        `trivia_id` (as 'original_id') and flagged as an edit (`is_edit=True`).
+    The pending record is either an edit or a new submission. It is added to
+    (or merged into) the public collection and deleted from the private
+    collection in a single transaction; see ApprovalService.
 
     Args:
-        trivia_id: The unique identifier (ID) of the public trivia targeted for update.
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to determine write authority.
+        resource: The Resource bound to the route.
+        credentials: The authenticated user's Credentials object.
+        id: The id of the record in the private collection.
 
     Returns:
         A tuple containing a JSON response body and an HTTP status code:
-        * (JSON body, 200): Successful **direct update** by a Manager.
-        * (JSON body, 202): Successful submission of a **pending edit proposal** by an Employee.
-        * (JSON body, 400): If the request body fails entity validation 
-        (`Trivia.from_json_object`) or is an otherwise invalid record.
-        * (JSON body, 401/500): If the user is unauthorized or if a database 
-        exception occurs during the DAO operation (translated via ResponseCode).
+        * (JSON body, 200): The record was approved; `data.public_id` is the
+        _id of the published (or edited) public record.
+        * (JSON body, 400/404): The pending record does not validate, or it or
+        the record it edits does not exist. Nothing is changed.
+        * (JSON body, 401): If the user is **not a Manager**.
     """
     logger=LoggerFactory.get_general_logger()
-    logger.debug("Update trivia")
-    request_body = request.get_json()
-    if credentials.title == 'Manager':
-        logger.debug("Update trivia as an Manager")
-        public_trivias_dao = get_dao_set_credentials(credentials, "PublicTriviaDAO")
-        #entity validation
-        try:
-            updated_trivia = Trivia.from_json_object(request_body)
-        except Exception as e:
-            #entity validation fails
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        #actual database update
-        if isinstance(updated_trivia, Trivia):
-            try:
-                print(trivia_id)
-                get_response = public_trivias_dao.get_by_fields({'_id': str(trivia_id)})
-                print(get_response)
-                dao_response = public_trivias_dao.update_record(str(trivia_id), request_body)
-                public_trivias_dao.clear_credentials()
-                status_code, body = dao_response.to_http_response()
-                return jsonify(body), status_code
-            except Exception as e:
-                public_trivias_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-        else:
-            public_trivias_dao.clear_credentials()
-            status_code, body = ResponseCode("InvalidRecord").to_http_response()
-            return jsonify(body), status_code
-    elif credentials.title == 'Employee':
-        logger.debug("Update trivia as employee")
-        private_trivias_dao = DAOFactory.get_dao('PrivateTriviaDAO')
-        private_trivias_dao.set_credentials(credentials)
-        #setting the OG id of the record to edit and setting is edit to true
-        request_body["original_id"] = trivia_id
-        request_body["is_edit"] = True
-        try:
-            new_edit = Trivia.from_json_object(request_body)
-        except Exception as e:
-            private_trivias_dao.clear_credentials()
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        if isinstance(new_edit, Trivia):
-            try:
-                #calling create record on the private database 
-                print(new_edit)
-                request_body["original_id"] = ObjectId(trivia_id)
-                dao_response = private_trivias_dao.create_record(request_body)
-                print(dao_response.get_data())
-                private_trivias_dao.clear_credentials()
-                status_code, body = ResponseCode("PendingSuccess").to_http_response()
-                return jsonify(body), status_code 
-            except Exception as e:
-                private_trivias_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-    else:
+    logger.debug("Approving a %s request", resource.label)
+    if credentials.title != "Manager":
         status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
+        return json_response(body, status_code)
+    approval_service = ApprovalService(resource.entity_class, get_dao_set_credentials(credentials, resource.public_dao),
+                                       get_dao_set_credentials(credentials, resource.private_dao))
+    dao_response = approval_service.approve(id)
+    status_code, body = dao_response.to_http_response()
+    return json_response(body, status_code)
 
 
-@authentication_middleware #this does not work yet
-def update_quote(quote_id: str, credentials: Credentials):
+def deny_pending_record(resource: Resource, credentials: Credentials, id: str):
     """
-    (PUT /quote/<quote_id>) for updating or proposing an edit.
-    
-    The function validates the incoming JSON request body against the quote entity 
-    schema for all users. The target action is strictly determined by the authenticated
-    user's title:
-
-    1.  **Manager ('Manager'):** Executes a direct `update_record` on the specified 
-        public quote ID within the PublicQuoteDAO collection.
-    2.  **Employee ('Employee'):** Executes a `create_record` (submission) in the 
-        PrivateQuoteDAO collection. The request body is tagged with the original 
-        `quote_id` (as 'original_id') and flagged as an edit (`is_edit=True`).
+    Denies a pending record (POST /<type>/<id>/deny); the record is deleted
+    from the private collection.
 
     Args:
-        quote_id: The unique identifier (ID) of the public quote targeted for update.
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to determine write authority.
+        resource: The Resource bound to the route.
+        credentials: The authenticated user's Credentials object.
+        id: The id of the record in the private collection.
 
     Returns:
         A tuple containing a JSON response body and an HTTP status code:
-        * (JSON body, 200): Successful **direct update** by a Manager.
-        * (JSON body, 202): Successful submission of a **pending edit proposal** by an Employee.
-        * (JSON body, 400): If the request body fails entity validation 
-        (`quote.from_json_object`) or is an otherwise invalid record.
-        * (JSON body, 401/500): If the user is unauthorized or if a database 
-        exception occurs during the DAO operation (translated via ResponseCode).
+        * (JSON body, 200): The pending record was deleted.
+        * (JSON body, 404): If it does not exist.
+        * (JSON body, 401): If the user is **not a Manager**.
     """
     logger=LoggerFactory.get_general_logger()
-    logger.debug("Update quote")
-    request_body = request.get_json()
-    if credentials.title == 'Manager':
-        logger.debug("Update quote as manager")
-        public_quotes_dao = get_dao_set_credentials(credentials, "PublicQuoteDAO")
-        #entity validation
-        try:
-            updated_quote = Quote.from_json_object(request_body)
-        except Exception as e:
-            #entity validation fails
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        #actual database update
-        if isinstance(updated_quote, Quote):
-            try:
-                print(quote_id)
-                get_response = public_quotes_dao.get_by_fields({'_id': str(quote_id)})
-                print(get_response)
-                dao_response = public_quotes_dao.update_record(str(quote_id), request_body)
-                public_quotes_dao.clear_credentials()
-                status_code, body = dao_response.to_http_response()
-                return jsonify(body), status_code
-            except Exception as e:
-                public_quotes_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-        else:
-            public_quotes_dao.clear_credentials()
-            status_code, body = ResponseCode("InvalidRecord").to_http_response()
-            return jsonify(body), status_code
-    elif credentials.title == 'Employee':
-        logger.debug("update quote as employee")
-        private_quotes_dao = DAOFactory.get_dao('PrivateQuoteDAO')
-        private_quotes_dao.set_credentials(credentials)
-        #setting the OG id of the record to edit and setting is edit to true
-        request_body["original_id"] = quote_id
-        request_body["is_edit"] = True
-        try:
-            new_edit = Quote.from_json_object(request_body)
-        except Exception as e:
-            private_quotes_dao.clear_credentials()
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        if isinstance(new_edit, Quote):
-            try:
-                #calling create record on the private database 
-                print(new_edit)
-                request_body["original_id"] = ObjectId(quote_id)
-                dao_response = private_quotes_dao.create_record(request_body)
-                print(dao_response.get_data())
-                private_quotes_dao.clear_credentials()
-                status_code, body = ResponseCode("PendingSuccess").to_http_response()
-                return jsonify(body), status_code 
-            except Exception as e:
-                private_quotes_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-    else:
+    logger.debug("Denying a %s request", resource.label)
+    if credentials.title != "Manager":
         status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-            
+        return json_response(body, status_code)
+    private_dao = get_dao_set_credentials(credentials, resource.private_dao)
+    try:
+        dao_response = private_dao.delete_record(id)
+    except Exception as e:
+        dao_response = ResponseCode(str(e))
+    finally:
+        private_dao.clear_credentials()
+    status_code, body = dao_response.to_http_response()
+    return json_response(body, status_code)
 
-@authentication_middleware #this does not work yet
-def update_bio(bio_id: str, credentials: Credentials):
-    """
-    (PUT /bio/<bio_id>) for updating or proposing an edit.
-    
-    The function validates the incoming JSON request body against the bio entity 
-    schema for all users. The target action is strictly determined by the authenticated
-    user's title:
 
-    1.  **Manager ('Manager'):** Executes a direct `update_record` on the specified 
-        public bio ID within the PublicBioDAO collection.
-    2.  **Employee ('Employee'):** Executes a `create_record` (submission) in the 
-        PrivateBioDAO collection. The request body is tagged with the original 
-        `bio_id` (as 'original_id') and flagged as an edit (`is_edit=True`).
+def retrieve_random_records(resource: Resource, credentials: Credentials, amount: int):
+    """
+    Returns random public records (GET /random-<type>/<amount>); `fields`
+    selects the returned fields.
 
     Args:
-        bio_id: The unique identifier (ID) of the public bio targeted for update.
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to determine write authority.
+        resource: The Resource bound to the route.
+        credentials: The authenticated user's Credentials object.
+        amount: The number of records to return.
 
     Returns:
         A tuple containing a JSON response body and an HTTP status code:
-        * (JSON body, 200): Successful **direct update** by a Manager.
-        * (JSON body, 202): Successful submission of a **pending edit proposal** by an Employee.
-        * (JSON body, 400): If the request body fails entity validation 
-        (`bio.from_json_object`) or is an otherwise invalid record.
-        * (JSON body, 401/500): If the user is unauthorized or if a database 
-        exception occurs during the DAO operation (translated via ResponseCode).
+        * (JSON string, 200): The random records.
+        * (JSON body, 401): If the user is not an Employee or a Manager.
     """
     logger=LoggerFactory.get_general_logger()
-    logger.debug("Update bio")
-    request_body = request.get_json()
-    if credentials.title == 'Manager':
-        logger.debug("Update as manager")
-        public_bios_dao = get_dao_set_credentials(credentials, "B")
-        #entity validation
-        try:
-            updated_bio = Bio.from_json_object(request_body)
-        except Exception as e:
-            #entity validation fails
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        #actual database update
-        if isinstance(updated_bio, Bio):
-            try:
-                print(bio_id)
-                get_response = public_bios_dao.get_by_fields({'_id': str(bio_id)})
-                print(get_response)
-                dao_response = public_bios_dao.update_record(str(bio_id), request_body)
-                public_bios_dao.clear_credentials()
-                status_code, body = dao_response.to_http_response()
-                return jsonify(body), status_code
-            except Exception as e:
-                public_bios_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-        else:
-            public_bios_dao.clear_credentials()
-            status_code, body = ResponseCode("InvalidRecord").to_http_response()
-            return jsonify(body), status_code
-    elif credentials.title == 'Employee':
-        logger.debug("Update as employee")
-        private_bios_dao = DAOFactory.get_dao('PrivateBioDAO')
-        private_bios_dao.set_credentials(credentials)
-        #setting the OG id of the record to edit and setting is edit to true
-        request_body["original_id"] = bio_id
-        request_body["is_edit"] = True
-        try:
-            new_edit = Bio.from_json_object(request_body)
-        except Exception as e:
-            private_bios_dao.clear_credentials()
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            return jsonify(body), status_code
-        if isinstance(new_edit, Bio):
-            try:
-                #calling create record on the private database 
-                print(new_edit)
-                request_body["original_id"] = ObjectId(bio_id)
-                dao_response = private_bios_dao.create_record(request_body)
-                print(dao_response.get_data())
-                private_bios_dao.clear_credentials()
-                status_code, body = ResponseCode("PendingSuccess").to_http_response()
-                return jsonify(body), status_code 
-            except Exception as e:
-                private_bios_dao.clear_credentials()
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                return jsonify(body), status_code
-    else:
+    logger.debug("Request a random %s", resource.label)
+    if credentials.title not in ("Manager", "Employee"):
         status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-
-
+        return json_response(body, status_code)
+    public_dao = get_dao_set_credentials(credentials, resource.public_dao)
+    try:
+        random_records = public_dao.get_random(amount, fields=split_fields_arg(request.args.to_dict()))
+    except Exception as e:
+        random_records = ResponseCode(str(e))
+    finally:
+        public_dao.clear_credentials()
+    if isinstance(random_records, ResponseCode):
+        status_code, body = random_records.to_http_response()
+        return json_response(body, status_code)
+    ResponseCode("GeneralSuccess", random_records)
+    return json_response(random_records)
 
-            
-            
 
-@authentication_middleware
-def retrieve_private_jokes_collection(credentials: Credentials):
+def bulk_import_records(resource: Resource, credentials: Credentials):
     """
-    Retrieves the collection of private (pending) joke proposals (GET /pending_jokes).
+    Creates many records (POST /<type>/bulk). The request body is a JSON
+    array or newline-delimited JSON; it is parsed as a stream, validated in
+    batches and written with unordered insert_many calls, so one bad record
+    does not stop the others.
 
-    This endpoint provides access to the private database collection, which stores
-    all proposed jokes and edits submitted by Employees that are pending review
-    by a Manager. Access is strictly controlled.
+    Managers write to the public collection. Employees write to the private
+    collection as proposals (`is_edit` is set to False on every record).
+
+    An optional `chunk_size` query argument (1 to MAX_BULK_CHUNK_SIZE) sets how
+    many documents are sent in one insert_many.
 
     Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
+        resource: The Resource bound to the route.
+        credentials: The authenticated user's Credentials object.
 
     Returns:
         A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the PrivateJokeDAO collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Retrieve all private jokes")
+        * (JSON body, 201): Every record was written.
+        * (JSON body, 207): Some records were written; `data.errors` lists the
+            index and reason of every record that was not. A JSON array that
+            is malformed part way through is reported here too, after the
+            records before the error were written.
+        * (JSON body, 400): No record was written, the body is a malformed JSON
+            array, or chunk_size is invalid.
+        * (JSON body, 401): The user title is not Manager or Employee.
+    """
+    logger = LoggerFactory.get_general_logger()
     if credentials.title == 'Manager':
-        private_jokes_dao = get_dao_set_credentials(credentials, "PrivateJokeDAO")
-        all_private_jokes = private_jokes_dao.get_all_records()
-        private_jokes_dao.clear_credentials()
-        json_string = dumps(all_private_jokes)
-        ResponseCode("GeneralSuccess", json_string)
-        return json_string, 200
+        dao = get_dao_set_credentials(credentials, resource.public_dao)
+        overrides = None
+    elif credentials.title == 'Employee':
+        dao = get_dao_set_credentials(credentials, resource.private_dao)
+        overrides = {"is_edit": False}
     else:
         status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
+        return json_response(body, status_code)
+    try:
+        chunk_size = int(request.args.get("chunk_size", DEFAULT_CHUNK_SIZE))
+    except ValueError:
+        chunk_size = 0
+    if not 0 < chunk_size <= MAX_BULK_CHUNK_SIZE:
+        status_code, body = ResponseCode("InvalidFilter", f"chunk_size must be between 1 and {MAX_BULK_CHUNK_SIZE}.").to_http_response()
+        return json_response(body, status_code)
+    logger.debug("Bulk import of %s in chunks of %d", resource.name, chunk_size)
+    dao_response = import_records(dao, resource.entity_class, iter_json_records(request.stream),
+                                  chunk_size=chunk_size, overrides=overrides)
+    status_code, body = dao_response.to_http_response()
+    return json_response(body, status_code)
 
 
-@authentication_middleware
-def retrieve_private_quotes_collection(credentials: Credentials):
+def moderate_records(resource: Resource, credentials: Credentials, action: str):
     """
-    Retrieves the collection of private (pending) quote proposals (GET /pending_quotes).
+    Shared body of the batch approve and deny handlers (POST /<type>/approve
+    and POST /<type>/deny). The request body is a JSON list of private IDs,
+    or an object with that list under "ids".
 
-    This endpoint provides access to the private database collection, which stores
-    all proposed quotes and edits submitted by Employees that are pending review
-    by a Manager. Access is strictly controlled.
+    Approving reads, validates and publishes every record together and then
+    removes them from the pending collection; denying removes them. Each ID
+    gets its own outcome, so one bad ID does not stop the others.
 
     Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
+        resource: The Resource bound to the route.
+        credentials: The authenticated user's Credentials object.
+        action: "approve" or "deny".
 
     Returns:
         A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the PrivatequoteDAO collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Retrieve all private quotes")
-    if credentials.title == 'Manager':
-        private_quotes_dao = get_dao_set_credentials(credentials, "PrivateQuoteDAO")
-        all_private_quotes = private_quotes_dao.get_all_records()
-        private_quotes_dao.clear_credentials()
-        json_string = dumps(all_private_quotes)
-        ResponseCode("GeneralSuccess", json_string)
-        return json_string, 200
-    else:
+        * (JSON body, 200): Every ID was approved (or denied).
+        * (JSON body, 207): Some were; `data.results` holds the outcome of
+            every ID in request order.
+        * (JSON body, 400): None were, or the body is not a list of ID strings.
+        * (JSON body, 401): If the user is **not a Manager**.
+    """
+    logger = LoggerFactory.get_general_logger()
+    if credentials.title != "Manager":
         status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-    
+        return json_response(body, status_code)
+    IDs = request.get_json(silent=True)
+    if isinstance(IDs, dict):
+        IDs = IDs.get("ids")
+    if not isinstance(IDs, list) or not all(isinstance(ID, str) for ID in IDs):
+        status_code, body = ResponseCode("MalformedContent", "Send a list of record IDs.").to_http_response()
+        return json_response(body, status_code)
+    logger.debug("Batch %s of %d %s", action, len(IDs), resource.name)
+    approval_service = ApprovalService(resource.entity_class, get_dao_set_credentials(credentials, resource.public_dao),
+                                       get_dao_set_credentials(credentials, resource.private_dao))
+    if action == "approve":
+        dao_response = approval_service.approve_many(IDs)
+    else:
+        dao_response = approval_service.deny_many(IDs)
+    status_code, body = dao_response.to_http_response()
+    return json_response(body, status_code)
 
 
-@authentication_middleware
-def retrieve_private_bios_collection(credentials: Credentials):
-    """
-    Retrieves the collection of private (pending) bio proposals (GET /pending_bios).
+def approve_pending_batch(resource: Resource, credentials: Credentials):
+    """Approves many pending records (POST /<type>/approve). See moderate_records."""
+    return moderate_records(resource, credentials, "approve")
 
-    This endpoint provides access to the private database collection, which stores
-    all proposed bios and edits submitted by Employees that are pending review
-    by a Manager. Access is strictly controlled.
 
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
+def deny_pending_batch(resource: Resource, credentials: Credentials):
+    """Denies many pending records (POST /<type>/deny). See moderate_records."""
+    return moderate_records(resource, credentials, "deny")
 
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the PrivatebioDAO collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Retrieve private bios")
-    if credentials.title == 'Manager':
-        private_bios_dao = get_dao_set_credentials(credentials, "PrivateBioDAO")
-        all_private_bios = private_bios_dao.get_all_records()
-        private_bios_dao.clear_credentials()
-        json_string = dumps(all_private_bios)
-        ResponseCode("GeneralSuccess", json_string)
-        return json_string, 200
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-    
+
+#The routes every resource gets: (rule, generic handler, view name, methods).
+#{name} and {label} are replaced by the resource's plural and singular names.
+RESOURCE_ROUTES = (
+    ("/{name}", retrieve_public_collection, "retrieve_public_{name}_collection", ["GET"]),
+    ("/pending-{name}", retrieve_private_collection, "retrieve_private_{name}_collection", ["GET"]),
+    ("/{name}", create_new_record, "create_a_new_{label}", ["POST"]),
+    ("/{name}/<string:record_id>", update_existing_record, "update_{label}", ["PUT"]),
+    ("/{name}/<string:id>/approve", approve_pending_record, "approve_{label}", ["POST"]),
+    ("/{name}/<string:id>/deny", deny_pending_record, "deny_{label}", ["POST"]),
+    ("/random-{name}/<int:amount>", retrieve_random_records, "retrieve_random_{label}", ["GET"]),
+    ("/{name}/bulk", bulk_import_records, "bulk_create_{name}", ["POST"]),
+    ("/{name}/approve", approve_pending_batch, "approve_{name}_batch", ["POST"]),
+    ("/{name}/deny", deny_pending_batch, "deny_{name}_batch", ["POST"]),
+)
 
 
 @authentication_middleware
-def retrieve_private_trivias_collection(credentials: Credentials):
+def retrieve_short_quote(credentials: Credentials, amount: int):
     """
-    Retrieves the collection of private (pending) trivia proposals (GET /pending_trivias).
+    Request a short quote (GET /short-quotes/<amt>).
 
-    This endpoint provides access to the private database collection, which stores
-    all proposed trivias and edits submitted by Employees that are pending review
-    by a Manager. Access is strictly controlled.
+    This endpoint allows the an employee to request a set of short records
+    (under 80 characters) from the public table.
 
     Args:
         credentials: The authenticated user's Credentials object, injected by
             the authentication_middleware, used to verify the user's title.
+        amount: The amount of short records
 
     Returns:
         A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the PrivateTriviaDAO collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
+        * (JSON string, 200): The short quotes.
+        * (JSON body, 401): If the user is not an Employee or a Manager.
     """
     logger=LoggerFactory.get_general_logger()
-    logger.debug("Retrieve private trivias")
-    if credentials.title == 'Manager':
-        private_trivias_dao = get_dao_set_credentials(credentials, "PrivateTriviaDAO")
-        all_private_trivias = private_trivias_dao.get_all_records()
-        private_trivias_dao.clear_credentials()
-        json_string = dumps(all_private_trivias)
-        ResponseCode("GeneralSuccess", json_string)
-        return json_string, 200
+    logger.debug("Request a short quote")
+    if credentials.title == "Manager" or credentials.title == "Employee":
+        public_quote_dao = get_dao_set_credentials(credentials, RESOURCES["quotes"].public_dao)
+        try:
+            short_quotes=public_quote_dao.get_short_record(amount, fields=split_fields_arg(request.args.to_dict()))
+            if isinstance(short_quotes, ResponseCode):
+                public_quote_dao.clear_credentials()
+                status_code, body = short_quotes.to_http_response()
+                return json_response(body, status_code)
+            ResponseCode("GeneralSuccess", short_quotes)
+            public_quote_dao.clear_credentials()
+            return json_response(short_quotes)
+        except Exception as e:
+            status_code, body = ResponseCode(str(e)).to_http_response()
+            public_quote_dao.clear_credentials()
+            return json_response(body, status_code)
     else:
         status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-    
-
+        return json_response(body, status_code)
 
 @authentication_middleware
-def approve_joke(credentials: Credentials, id: str):
+def retrieve_daily_quote(credentials: Credentials):
     """
-    Approves a pending joke (POST / jokes/<id>/aprove).
+    Request a daily quote (GET /daily-quotes).
 
-    This endpoint allows the manager to approve a pending joke in the private 
-    collection. The joke in the pending table is either an edit or a new submitted 
-    joke. The joke is added or updated in the public collection and then deleted 
-    in the private collection.
+    This endpoint allows an employee to request a daily quote from the public
+    table.
 
     Args:
         credentials: The authenticated user's Credentials object, injected by
             the authentication_middleware, used to verify the user's title.
-        id: The id of the record in the private collection.
 
     Returns:
         A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
+        * (JSON string, 200): Today's quote.
+        * (JSON body, 401): If the user is not an Employee or a Manager.
     """
     logger=LoggerFactory.get_general_logger()
-    logger.debug("Approving a joke request")
-    if credentials.title == "Manager":
-        # set credentials and database
-        private_jokes_dao = get_dao_set_credentials(credentials, "PrivateJokeDAO")
-        public_jokes_dao = get_dao_set_credentials(credentials, "PublicJokeDAO")
+    logger.debug("Retrieving daily quote")
+    if credentials.title == "Manager" or credentials.title == "Employee":
+        public_quotes_dao=get_dao_set_credentials(credentials, RESOURCES["quotes"].public_dao)
         try:
-            record=private_jokes_dao.get_by_key(id)
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_jokes_dao.clear_credentials()
-            private_jokes_dao.clear_credentials()
-            return jsonify(body), status_code
-        
-        # check if valid joke
-        try:
-            pending_joke=Joke.from_json_object(record)
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_jokes_dao.clear_credentials()
-            private_jokes_dao.clear_credentials()
-            return jsonify(body), status_code
-        # if pending joke is an edit
-        if pending_joke.is_edit == True:
-            original_id=pending_joke.ref_id
-            pending_joke.is_edit=None
-            pending_joke.ref_id=None
-            try:
-                public_jokes_dao.update_record(original_id,pending_joke.to_json_object())
-            except Exception as e:
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                public_jokes_dao.clear_credentials()
-                private_jokes_dao.clear_credentials()
-                return jsonify(body), status_code
-        # if pending joke isn't and edit
-        elif pending_joke.is_edit == False:
-            pending_joke.is_edit=None
-            try:
-                public_jokes_dao.create_record(pending_joke.to_json_object())
-            except Exception as e:
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                public_jokes_dao.clear_credentials()
-                private_jokes_dao.clear_credentials()
-                return jsonify(body), status_code
-        try:
-            dao_response=private_jokes_dao.delete_record(id)
-            status_code, body = dao_response.to_http_response()
-            public_jokes_dao.clear_credentials()
-            private_jokes_dao.clear_credentials()
-            return jsonify(body), status_code
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_jokes_dao.clear_credentials()
-            private_jokes_dao.clear_credentials()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-
-@authentication_middleware
-def deny_joke(credentials: Credentials, id: str):
-    """
-    Denies a pending joke (POST / jokes/<id>/aprove).
-
-    This endpoint allows the manager to deny a pending joke in the private 
-    collection. The joke in the pending table is either an edit or a new submitted 
-    joke. The joke deleted in the private collection.
-
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
-        id: The id of the record in the private collection.
-
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Denying a joke request")
-    if credentials.title == "Manager":
-        private_jokes_dao = get_dao_set_credentials(credentials, "PrivateJokeDAO")
-        try:
-            dao_response=private_jokes_dao.delete_record(id)
-            status_code, body = dao_response.to_http_response()
-            private_jokes_dao.clear_credentials()
-            return jsonify(body), status_code
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            private_jokes_dao.clear_credentials()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-    
-
-@authentication_middleware
-def approve_quote(credentials: Credentials, id: str):
-    """
-    Approves a pending quote (POST / quotes/<id>/aprove).
-
-    This endpoint allows the manager to approve a pending record in the private 
-    collection. The record in the pending table is either an edit or a new submitted 
-    record. The record is added or updated in the public collection and then deleted 
-    in the private collection.
-
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
-        id: The id of the record in the private collection.
-
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Approving a quote request")
-    if credentials.title == "Manager":
-        # set credentials and database
-        private_quotes_dao = get_dao_set_credentials(credentials, "PrivateQuoteDAO")
-        public_quotes_dao = get_dao_set_credentials(credentials, "PublicQuoteDAO")
-        try:
-            record=private_quotes_dao.get_by_key(id)
+            random_quote=public_quotes_dao.get_quote_of_day()
+            ResponseCode("GeneralSuccess", random_quote.get_data())
+            public_quotes_dao.clear_credentials()
+            return json_response(random_quote.get_data())
         except Exception as e:
             status_code, body = ResponseCode(str(e)).to_http_response()
             public_quotes_dao.clear_credentials()
-            private_quotes_dao.clear_credentials()
-            return jsonify(body), status_code
-        
-        # Check if valid quote
-        try:
-            pending_quote=Quote.from_json_object(record)
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_quotes_dao.clear_credentials()
-            private_quotes_dao.clear_credentials()
-            return jsonify(body), status_code
-        # if pending quote is an edit
-        if pending_quote.is_edit == True:
-            original_id=pending_quote.ref_id
-            pending_quote.is_edit=None
-            pending_quote.ref_id=None
-            try:
-                public_quotes_dao.update_record(original_id,pending_quote.to_json_object())
-            except Exception as e:
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                public_quotes_dao.clear_credentials()
-                private_quotes_dao.clear_credentials()
-                return jsonify(body), status_code
-        # if pending quote isn't and edit
-        elif pending_quote.is_edit == False:
-            pending_quote.is_edit=None
-            try:
-                public_quotes_dao.create_record(pending_quote.to_json_object())
-            except Exception as e:
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                public_quotes_dao.clear_credentials()
-                private_quotes_dao.clear_credentials()
-                return jsonify(body), status_code
-        try:
-            dao_response=private_quotes_dao.delete_record(id)
-            status_code, body = dao_response.to_http_response()
-            public_quotes_dao.clear_credentials()
-            private_quotes_dao.clear_credentials()
-            return jsonify(body), status_code
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_quotes_dao.clear_credentials()
-            private_quotes_dao.clear_credentials()
-            return jsonify(body), status_code
+            return json_response(body, status_code)
     else:
         status_code, body = ResponseCode("Unauthorized").to_http_response()
-        public_quotes_dao.clear_credentials()
-        private_quotes_dao.clear_credentials()
-        return jsonify(body), status_code
-
-@authentication_middleware
-def deny_quote(credentials: Credentials, id: str):
-    """
-    Deny a pending quote (POST / quotes/<id>/aprove).
+        return json_response(body, status_code)
+
+
+#Every content type served by the API. RECORD_TYPES holds the entity and DAO names of each
+RESOURCES = {
+    "jokes": Resource("jokes", "joke", *RECORD_TYPES["jokes"]),
+    "quotes": Resource("quotes", "quote", *RECORD_TYPES["quotes"], extra_routes=(
+        ("/short-quotes/<int:amount>", retrieve_short_quote, ["GET"]),
+        ("/daily-quotes", retrieve_daily_quote, ["GET"]),
+    )),
+    "trivias": Resource("trivias", "trivia", *RECORD_TYPES["trivias"]),
+    "bios": Resource("bios", "bio", *RECORD_TYPES["bios"]),
+}
+
+#Module-level names of the generated views, kept for imports and tests
+_JOKES, _QUOTES, _TRIVIAS, _BIOS = (RESOURCES[name].views for name in ("jokes", "quotes", "trivias", "bios"))
+retrieve_public_jokes_collection = _JOKES["retrieve_public_jokes_collection"]
+retrieve_private_jokes_collection = _JOKES["retrieve_private_jokes_collection"]
+create_a_new_joke = _JOKES["create_a_new_joke"]
+update_joke = _JOKES["update_joke"]
+approve_joke = _JOKES["approve_joke"]
+deny_joke = _JOKES["deny_joke"]
+retrieve_random_joke = _JOKES["retrieve_random_joke"]
+bulk_create_jokes = _JOKES["bulk_create_jokes"]
+approve_jokes_batch = _JOKES["approve_jokes_batch"]
+deny_jokes_batch = _JOKES["deny_jokes_batch"]
+
+retrieve_public_quotes_collection = _QUOTES["retrieve_public_quotes_collection"]
+retrieve_private_quotes_collection = _QUOTES["retrieve_private_quotes_collection"]
+create_a_new_quote = _QUOTES["create_a_new_quote"]
+update_quote = _QUOTES["update_quote"]
+approve_quote = _QUOTES["approve_quote"]
+deny_quote = _QUOTES["deny_quote"]
+retrieve_random_quote = _QUOTES["retrieve_random_quote"]
+bulk_create_quotes = _QUOTES["bulk_create_quotes"]
+approve_quotes_batch = _QUOTES["approve_quotes_batch"]
+deny_quotes_batch = _QUOTES["deny_quotes_batch"]
+
+retrieve_public_trivia_collection = _TRIVIAS["retrieve_public_trivias_collection"]
+retrieve_private_trivias_collection = _TRIVIAS["retrieve_private_trivias_collection"]
+create_a_new_trivia = _TRIVIAS["create_a_new_trivia"]
+update_trivia = _TRIVIAS["update_trivia"]
+approve_trivia = _TRIVIAS["approve_trivia"]
+deny_trivia = _TRIVIAS["deny_trivia"]
+retrieve_random_trivia = _TRIVIAS["retrieve_random_trivia"]
+bulk_create_trivias = _TRIVIAS["bulk_create_trivias"]
+approve_trivias_batch = _TRIVIAS["approve_trivias_batch"]
+deny_trivias_batch = _TRIVIAS["deny_trivias_batch"]
+
+retrieve_public_bios_collection = _BIOS["retrieve_public_bios_collection"]
+retrieve_private_bios_collection = _BIOS["retrieve_private_bios_collection"]
+create_a_new_bio = _BIOS["create_a_new_bio"]
+update_bio = _BIOS["update_bio"]
+approve_bio = _BIOS["approve_bio"]
+deny_bio = _BIOS["deny_bio"]
+retrieve_random_bio = _BIOS["retrieve_random_bio"]
+bulk_create_bios = _BIOS["bulk_create_bios"]
+approve_bios_batch = _BIOS["approve_bios_batch"]
+deny_bios_batch = _BIOS["deny_bios_batch"]
 
-    This endpoint allows the manager to deny a pending record in the private 
-    collection. The record in the pending table is either an edit or a new submitted 
-    record. The record is deleted in the private collection.
 
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
-        id: The id of the record in the private collection.
-
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Deny a quote request")
-    if credentials.title == "Manager":
-        private_quotes_dao = get_dao_set_credentials(credentials, "PrivateQuoteDAO")
-        try:
-            dao_response=private_quotes_dao.delete_record(id)
-            status_code, body = dao_response.to_http_response()
-            private_quotes_dao.clear_credentials()
-            return jsonify(body), status_code
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            private_quotes_dao.clear_credentials()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-
-
-
-@authentication_middleware
-def approve_trivia(credentials: Credentials, id: str):
-    """
-    Approves a pending trivia (POST / trivia/<id>/aprove).
-
-    This endpoint allows the manager to approve a pending record in the private 
-    collection. The record in the pending table is either an edit or a new submitted 
-    record. The record is added or updated in the public collection and then deleted 
-    in the private collection.
-
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
-        id: The id of the record in the private collection.
-
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Approving a trivia request")
-    if credentials.title == "Manager":
-        # set credentials and database
-        private_trivias_dao = get_dao_set_credentials(credentials, "PrivateTriviaDAO")
-        public_trivias_dao = get_dao_set_credentials(credentials, "PublicTriviaDAO")
-        try:
-            record=private_trivias_dao.get_by_key(id)
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_trivias_dao.clear_credentials()
-            private_trivias_dao.clear_credentials()
-            return jsonify(body), status_code
-        
-        # Check if valid trivia
-        try:
-            pending_trivia=Trivia.from_json_object(record)
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_trivias_dao.clear_credentials()
-            private_trivias_dao.clear_credentials()
-            return jsonify(body), status_code
-        # if pending trivia is an edit
-        if pending_trivia.is_edit == True:
-            original_id=pending_trivia.ref_id
-            pending_trivia.is_edit=None
-            pending_trivia.ref_id=None
-            try:
-                public_trivias_dao.update_record(original_id,pending_trivia.to_json_object())
-            except Exception as e:
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                public_trivias_dao.clear_credentials()
-                private_trivias_dao.clear_credentials()
-                return jsonify(body), status_code
-        # if pending trivia isn't and edit
-        elif pending_trivia.is_edit == False:
-            pending_trivia.is_edit=None
-            try:
-                public_trivias_dao.create_record(pending_trivia.to_json_object())
-            except Exception as e:
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                public_trivias_dao.clear_credentials()
-                private_trivias_dao.clear_credentials()
-                return jsonify(body), status_code
-        try:
-            dao_response=private_trivias_dao.delete_record(id)
-            status_code, body = dao_response.to_http_response()
-            public_trivias_dao.clear_credentials()
-            private_trivias_dao.clear_credentials()
-            return jsonify(body), status_code
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_trivias_dao.clear_credentials()
-            private_trivias_dao.clear_credentials()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        public_trivias_dao.clear_credentials()
-        private_trivias_dao.clear_credentials()
-        return jsonify(body), status_code
-
-@authentication_middleware
-def deny_trivia(credentials: Credentials, id: str):
-    """
-    Deny a pending trivia (POST / trivia/<id>/aprove).
-
-    This endpoint allows the manager to approve a pending record in the private 
-    collection. The record in the pending table is either an edit or a new submitted 
-    record. The record is added or updated in the public collection and then deleted 
-    in the private collection.
-
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
-        id: The id of the record in the private collection.
-
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Deny a trivia request")
-    if credentials.title == "Manager":
-        private_trivias_dao = get_dao_set_credentials(credentials, "PrivateTriviaDAO")
-        try:
-            dao_response=private_trivias_dao.delete_record(id)
-            status_code, body = dao_response.to_http_response()
-            private_trivias_dao.clear_credentials()
-            return jsonify(body), status_code
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            private_trivias_dao.clear_credentials()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-    
-
-@authentication_middleware
-def approve_bio(credentials: Credentials, id: str):
-    """
-    Deny a pending bio (POST / bio/<id>/aprove).
-
-    This endpoint allows the manager to approve a pending record in the private 
-    collection. The record in the pending table is either an edit or a new submitted 
-    record. The record is added or updated in the public collection and then deleted 
-    in the private collection.
-
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
-        id: The id of the record in the private collection.
-
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Approve a bio request")
-    if credentials.title == "Manager":
-        # set credentials and database
-        private_bios_dao = get_dao_set_credentials(credentials, "PrivateBioDAO")
-        public_bios_dao = get_dao_set_credentials(credentials, "PublicBioDAO")
-        try:
-            record=private_bios_dao.get_by_key(id)
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_bios_dao.clear_credentials()
-            private_bios_dao.clear_credentials()
-            return jsonify(body), status_code
-        
-        # Check if valid bio
-        try:
-            pending_bio=Bio.from_json_object(record)
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_bios_dao.clear_credentials()
-            private_bios_dao.clear_credentials()
-            return jsonify(body), status_code
-        # if pending bio is an edit
-        if pending_bio.is_edit == True:
-            original_id=pending_bio.ref_id
-            pending_bio.is_edit=None
-            pending_bio.ref_id=None
-            try:
-                public_bios_dao.update_record(original_id,pending_bio.to_json_object())
-            except Exception as e:
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                public_bios_dao.clear_credentials()
-                private_bios_dao.clear_credentials()
-                return jsonify(body), status_code
-        # if pending bio isn't and edit
-        elif pending_bio.is_edit == False:
-            pending_bio.is_edit=None
-            try:
-                public_bios_dao.create_record(pending_bio.to_json_object())
-            except Exception as e:
-                status_code, body = ResponseCode(str(e)).to_http_response()
-                public_bios_dao.clear_credentials()
-                private_bios_dao.clear_credentials()
-                return jsonify(body), status_code
-        try:
-            dao_response=private_bios_dao.delete_record(id)
-            status_code, body = dao_response.to_http_response()
-            public_bios_dao.clear_credentials()
-            private_bios_dao.clear_credentials()
-            return jsonify(body), status_code
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_bios_dao.clear_credentials()
-            private_bios_dao.clear_credentials()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        public_bios_dao.clear_credentials()
-        private_bios_dao.clear_credentials()
-        return jsonify(body), status_code
-
-@authentication_middleware
-def deny_bio(credentials: Credentials, id: str):
-    """
-    Deny a pending bio (POST / bio/<id>/aprove).
-
-    This endpoint allows the manager to approve a pending record in the private 
-    collection. The record in the pending table is either an edit or a new submitted 
-    record. The record is added or updated in the public collection and then deleted 
-    in the private collection.
-
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
-        id: The id of the record in the private collection.
-
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Deny a bio request")
-    if credentials.title == "Manager":
-        private_bios_dao = get_dao_set_credentials(credentials, "PrivateBioDAO")
-        try:
-            dao_response=private_bios_dao.delete_record(id)
-            status_code, body = dao_response.to_http_response()
-            private_bios_dao.clear_credentials()
-            return jsonify(body), status_code
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            private_bios_dao.clear_credentials()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-
-
-@authentication_middleware
-def retrieve_random_joke(credentials: Credentials, amount: int):
-    """
-    Request a random joke (Get / random-jokes/<amt>).
-
-    This endpoint allows the an employee to request a set of random records from
-    the public collection. 
-
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
-        amount: The amount of random records
-
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Request a random joke")
-    if credentials.title == "Manager" or credentials.title == "Employee":
-        public_jokes_dao = get_dao_set_credentials(credentials, "PublicJokeDAO")
-        try:
-            random_jokes=public_jokes_dao.get_random(amount)
-            json_string = dumps(random_jokes)
-            ResponseCode("GeneralSuccess", json_string)
-            public_jokes_dao.clear_credentials()
-            return json_string, 200
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_jokes_dao.clear_credentials()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-    
-
-@authentication_middleware
-def retrieve_random_quote(credentials: Credentials, amount: int):
-    """
-    Request a random quote (Get / random-quotes/<amt>).
-
-    This endpoint allows the an employee to request a set of random records from
-    the public collection. 
-
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
-        amount: The amount of random records
-
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    if credentials.title == "Manager" or credentials.title == "Employee":
-        public_quotes_dao = get_dao_set_credentials(credentials, "PublicQuoteDAO")
-        try:
-            random_quotes=public_quotes_dao.get_random(amount)
-            json_string = dumps(random_quotes)
-            ResponseCode("GeneralSuccess", json_string)
-            public_quotes_dao.clear_credentials()
-            return json_string, 200
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_quotes_dao.clear_credentials()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-    
-
-
-@authentication_middleware
-def retrieve_random_trivia(credentials: Credentials, amount: int):
-    """
-    Request a random trivia (Get / random-trivia/<amt>).
-
-    This endpoint allows the an employee to request a set of random records from
-    the public collection. 
-
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
-        amount: The amount of random records
-
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    if credentials.title == "Manager" or credentials.title == "Employee":
-        public_trivias_dao = get_dao_set_credentials(credentials, "PublicTriviaDAO")
-        try:
-            random_trivias=public_trivias_dao.get_random(amount)
-            json_string = dumps(random_trivias)
-            ResponseCode("GeneralSuccess", json_string)
-            public_trivias_dao.clear_credentials()
-            return json_string, 200
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_trivias_dao.clear_credentials()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-    
-
-@authentication_middleware
-def retrieve_random_bio(credentials: Credentials, amount: int):
-    """
-    Request a random bio (Get / random-bios/<amt>).
-
-    This endpoint allows the an employee to request a set of random records from
-    the public collection. 
-
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
-        amount: The amount of random records
-
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    if credentials.title == "Manager" or credentials.title == "Employee":
-        public_bios_dao = get_dao_set_credentials(credentials, "PublicBioDAO")
-        try:
-            random_bios=public_bios_dao.get_random(amount)
-            json_string = dumps(random_bios)
-            ResponseCode("GeneralSuccess", json_string)
-            public_bios_dao.clear_credentials()
-            return json_string, 200
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_bios_dao.clear_credentials()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-
-
-@authentication_middleware
-def retrieve_short_quote(credentials: Credentials, amount: int):
-    """
-    Request a short joke (Get / short-jokes/<amt>).
-
-    This endpoint allows the an employee to request a set of short records
-    (under 80 characters) from the public table.
-
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
-        amount: The amount of short records
-
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Request a short joke")
-    if credentials.title == "Manager" or credentials.title == "Employee":
-        public_quote_dao = get_dao_set_credentials(credentials, "PublicQuoteDAO")
-        try:
-            short_quotes=public_quote_dao.get_short_record(amount)
-            json_string = dumps(short_quotes)
-            ResponseCode("GeneralSuccess", json_string)
-            public_quotes_dao.clear_credentials()
-            return json_string, 200
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_jokes_dao.clear_credentials()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-#quotes
-@authentication_middleware
-def retrieve_public_quotes_collection(credentials: Credentials):
-    """
-    Retrieves the public quote collection and returns it as a http response
-    (GET /quotes)
-
-
-    This endpoint is accessible to any authenticated user (employee or manager)
-    and returns all records stored in the PublicQuotesDAO collection. It handles
-    serialization of MongoDB records (including BSON types like ObjectId) to a 
-    valid JSON string.
-
-    Args:
-        credentials: The authenticated user's credentials object, injected by
-        the authentication_middleware.
-
-    Returns:
-        A tuple containing:
-        * The JSON string representation of all public quotes and a 200 HTTP status code, if the user is authenticated.
-        * A tuple containing a JSON error response and a 401 HTTP status code, if the user is unauthorized 
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Retrieving public quotes")
-    if credentials.title == 'Employee' or credentials.title == 'Manager':
-        public_quotes_dao = get_dao_set_credentials(credentials, "PublicQuoteDAO")
-
-        filter_dict = request.args.to_dict()
-        if filter_dict:
-            type_safe_filter = convert_filter_types(filter_dict)
-            if type_safe_filter:
-                all_quotes = public_quotes_dao.get_by_fields(type_safe_filter)
-            else:
-                all_quotes = []
-                public_quotes_dao.clear_credentials()
-                status_code, body = ResponseCode("InvalidFilter").to_http_response()
-                return jsonify(body), status_code 
-        else:
-            all_quotes = public_quotes_dao.get_all_records()
-
-        public_quotes_dao.clear_credentials()
-        json_string = dumps(all_quotes)
-        ResponseCode("GeneralSuccess", json_string)
-        return json_string, 200
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-
-@authentication_middleware
-def retrieve_daily_quote(credentials: Credentials):
-    """
-    Request a daily quote (Get / daily-quotes).
-
-    This endpoint allows an employee to request a daily quote from the public
-    table.
-
-    Args:
-        credentials: The authenticated user's Credentials object, injected by
-            the authentication_middleware, used to verify the user's title.
-
-    Returns:
-        A tuple containing a JSON response body and an HTTP status code:
-        * (JSON string, 200): If the user is a **Manager**, returns a JSON string
-        containing all records from the Private collection.
-        * (JSON body, 401): If the user is **not a Manager** (e.g., an Employee or
-        any other role), returns an "Unauthorized" error response.
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Retrieving daily quote")
-    if credentials.title == "Manager" or credentials.title == "Employee":
-        public_quotes_dao=get_dao_set_credentials(credentials, "PublicQuoteDAO")
-        try:
-            random_quote=public_quotes_dao.get_quote_of_day()
-            print(f"HERE IS THE TYPE: {type(random_quote.get_data())}")
-            json_string=dumps(random_quote.get_data())
-            ResponseCode("GeneralSuccess", json_string)
-            public_quotes_dao.clear_credentials()
-            return json_string, 200
-        except Exception as e:
-            status_code, body = ResponseCode(str(e)).to_http_response()
-            public_quotes_dao.clear_credentials()
-            return jsonify(body), status_code
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-
-#trivia
-@authentication_middleware
-def retrieve_public_trivia_collection(credentials: Credentials):
-    """
-    Retrieves the public trivia collection and returns it as a http response
-    (GET /trivias)
-
-    This endpoint is accessible to any authenticated user (employee or manager)
-    and returns all records stored in the PublicTriviaDAO collection. It handles
-    serialization of MongoDB records (including BSON types like ObjectId) to a 
-    valid JSON string.
-
-    Args:
-        credentials: The authenticated user's credentials object, injected by
-        the authentication_middleware.
-
-    Returns:
-        A tuple containing:
-        * The JSON string representation of all public quotes and a 200 HTTP status code, if the user is authenticated.
-        * A tuple containing a JSON error response and a 401 HTTP status code, if the user is unauthorized 
-    """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Retrieving public trivia collection")
-    if credentials.title == 'Employee' or credentials.title == 'Manager':
-        public_trivias_dao = get_dao_set_credentials(credentials, "PublicTriviaDAO")
-        
-        filter_dict = request.args.to_dict()
-        if filter_dict:
-            type_safe_filter = convert_filter_types(filter_dict)
-            if type_safe_filter:
-                all_trivia = public_trivias_dao.get_by_fields(type_safe_filter)
-            else:
-                all_trivia = []
-                public_trivias_dao.clear_credentials()
-                status_code, body = ResponseCode("InvalidFilter").to_http_response()
-                return jsonify(body), status_code 
-        else:
-            all_trivia = public_trivias_dao.get_all_records()
-
-        public_trivias_dao.clear_credentials()
-        json_string = dumps(all_trivia)
-        ResponseCode("GeneralSuccess", json_string)
-        return json_string, 200
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-
-
-#bios
-@authentication_middleware
-def retrieve_public_bios_collection(credentials: Credentials):
+def establish_all_daos():
     """
-    Retrieves the public bios collection and returns it as a http response
-    (GET /bios)
-
-    This endpoint is accessible to any authenticated user (employee or manager)
-    and returns all records stored in the PublicBiosDAO collection. It handles
-    serialization of MongoDB records (including BSON types like ObjectId) to a 
-    valid JSON string.
-
-    Args:
-        credentials: The authenticated user's credentials object, injected by
-        the authentication_middleware.
-
-    Returns:
-        A tuple containing:
-        * The JSON string representation of all public quotes and a 200 HTTP status code, if the user is authenticated.
-        * A tuple containing a JSON error response and a 401 HTTP status code, if the user is unauthorized 
+    Creates the DAOs of every resource once and binds them to the resource,
+    so request handlers use them directly instead of looking them up by name.
     """
-    logger=LoggerFactory.get_general_logger()
-    logger.debug("Retrieve bios collection")
-    if credentials.title == 'Employee' or credentials.title == 'Manager':
-        public_bios_dao = get_dao_set_credentials(credentials, "PublicBioDAO")
-        
-        filter_dict = request.args.to_dict()
-        if filter_dict:
-            type_safe_filter = convert_filter_types(filter_dict)
-            if type_safe_filter:
-                all_bios = public_bios_dao.get_by_fields(type_safe_filter)
-            else:
-                all_bios = []
-                public_bios_dao.clear_credentials()
-                status_code, body = ResponseCode("InvalidFilter").to_http_response()
-                return jsonify(body), status_code 
-        else:
-            all_bios = public_bios_dao.get_all_records()
-        
-        public_bios_dao.clear_credentials()
-        json_string = dumps(all_bios)
-        ResponseCode("GeneralSuccess", json_string)
-        return json_string, 200
-    else:
-        status_code, body = ResponseCode("Unauthorized").to_http_response()
-        return jsonify(body), status_code
-
-
-def establish_all_daos():
-
-    global public_jokes_dao
-    global private_jokes_dao
-
-    global public_quotes_dao
-    global private_quotes_dao
-
-    global public_trivias_dao
-    global private_trivias_dao
-
-    global public_bios_dao
-    global private_bios_dao
     try:
-        public_jokes_dao = DAOFactory.create_dao("PublicJokeDAO", DATABASE_NAME)
-        private_jokes_dao = DAOFactory.create_dao("PrivateJokeDAO", DATABASE_NAME)
-
-        public_quotes_dao = DAOFactory.create_dao("PublicQuoteDAO", DATABASE_NAME)
-        private_quotes_dao = DAOFactory.create_dao("PrivateQuoteDAO", DATABASE_NAME)
-
-        public_bios_dao = DAOFactory.create_dao("PublicBioDAO", DATABASE_NAME)
-        private_bios_dao = DAOFactory.create_dao("PrivateBioDAO", DATABASE_NAME)
+        for resource in RESOURCES.values():
+            resource.bind(DAOFactory.create_dao(resource.public_dao_name, DATABASE_NAME),
+                          DAOFactory.create_dao(resource.private_dao_name, DATABASE_NAME))
+    except Exception as e:
+        raise RuntimeError(f"Issue creating DAOs: {e}") from e
 
-        public_trivias_dao = DAOFactory.create_dao("PublicTriviaDAO", DATABASE_NAME)
-        private_trivias_dao = DAOFactory.create_dao("PrivateTriviaDAO", DATABASE_NAME)
-        print("created")
-    except Exception as RuntimeError:
-        raise ResponseCode("Issue Creating DAOs", RuntimeError)
-    
-        
 
 def create_app():
     """Application factory: initializes Flask app and external resources."""
@@ -1979,223 +912,32 @@ def create_app():
     try:
         create_client_connection()
         establish_all_daos()
+        ensure_database_indexes()
     except Exception as e:
         print(f"CRITICAL SHUTDOWN: Failed to initialize application resources: {e}")
         raise
-    
-    app.add_url_rule(
-        "/jokes", 
-        view_func=retrieve_public_jokes_collection, 
-        methods=["GET"],
-        provide_automatic_options=False
-    )
-    app.add_url_rule(
-        "/pending-jokes",
-        view_func=retrieve_private_jokes_collection,
-        methods=["GET"],
-        provide_automatic_options=False
-    )
-    app.add_url_rule(
-        "/jokes", 
-        view_func=create_a_new_joke, 
-        methods=["POST"],
-        provide_automatic_options=False
-    )
-    app.add_url_rule(
-        "/jokes/<string:joke_id>", 
-        view_func=update_joke, 
-        methods=["PUT"],
-        provide_automatic_options=False
-    )
-    app.add_url_rule(
-        "/jokes/<string:id>/approve",
-        view_func=approve_joke,
-        methods=["POST"],
-        provide_automatic_options=False
-    )
-    app.add_url_rule(
-        "/jokes/<string:id>/deny",
-        view_func=deny_joke,
-        methods=["POST"],
-        provide_automatic_options=False
-    )
-    app.add_url_rule(
-        "/random-jokes/<int:amount>",
-        view_func=retrieve_random_joke,
-        methods=['GET'],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/short-quotes/<int:amount>",
-        view_func=retrieve_short_quote,
-        methods=['GET'],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/quotes",
-        view_func=retrieve_public_quotes_collection,
-        methods=["GET"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/quotes", 
-        view_func=create_a_new_quote, 
-        methods=["POST"],
-        provide_automatic_options=False
-
-    )
-
-    app.add_url_rule(
-        "/quotes/<string:quote_id>", 
-        view_func=update_quote, 
-        methods=["PUT"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/quotes/<string:id>/approve",
-        view_func=approve_quote,
-        methods=["POST"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/quotes/<string:id>/deny",
-        view_func=deny_quote,
-        methods=["POST"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/pending-quotes",
-        view_func=retrieve_private_quotes_collection,
-        methods=["GET"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/random-quotes/<int:amount>",
-        view_func=retrieve_random_quote,
-        methods=['GET'],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/daily-quotes",
-        view_func=retrieve_daily_quote,
-        methods=["GET"],
-        provide_automatic_options=False        
-    )
-    app.add_url_rule(
-        "/trivias",
-        view_func=retrieve_public_trivia_collection,
-        methods=["GET"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/trivias", 
-        view_func=create_a_new_trivia, 
-        methods=["POST"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/trivias/<string:trivia_id>", 
-        view_func=update_trivia, 
-        methods=["PUT"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/trivias/<string:id>/approve",
-        view_func=approve_trivia,
-        methods=["POST"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/trivias/<string:id>/deny",
-        view_func=deny_trivia,
-        methods=["POST"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/pending-trivias",
-        view_func=retrieve_private_trivias_collection,
-        methods=["GET"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/random-trivias/<int:amount>",
-        view_func=retrieve_random_trivia,
-        methods=['GET'],
-        provide_automatic_options=False
-    )
-
- 
-    app.add_url_rule(
-        "/bios",
-        view_func=retrieve_public_bios_collection,
-        methods=["GET"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/bios", 
-        view_func=create_a_new_bio, 
-        methods=["POST"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/bios/<string:bio_id>", 
-        view_func=update_bio, 
-        methods=["PUT"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/bios/<string:id>/approve",
-        view_func=approve_bio,
-        methods=["POST"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/bios/<string:id>/deny",
-        view_func=deny_bio,
-        methods=["POST"],
-        provide_automatic_options=False
-    )
-
-    app.add_url_rule(
-        "/pending-bios",
-        view_func=retrieve_private_bios_collection,
-        methods=["GET"],
-        provide_automatic_options=False
-    )
-    
-    app.add_url_rule(
-        "/random-bios/<int:amount>",
-        view_func=retrieve_random_bio,
-        methods=['GET'],
-        provide_automatic_options=False
-    )
 
+    app.before_request(begin_request_log_context)
+    app.after_request(finish_request_log_context)
+    app.teardown_request(clear_request_log_context)
 
+    for resource in RESOURCES.values():
+        for rule, view_func, methods in resource.routes:
+            app.add_url_rule(
+                rule,
+                view_func=view_func,
+                methods=methods,
+                provide_automatic_options=False
+            )
 
     return app
 
+
 def run(): 
     port = 8080
     print(f"Server running on port {port}")
-    app.run(host='0.0.0.0', port=port)
+    # DAOs are bound to credentials per request, so requests can be served concurrently
+    app.run(host='0.0.0.0', port=port, threaded=True)
 
 if __name__ == "__main__":
     app = create_app()
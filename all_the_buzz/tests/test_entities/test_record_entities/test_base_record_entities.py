@@ -93,4 +93,15 @@ def test_setters_work_as_expected():
     assert record.id == "1" * 24
     assert record.ref_id == None
     assert record.language == "french"
-    assert record.is_edit is False
\ No newline at end of file
+    assert record.is_edit is False
+# ----- Test ObjectId validation -----
+@pytest.mark.parametrize("bad_id", ["0x" + "1" * 22, "1_" + "1" * 22, " " + "1" * 23, "+" + "1" * 23, "g" * 24])
+def test_id_must_be_plain_hexadecimal(bad_id):
+    with pytest.raises(ValueError, match="Invalid Record ID"):
+        DummyRecord(id=bad_id)
+
+def test_hexadecimal_test():
+    record = DummyRecord()
+    assert record.hexadecimal_test("abcDEF0123")
+    assert not record.hexadecimal_test("0x12")
+    assert not record.hexadecimal_test("")
@@ -0,0 +1,105 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import random
+import pytest
+from bson.objectid import ObjectId
+from all_the_buzz.entities import Joke, Trivia, Quote, Bio
+from all_the_buzz.entities.batch_validation import get_batch_validator
+
+"""
+Unit tests for the batch validators in: all_the_buzz/entities/batch_validation.py
+Every batch result is compared with building the entities one by one.
+"""
+
+def _assert_matches_entities(entity_class, rows):
+    result = get_batch_validator(entity_class).validate(rows)
+    valid = dict(zip(result.indexes, result.documents))
+    for index, row in enumerate(rows):
+        try:
+            expected = entity_class.from_json_object(row).to_json_object()
+        except ValueError as e:
+            assert index in result.errors, (row, str(e))
+            assert str(e) in result.errors[index]
+            continue
+        assert index not in result.errors, (row, result.errors.get(index))
+        assert valid[index] == expected
+
+_ANY_VALUES = [None, 1, 2, 3, 4, True, "", "  ", "text", "<b>html</b>", "x" * 1001, [], {}, 1.5]
+_IDS = [None, "1" * 24, "g" * 24, "1" * 23, ObjectId("6512bd43d9caa6e02c990b0a"), 5]
+
+def _random_row(rng, fields):
+    row = {}
+    for field, values in fields.items():
+        if rng.random() < 0.85:
+            row[field] = rng.choice(values)
+    return row
+
+def _common_fields():
+    return {"id": _IDS, "original_id": _IDS, "is_edit": [None, True, False], "language": ["english", None, 7]}
+
+def test_joke_batch_matches_entities():
+    rng = random.Random(19)
+    contents = [{"type": "one_liner", "text": "Ha"}, {"type": "one_liner"}, {"type": "one_liner", "text": None},
+                {"type": "qa", "question": "Why?", "answer": "Because"}, {"type": "qa", "question": " ", "answer": "a"},
+                {"type": "qa", "question": "q"}, {"type": "pun"}, {}, "not a dict"]
+    fields = dict(_common_fields(), level=[1, 2, 3, 4, None, "1", True], content=contents,
+                  explanation=["", "Because", None, 5])
+    _assert_matches_entities(Joke, [_random_row(rng, fields) for _ in range(2000)] + ["not a dict", {"mesg": "upstream error"}])
+
+def test_trivia_batch_matches_entities():
+    rng = random.Random(20)
+    fields = dict(_common_fields(), question=_ANY_VALUES, answer=_ANY_VALUES)
+    _assert_matches_entities(Trivia, [_random_row(rng, fields) for _ in range(2000)])
+
+def test_quote_batch_matches_entities():
+    rng = random.Random(21)
+    fields = dict(_common_fields(), content=_ANY_VALUES, author=_ANY_VALUES, category=["Life", 3, "", None])
+    _assert_matches_entities(Quote, [_random_row(rng, fields) for _ in range(2000)])
+
+def test_bio_batch_matches_entities():
+    rng = random.Random(22)
+    fields = dict(_common_fields(), name=["Ada", 1], paragraph=["Text", None], summary=["Short", None, 2],
+                  source_url=["https://example.com", "not a url", None, 3],
+                  birth_year=[1815, None, "1815", 3000], death_year=[1852, None, 1.5, 3000])
+    _assert_matches_entities(Bio, [_random_row(rng, fields) for _ in range(2000)])
+
+def test_every_error_of_a_row_is_reported():
+    rows = [{"level": 7, "content": {"type": "pun"}, "language": None, "id": "bad"}]
+    result = get_batch_validator(Joke).validate(rows)
+    assert result.documents == []
+    assert result.error_report() == [{"index": 0, "errors": [
+        "Invalid Record ID", "Language can not be none", "Difficulty must be either 1, 2, or 3", "Not a valid type"]}]
+
+def test_level_3_joke_with_explanation_is_valid():
+    row = {"level": 3, "content": {"type": "one_liner", "text": "Ha"}, "language": "english", "explanation": "Pun"}
+    result = get_batch_validator(Joke).validate([row])
+    assert result.errors == {}
+    assert Joke.from_json_object(row).to_json_object() == result.documents[0]
+
+def test_unknown_entity_class():
+    with pytest.raises(KeyError):
+        get_batch_validator(dict)
+
+def test_quote_batch_checks_used_date():
+    base = {"content": "Stay positive", "author": "Ada", "language": "english"}
+    dates = ["2025-04-20", "20/04/25", "", "invalid-date", 123]
+    result = get_batch_validator(Quote).validate([dict(base, used_date=value) for value in dates] + [base])
+    for index, value in enumerate(dates):
+        quote = Quote()
+        try:
+            quote.used_date = value
+        except ValueError as e:
+            if value == "":
+                assert result.documents[result.indexes.index(index)]["used_date"] == ""
+            else:
+                assert result.errors[index] == [str(e)]
+            continue
+        assert result.documents[result.indexes.index(index)]["used_date"] == quote.used_date
+    assert "used_date" not in result.documents[-1]
+
+def test_batch_validator_base_is_abstract():
+    from all_the_buzz.entities.batch_validation import _BatchValidator
+    with pytest.raises(TypeError):
+        _BatchValidator()
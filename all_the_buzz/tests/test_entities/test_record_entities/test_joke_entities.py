@@ -4,6 +4,7 @@
 
 from all_the_buzz.entities import Joke
 import pytest
+from unittest.mock import patch
 
 """
 This file runs unit tests on setter methods for Joke entities in: all_the_buzz/entities/record_entities.py
@@ -209,3 +210,21 @@ class TestJokeJsonMethods:
         assert "id" not in result
         assert "original_id" not in result
         assert "is_edit" not in result
+
+# ----- Test slots and trusted documents -----
+def test_joke_has_no_instance_dict():
+    joke = Joke()
+    assert not hasattr(joke, "__dict__")
+    with pytest.raises(AttributeError):
+        joke.unknown_field = 1
+
+def test_from_trusted_document_skips_sanitizing():
+    document = {"level": 1, "content": {"type": "one_liner", "text": "Tom & Jerry"}, "language": "english"}
+    with patch("all_the_buzz.entities.record_entities.sanitize_json") as mock_sanitize:
+        joke = Joke.from_trusted_document(document)
+    mock_sanitize.assert_not_called()
+    assert joke.content["text"] == "Tom & Jerry"
+
+def test_from_trusted_document_still_validates():
+    with pytest.raises(ValueError, match="Difficulty must be either 1, 2, or 3"):
+        Joke.from_trusted_document({"level": 5, "content": {"type": "one_liner", "text": "x"}, "language": "english"})
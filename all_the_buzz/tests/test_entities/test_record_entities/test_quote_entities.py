@@ -177,4 +177,39 @@ class TestQuoteJsonMethods:
         quote = Quote.from_json_object(original_dict)
         new_dict = quote.to_json_object()
         for key in ["content", "author", "language", "category"]:
-            assert new_dict[key] == original_dict[key].lower() if key == "category" else original_dict[key]
\ No newline at end of file
+            assert new_dict[key] == original_dict[key].lower() if key == "category" else original_dict[key]
+# ----- Test the used_date normalizer against the strptime formats it replaces -----
+_STRPTIME_FORMATS = ["%Y-%m-%d", "%m-%d-%Y", "%m/%d/%Y", "%d-%m-%Y", "%d/%m/%Y",
+                     "%m-%d-%y", "%d-%m-%y", "%m/%d/%y", "%d/%m/%y"]
+
+def _reference_used_date(text):
+    for fmt in _STRPTIME_FORMATS:
+        try:
+            return datetime.strptime(text.strip(), fmt).strftime("%m/%d/%Y")
+        except ValueError:
+            continue
+    return None
+
+@pytest.mark.parametrize("date_input", [
+    "2025-02-29", "2024-02-29", "02/30/2025", "13/05/2025", "05/13/25", "0000-01-01", "1-2-3",
+    " 11/04/2025 ", "11/ 4/2025", "11- 4-2025", "11-04/2025", "2025/11/04", "31-12-99", "01-01-68",
+    "01-01-69", "٠٤/١١/٢٠٢٥", "", "04//2025", "4/4/4444",
+])
+def test_normalizer_matches_strptime_edge_cases(date_input):
+    from all_the_buzz.entities.record_entities import normalize_used_date
+    assert normalize_used_date(date_input) == _reference_used_date(date_input)
+
+def test_normalizer_matches_strptime_fuzz():
+    import random
+    from all_the_buzz.entities.record_entities import normalize_used_date
+    rng = random.Random(18)
+    alphabet = "0123456789-/ "
+    for _ in range(5000):
+        if rng.random() < 0.5:
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        else:
+            separator = rng.choice("-/")
+            parts = [str(rng.randint(0, 40)).zfill(rng.choice([1, 2])) for _ in range(2)]
+            parts.insert(rng.randint(0, 2), str(rng.randint(0, 2100)).zfill(rng.choice([2, 4])))
+            text = separator.join(parts)
+        assert normalize_used_date(text) == _reference_used_date(text), text
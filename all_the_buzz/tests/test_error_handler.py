@@ -0,0 +1,49 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+from unittest.mock import MagicMock, patch
+from all_the_buzz.utilities.error_handler import ResponseCode, _PayloadSummary
+
+"""
+This file tests how ResponseCode logs its payload in error_handler.py
+"""
+
+class CountingPayload(list):
+    repr_calls = 0
+
+    def __repr__(self):
+        CountingPayload.repr_calls += 1
+        return super().__repr__()
+
+def test_response_code_defers_payload_formatting():
+    logger = MagicMock()
+    payload = CountingPayload([{"joke": "funny"}] * 1000)
+    with patch("all_the_buzz.utilities.error_handler.LoggerFactory.get_general_logger", return_value=logger):
+        ResponseCode("GeneralSuccess", payload)
+    message, *args = logger.info.call_args.args
+    assert "%s" in message
+    assert isinstance(args[-1], _PayloadSummary)
+    assert CountingPayload.repr_calls == 0
+
+def test_summary_of_long_string_is_truncated():
+    summary = str(_PayloadSummary("x" * 10000))
+    assert summary.startswith("<str length=10000> ")
+    assert summary.endswith("...")
+    assert len(summary) < 300
+
+def test_summary_of_records_has_count_and_bounded_preview():
+    records = [{"_id": i, "content": "y" * 500} for i in range(5000)]
+    summary = str(_PayloadSummary(records))
+    assert summary.startswith("<list count=5000> ")
+    assert len(summary) < 300
+
+def test_summary_of_small_values():
+    assert str(_PayloadSummary(None)) == "None"
+    assert str(_PayloadSummary(42)) == "42"
+    assert str(_PayloadSummary({"deleted_count": 1})) == "<dict count=1> {'deleted_count': 1}"
+
+def test_full_payload_when_configured():
+    with patch("all_the_buzz.utilities.error_handler.LoggerFactory.get_response_logging_settings",
+               return_value={"log_full_payload": True}):
+        assert str(_PayloadSummary("x" * 1000)) == "x" * 1000
@@ -0,0 +1,62 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import bson
+import datetime
+import json
+import pytest
+from bson import json_util
+from bson.decimal128 import Decimal128
+from bson.objectid import ObjectId
+from bson.raw_bson import RawBSONDocument
+from all_the_buzz.utilities import json_encoder
+from all_the_buzz.utilities.json_encoder import JSONResponseEncoder
+
+DOCUMENT = {
+    "_id": ObjectId("65a1b2c3d4e5f60718293a4b"),
+    "created": datetime.datetime(2024, 1, 2, 3, 4, 5, 678000),
+    "price": Decimal128("1.50"),
+    "tags": ["a", "é"],
+    "level": 2,
+}
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(json_encoder, "orjson", None)
+    elif json_encoder.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+def test_extended_matches_json_util(backend):
+    encoded = JSONResponseEncoder().encode([DOCUMENT])
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == json.loads(json_util.dumps([DOCUMENT]))
+
+def test_plain_writes_strings(backend):
+    decoded = json.loads(JSONResponseEncoder("plain").encode(DOCUMENT))
+    assert decoded["_id"] == "65a1b2c3d4e5f60718293a4b"
+    assert decoded["created"] == "2024-01-02T03:04:05.678Z"
+    assert decoded["price"] == {"$numberDecimal": "1.50"}
+    assert decoded["tags"] == ["a", "é"]
+
+def test_raw_documents_match_decoded_documents(backend):
+    raw = RawBSONDocument(bson.encode(DOCUMENT))
+    for mode in ("extended", "plain"):
+        encoder = JSONResponseEncoder(mode)
+        assert encoder.encode([raw, raw]) == encoder.encode([DOCUMENT, DOCUMENT])
+
+def test_output_is_compact_utf8(backend):
+    assert JSONResponseEncoder().encode({"text": "é", "n": [1, 2]}) == '{"text":"é","n":[1,2]}'.encode("utf-8")
+
+def test_values_orjson_rejects_fall_back_to_json():
+    assert json.loads(JSONResponseEncoder().encode({"big": 2 ** 70, 1: "one"})) == {"big": 2 ** 70, "1": "one"}
+
+def test_unknown_type_raises(backend):
+    with pytest.raises(TypeError):
+        JSONResponseEncoder().encode({"value": object()})
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        JSONResponseEncoder("canonical")
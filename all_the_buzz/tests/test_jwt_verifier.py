@@ -0,0 +1,173 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import base64
+import hashlib
+import hmac
+import json
+import random
+import pytest
+from all_the_buzz.utilities.jwt_verifier import LocalJWTVerifier, UnknownKeyError, claims_to_credentials_json
+
+NOW = 1_761_246_050
+
+def _encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+def _int_encode(value: int) -> str:
+    return _encode(value.to_bytes((value.bit_length() + 7) // 8, "big"))
+
+def _is_probable_prime(n, rng, rounds=20):
+    if n % 2 == 0:
+        return n == 2
+    d, r = n - 1, 0
+    while d % 2 == 0:
+        d, r = d // 2, r + 1
+    for _ in range(rounds):
+        x = pow(rng.randrange(2, n - 1), d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(r - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def _generate_rsa_key(bits=1024, seed=7):
+    rng = random.Random(seed)
+    e = 65537
+    while True:
+        primes = []
+        while len(primes) < 2:
+            candidate = rng.getrandbits(bits // 2) | (1 << (bits // 2 - 1)) | 1
+            if _is_probable_prime(candidate, rng):
+                primes.append(candidate)
+        p, q = primes
+        phi = (p - 1) * (q - 1)
+        if p != q and phi % e != 0:
+            return p * q, e, pow(e, -1, phi)
+
+def _sign(header, claims, alg, key):
+    signing_input = f"{_encode(json.dumps(header).encode())}.{_encode(json.dumps(claims).encode())}"
+    if alg == "HS256":
+        signature = hmac.new(key, signing_input.encode(), hashlib.sha256).digest()
+    else:
+        n, _, d = key
+        size = (n.bit_length() + 7) // 8
+        digest_info = bytes.fromhex("3031300d060960864801650304020105000420") + hashlib.sha256(signing_input.encode()).digest()
+        encoded = b"\x00\x01" + b"\xff" * (size - len(digest_info) - 3) + b"\x00" + digest_info
+        signature = pow(int.from_bytes(encoded, "big"), d, n).to_bytes(size, "big")
+    return f"{signing_input}.{_encode(signature)}"
+
+CLAIMS = {"id": 577, "first_name": "Auguste", "last_name": "Tweed", "department": "Sales",
+          "title": "Manager", "location": "United States", "iat": NOW, "exp": NOW + 3600}
+SECRET = b"locally-generated-secret"
+RSA_KEY = _generate_rsa_key()
+
+@pytest.fixture
+def key_file(tmp_path):
+    path = tmp_path / "jwt_keys.json"
+    n, e, _ = RSA_KEY
+    path.write_text(json.dumps({"keys": [
+        {"kty": "oct", "kid": "hs-1", "alg": "HS256", "k": _encode(SECRET)},
+        {"kty": "RSA", "kid": "rs-1", "alg": "RS256", "n": _int_encode(n), "e": _int_encode(e)},
+    ]}))
+    return path
+
+def make_verifier(key_file, now=NOW, **kwargs):
+    clock = {"now": now}
+    verifier = LocalJWTVerifier(str(key_file), clock=lambda: clock["now"], **kwargs)
+    return verifier, clock
+
+def test_verify_hs256(key_file):
+    verifier, _ = make_verifier(key_file)
+    token = _sign({"alg": "HS256", "kid": "hs-1"}, CLAIMS, "HS256", SECRET)
+    assert verifier.verify(token) == CLAIMS
+
+def test_verify_rs256(key_file):
+    verifier, _ = make_verifier(key_file)
+    token = _sign({"alg": "RS256", "kid": "rs-1"}, CLAIMS, "RS256", RSA_KEY)
+    assert verifier.verify(token)["id"] == 577
+
+def test_verify_without_kid_uses_matching_algorithm(key_file):
+    verifier, _ = make_verifier(key_file)
+    token = _sign({"alg": "HS256"}, CLAIMS, "HS256", SECRET)
+    assert verifier.verify(token)["first_name"] == "Auguste"
+
+def test_tampered_payload_rejected(key_file):
+    verifier, _ = make_verifier(key_file)
+    header, _, signature = _sign({"alg": "RS256", "kid": "rs-1"}, CLAIMS, "RS256", RSA_KEY).split(".")
+    forged = _encode(json.dumps(dict(CLAIMS, title="CEO")).encode())
+    with pytest.raises(ValueError, match="signature"):
+        verifier.verify(f"{header}.{forged}.{signature}")
+
+def test_wrong_secret_rejected(key_file):
+    verifier, _ = make_verifier(key_file)
+    with pytest.raises(ValueError, match="signature"):
+        verifier.verify(_sign({"alg": "HS256", "kid": "hs-1"}, CLAIMS, "HS256", b"other-secret"))
+
+def test_expired_token_rejected_after_leeway(key_file):
+    verifier, _ = make_verifier(key_file, now=NOW + 3600 + 10, leeway_seconds=30)
+    token = _sign({"alg": "HS256", "kid": "hs-1"}, CLAIMS, "HS256", SECRET)
+    assert verifier.verify(token)["id"] == 577
+    verifier, _ = make_verifier(key_file, now=NOW + 3600 + 31, leeway_seconds=30)
+    with pytest.raises(ValueError, match="expired"):
+        verifier.verify(token)
+
+def test_missing_exp_rejected(key_file):
+    verifier, _ = make_verifier(key_file)
+    claims = {key: value for key, value in CLAIMS.items() if key != "exp"}
+    with pytest.raises(ValueError, match="expiry"):
+        verifier.verify(_sign({"alg": "HS256", "kid": "hs-1"}, claims, "HS256", SECRET))
+
+def test_issuer_and_audience_checked(key_file):
+    verifier, _ = make_verifier(key_file, issuer="auth_service", audience="all_the_buzz")
+    good = dict(CLAIMS, iss="auth_service", aud=["all_the_buzz", "other"])
+    assert verifier.verify(_sign({"alg": "HS256", "kid": "hs-1"}, good, "HS256", SECRET))
+    with pytest.raises(ValueError, match="audience"):
+        verifier.verify(_sign({"alg": "HS256", "kid": "hs-1"}, dict(good, aud="other"), "HS256", SECRET))
+
+def test_alg_none_is_unknown(key_file):
+    verifier, _ = make_verifier(key_file)
+    token = f"{_encode(json.dumps({'alg': 'none'}).encode())}.{_encode(json.dumps(CLAIMS).encode())}."
+    with pytest.raises(UnknownKeyError):
+        verifier.verify(token)
+
+def test_malformed_token_rejected(key_file):
+    verifier, _ = make_verifier(key_file)
+    with pytest.raises(ValueError, match="Malformed"):
+        verifier.verify("not-a-token")
+
+def test_unknown_kid_reloads_rotated_keys(key_file):
+    verifier, clock = make_verifier(key_file, refresh_seconds=3600)
+    token = _sign({"alg": "HS256", "kid": "hs-2"}, CLAIMS, "HS256", b"rotated-secret")
+    with pytest.raises(UnknownKeyError):
+        verifier.verify(token)
+
+    key_set = json.loads(key_file.read_text())
+    key_set["keys"].append({"kty": "oct", "kid": "hs-2", "alg": "HS256", "k": _encode(b"rotated-secret")})
+    key_file.write_text(json.dumps(key_set))
+    with pytest.raises(UnknownKeyError):
+        verifier.verify(token)
+    clock["now"] += 61
+    assert verifier.verify(token)["id"] == 577
+
+@pytest.mark.parametrize("damage", ["delete", "truncate"])
+def test_failed_reload_keeps_previous_keys(key_file, damage):
+    verifier, clock = make_verifier(key_file, refresh_seconds=60)
+    if damage == "delete":
+        key_file.unlink()
+    else:
+        key_file.write_text(key_file.read_text()[:20])
+    clock["now"] += 61
+    token = _sign({"alg": "HS256", "kid": "hs-1"}, CLAIMS, "HS256", SECRET)
+    assert verifier.verify(token) == CLAIMS
+    with pytest.raises(UnknownKeyError):
+        verifier.verify(_sign({"alg": "HS256", "kid": "hs-2"}, CLAIMS, "HS256", SECRET))
+
+def test_claims_to_credentials_json():
+    assert claims_to_credentials_json(dict(CLAIMS, sub="Auguste Tweed")) == {
+        "id": 577, "fName": "Auguste", "lName": "Tweed", "dept": "Sales", "title": "Manager", "loc": "United States"}
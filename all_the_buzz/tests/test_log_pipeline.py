@@ -0,0 +1,99 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import io
+import logging
+import queue
+import sys
+import pytest
+from all_the_buzz.utilities.log_pipeline import BatchingLogWriter, OverflowQueueHandler
+
+def _record(name: str, level: int, msg: str, *args) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+def _stream_handler(level: int = logging.DEBUG) -> tuple[logging.StreamHandler, io.StringIO]:
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setLevel(level)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    return handler, stream
+
+def test_enqueue_merges_arguments_on_calling_thread():
+    log_queue = queue.Queue(maxsize=10)
+    handler = OverflowQueueHandler(log_queue)
+    entry = {"level": 1}
+    record = _record("generalLogger", logging.INFO, "entry %s", entry)
+    handler.handle(record)
+    entry["level"] = 2
+    queued = log_queue.get_nowait()
+    assert queued is not record
+    assert queued.getMessage() == "entry {'level': 1}"
+    assert queued.args is None
+    assert queued.template == "entry %s"
+    assert record.msg == "entry %s"
+
+def test_exception_is_rendered_before_enqueue():
+    log_queue = queue.Queue(maxsize=10)
+    handler = OverflowQueueHandler(log_queue)
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record = logging.LogRecord("generalLogger", logging.ERROR, __file__, 1, "failed", (), sys.exc_info())
+    handler.handle(record)
+    queued = log_queue.get_nowait()
+    assert queued.exc_info is None
+    assert "RuntimeError: boom" in queued.exc_text
+
+def test_drop_debug_policy_drops_debug_when_full():
+    log_queue = queue.Queue(maxsize=1)
+    handler = OverflowQueueHandler(log_queue, "drop_debug", block_timeout=0.01)
+    handler.handle(_record("generalLogger", logging.INFO, "first"))
+    handler.handle(_record("generalLogger", logging.DEBUG, "dropped"))
+    assert handler.dropped() == 1
+    assert log_queue.qsize() == 1
+
+def test_block_policy_waits_then_drops():
+    log_queue = queue.Queue(maxsize=1)
+    handler = OverflowQueueHandler(log_queue, "block", block_timeout=0.01)
+    handler.handle(_record("generalLogger", logging.INFO, "first"))
+    handler.handle(_record("generalLogger", logging.WARNING, "no room"))
+    assert handler.dropped() == 1
+
+def test_unknown_overflow_policy_raises():
+    with pytest.raises(ValueError):
+        OverflowQueueHandler(queue.Queue(), "drop_everything")
+
+def test_writer_routes_by_logger_and_level():
+    general, general_stream = _stream_handler(logging.INFO)
+    security, security_stream = _stream_handler(logging.WARNING)
+    writer = BatchingLogWriter(queue.Queue(), {"generalLogger": [general], "securityLogger": [security]})
+    writer.write_batch([
+        _record("generalLogger", logging.DEBUG, "too low"),
+        _record("generalLogger", logging.INFO, "value %s", 1),
+        _record("securityLogger", logging.INFO, "too low"),
+        _record("securityLogger", logging.ERROR, "denied"),
+    ])
+    assert general_stream.getvalue() == "INFO value 1\n"
+    assert security_stream.getvalue() == "ERROR denied\n"
+
+def test_writer_drains_queue_on_stop():
+    handler, stream = _stream_handler()
+    log_queue = queue.Queue(maxsize=100)
+    queue_handler = OverflowQueueHandler(log_queue)
+    writer = BatchingLogWriter(log_queue, {"generalLogger": [handler]}, batch_size=7)
+    writer.start()
+    for i in range(50):
+        queue_handler.handle(_record("generalLogger", logging.INFO, "line %d", i))
+    writer.stop()
+    lines = stream.getvalue().splitlines()
+    assert lines == [f"INFO line {i}" for i in range(50)]
+
+def test_writer_skips_record_that_cannot_be_formatted(monkeypatch):
+    monkeypatch.setattr(logging, "raiseExceptions", False)
+    handler, stream = _stream_handler()
+    writer = BatchingLogWriter(queue.Queue(), {"generalLogger": [handler]})
+    writer.write_batch([_record("generalLogger", logging.INFO, "first"),
+                        _record("generalLogger", logging.INFO, "bad %d", "not a number"),
+                        _record("generalLogger", logging.INFO, "last")])
+    assert stream.getvalue() == "INFO first\nINFO last\n"
@@ -0,0 +1,82 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import gzip
+import logging
+import os
+import time
+import pytest
+from unittest.mock import patch
+from all_the_buzz.utilities.log_rotation import CompressedRotatingFileHandler
+
+@pytest.fixture
+def log_dir(tmp_path):
+    #Treat the temporary directory as the allowed log directory
+    with patch("all_the_buzz.utilities.logger.ALLOWED_LOG_DIR", str(tmp_path)):
+        yield tmp_path
+
+def _record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord("generalLogger", logging.INFO, __file__, 1, msg, (), None)
+
+def _handler(path, **kwargs) -> CompressedRotatingFileHandler:
+    handler = CompressedRotatingFileHandler(str(path), **kwargs)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+def test_rotates_by_size_and_compresses(log_dir):
+    handler = _handler(log_dir / "general.log", max_bytes=100, interval_seconds=0, backup_count=5)
+    for i in range(10):
+        handler.emit(_record(f"line {i:02d} " + "x" * 20))
+    handler.wait_for_compression(5)
+    handler.close()
+    segments = handler.segments()
+    assert segments
+    assert all(path.endswith(".gz") for path in segments)
+    assert os.path.getsize(log_dir / "general.log") < 100
+    rotated = b"".join(gzip.open(path).read() for path in segments)
+    current = (log_dir / "general.log").read_bytes()
+    assert (rotated + current).decode().splitlines() == [f"line {i:02d} " + "x" * 20 for i in range(10)]
+
+def test_rotates_by_time(log_dir):
+    handler = _handler(log_dir / "general.log", max_bytes=0, interval_seconds=60)
+    handler.emit(_record("before"))
+    later = time.time() + 3600
+    with patch("all_the_buzz.utilities.log_rotation.time.time", return_value=later):
+        handler.emit(_record("after"))
+    handler.wait_for_compression(5)
+    handler.close()
+    assert len(handler.segments()) == 1
+    assert (log_dir / "general.log").read_text() == "after\n"
+
+def test_retention_keeps_newest_segments(log_dir):
+    handler = _handler(log_dir / "general.log", max_bytes=10, interval_seconds=0, backup_count=2, compress=False)
+    for i in range(6):
+        handler.emit(_record(f"segment {i}"))
+        handler.wait_for_compression(5)
+    handler.close()
+    segments = handler.segments()
+    assert len(segments) == 2
+    assert [open(path).read() for path in segments] == ["segment 3\n", "segment 4\n"]
+
+def test_retention_respects_total_size(log_dir):
+    handler = _handler(log_dir / "general.log", max_bytes=10, interval_seconds=0, backup_count=10,
+                       max_total_bytes=15, compress=False)
+    for i in range(5):
+        handler.emit(_record(f"segment {i}"))
+        handler.wait_for_compression(5)
+    handler.close()
+    assert len(handler.segments()) == 1
+
+def test_unsafe_path_is_rejected(log_dir, tmp_path_factory):
+    outside = tmp_path_factory.mktemp("elsewhere") / "general.log"
+    with pytest.raises(ValueError):
+        CompressedRotatingFileHandler(str(outside))
+
+def test_unsafe_rotated_path_is_rejected(log_dir):
+    handler = _handler(log_dir / "general.log", max_bytes=10, interval_seconds=0)
+    handler.emit(_record("first line"))
+    with patch("all_the_buzz.utilities.logger.ALLOWED_LOG_DIR", "/nonexistent"):
+        with pytest.raises(ValueError):
+            handler.doRollover()
+    handler.close()
@@ -2,9 +2,12 @@
 # Licensed under the MIT License
 # See LICENSE for more details
 
+import bson
 import pytest
 from bson import ObjectId
+from bson.raw_bson import RawBSONDocument
 from unittest.mock import MagicMock
+from pymongo.errors import BulkWriteError
 from all_the_buzz.database_operations.abstract_record import DatabaseAccessObject
 from all_the_buzz.entities.credentials_entity import Credentials
 from all_the_buzz.utilities.error_handler import ResponseCode
@@ -59,6 +62,27 @@ def test_clear_credentials():
     dao.clear_credentials()
     assert dao.get_credentials() is None
 
+def test_with_credentials_returns_scoped_view(dao, mock_collection):
+    creds = Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ")
+    view = dao.with_credentials(creds)
+    assert view is not dao
+    assert isinstance(view, DAOStub)
+    assert view._collection is mock_collection
+    assert view.get_credentials() == creds
+    assert dao.get_credentials() is None
+    view.clear_credentials()
+    assert view.get_credentials() is None
+
+def test_with_credentials_views_do_not_share_credentials(dao, mock_collection):
+    mock_collection.find.return_value = [{"_id": 1}]
+    manager = dao.with_credentials(Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ"))
+    intern = dao.with_credentials(Credentials(id=2, fName="Bob", lName="Jones", dept="IT", title="Intern", loc="HQ"))
+    assert manager.get_by_fields({}) == [{"_id": 1}]
+    denied = intern.get_by_fields({})
+    assert isinstance(denied, ResponseCode)
+    assert denied.get_error_tag() == "PermissionIncongruency"
+    assert manager.get_credentials().title == "Manager"
+
 # ---------------- RBAC Tests ---------------- #
 
 def test_rbac_action_allows_manager():
@@ -151,6 +175,38 @@ def test_create_record(dao, mock_collection):
     assert result.get_error_tag() == "PostSuccess"
 
 
+def _assign_ids(documents, ordered=True):
+    for document in documents:
+        document["_id"] = ObjectId()
+
+
+def test_create_records_inserts_in_chunks(dao, mock_collection):
+    dao.set_credentials(Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ"))
+    mock_collection.insert_many.side_effect = _assign_ids
+    entries = [{"field": i} for i in range(5)]
+    result = dao.create_records(entries, chunk_size=2)
+    assert result.get_error_tag() == "PostSuccess"
+    assert mock_collection.insert_many.call_count == 3
+    assert all(call.kwargs["ordered"] is False for call in mock_collection.insert_many.call_args_list)
+    assert [item["index"] for item in result.get_data()["results"]] == [0, 1, 2, 3, 4]
+    assert "_id" not in entries[0]
+
+
+def test_create_records_reports_write_errors(dao, mock_collection):
+    dao.set_credentials(Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ"))
+    def fail_second(documents, ordered=True):
+        _assign_ids(documents)
+        raise BulkWriteError({"writeErrors": [{"index": 1, "code": 11000, "errmsg": "dup"}]})
+    mock_collection.insert_many.side_effect = fail_second
+    result = dao.create_records([{"field": i} for i in range(4)], chunk_size=2)
+    assert result.get_error_tag() == "BulkPartialSuccess"
+    data = result.get_data()
+    assert (data["inserted"], data["failed"]) == (2, 2)
+    failed = [item for item in data["results"] if item["status"] == "failed"]
+    assert [item["index"] for item in failed] == [1, 3]
+    assert failed[0]["code_tag"] == "DuplicateKeyError"
+
+
 def test_delete_record_success(dao, mock_collection):
     dao.set_credentials(Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ"))
     mock_collection.delete_one.return_value.deleted_count = 1
@@ -186,9 +242,143 @@ def test_delete_record_by_field_multiple_fields(dao):
     assert isinstance(result, ResponseCode)
     assert result.get_error_tag() == "MalformedContent"
 
+# ---- Pagination and streaming -----
+def test_get_page_returns_next_cursor(dao, mock_collection):
+    dao.set_credentials(Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ"))
+    ids = [ObjectId() for _ in range(3)]
+    mock_collection.find.return_value.sort.return_value.limit.return_value = [{"_id": i} for i in ids]
+    page = dao.get_page({"category": "tech"}, limit=2)
+    assert page == {"records": [{"_id": ids[0]}, {"_id": ids[1]}], "next_cursor": str(ids[1])}
+    mock_collection.find.assert_called_once_with({"category": "tech"}, None)
+    mock_collection.find.return_value.sort.assert_called_once_with("_id", 1)
+    mock_collection.find.return_value.sort.return_value.limit.assert_called_once_with(3)
+
+def test_get_page_after_cursor_uses_id_range(dao, mock_collection):
+    dao.set_credentials(Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ"))
+    after = ObjectId()
+    mock_collection.find.return_value.sort.return_value.limit.return_value = [{"_id": ObjectId()}]
+    page = dao.get_page(after=str(after), limit=2)
+    assert page["next_cursor"] is None
+    mock_collection.find.assert_called_once_with({"_id": {"$gt": after}}, None)
+
+def test_get_page_invalid_cursor(dao):
+    dao.set_credentials(Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ"))
+    result = dao.get_page(after="not-an-id")
+    assert isinstance(result, ResponseCode)
+    assert result.get_error_tag() == "InvalidFilter"
+
+def test_iter_records_returns_sorted_cursor(dao, mock_collection):
+    dao.set_credentials(Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ"))
+    after = ObjectId()
+    cursor = dao.iter_records({"level": 2}, after=str(after), batch_size=50)
+    assert cursor is mock_collection.find.return_value.sort.return_value.batch_size.return_value
+    mock_collection.find.assert_called_once_with({"$and": [{"level": 2}, {"_id": {"$gt": after}}]}, None)
+    mock_collection.find.return_value.sort.return_value.batch_size.assert_called_once_with(50)
+
+def test_raw_reads_use_raw_bson_codec(dao, mock_collection):
+    dao.set_credentials(Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ"))
+    raw_collection = mock_collection.with_options.return_value
+    raw_collection.find.return_value = [RawBSONDocument(bson.encode({"_id": 1, "level": 2}))]
+    documents = dao.get_by_fields({"level": 2}, raw=True)
+    assert documents[0]["level"] == 2
+    assert mock_collection.with_options.call_args.kwargs["codec_options"].document_class is RawBSONDocument
+    raw_collection.find.assert_called_once_with({"level": 2}, None)
+    mock_collection.find.assert_not_called()
+
+def test_unindexed_filters_are_reported_once(mock_collection, monkeypatch):
+    logger = MagicMock()
+    monkeypatch.setattr("all_the_buzz.database_operations.abstract_record.LoggerFactory.get_general_logger", lambda: logger)
+    mock_client = MagicMock()
+    mock_client.__getitem__.return_value.__getitem__.return_value = mock_collection
+    mock_collection.name = "quotes_public"
+    dao = DAOStub(table_name="quotes_public", client=mock_client, database_name="test_db")
+    view = dao.with_credentials(Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ"))
+    view.get_by_fields({"author": "Ada", "language": "en"})
+    view.get_page({"author": "Ada"})
+    view.iter_records({"category": "tech", "$or": []})
+    warned = [call.args[2] for call in logger.warning.call_args_list]
+    assert warned == ["author"]
+
+# ---- Field projection -----
+class ProjectingDAOStub(DatabaseAccessObject):
+    __test__ = False
+    PROJECTABLE_FIELDS = frozenset({"name", "summary"})
+
+@pytest.fixture
+def projecting_dao(mock_collection):
+    mock_client = MagicMock()
+    mock_client.__getitem__.return_value.__getitem__.return_value = mock_collection
+    dao = ProjectingDAOStub(table_name="test_table", client=mock_client, database_name="test_db")
+    dao.set_credentials(Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ"))
+    return dao
+
+def test_get_by_fields_with_projection(projecting_dao, mock_collection):
+    mock_collection.find.return_value = [{"_id": 1, "name": "Ada"}]
+    assert projecting_dao.get_by_fields({"language": "en"}, fields=["name", "summary"]) == [{"_id": 1, "name": "Ada"}]
+    mock_collection.find.assert_called_once_with({"language": "en"}, {"_id": 1, "name": 1, "summary": 1})
+
+def test_get_all_records_accepts_comma_separated_fields(projecting_dao, mock_collection):
+    mock_collection.find.return_value = [{"_id": 1, "name": "Ada"}]
+    projecting_dao.get_all_records(fields="name, summary")
+    mock_collection.find.assert_called_once_with({}, {"_id": 1, "name": 1, "summary": 1})
+
+def test_get_random_projects_after_sample(projecting_dao, mock_collection):
+    mock_collection.aggregate.return_value = [{"_id": 1, "name": "Ada"}]
+    projecting_dao.get_random(1, fields=["name"])
+    pipeline = mock_collection.aggregate.call_args[0][0]
+    assert pipeline[-1] == {"$project": {"_id": 1, "name": 1}}
+
+def test_projection_rejects_unlisted_field(projecting_dao, mock_collection):
+    result = projecting_dao.get_by_key("1"*24, fields=["name", "paragraph"])
+    assert isinstance(result, ResponseCode)
+    assert result.get_error_tag() == "InvalidFilter"
+    mock_collection.find_one.assert_not_called()
+
+# ---- Read cache -----
+class CachingDAOStub(DatabaseAccessObject):
+    __test__ = False
+    CACHE_READS = True
+
+@pytest.fixture
+def caching_dao(mock_collection):
+    mock_client = MagicMock()
+    mock_client.__getitem__.return_value.__getitem__.return_value = mock_collection
+    dao = CachingDAOStub(table_name="test_table", client=mock_client, database_name="test_db")
+    return dao.with_credentials(Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ"))
+
+def test_cached_reads_skip_database(caching_dao, mock_collection):
+    mock_collection.find.return_value = [{"_id": 1}]
+    assert caching_dao.get_by_fields({"a": 1, "b": 2}) == [{"_id": 1}]
+    assert caching_dao.get_by_fields({"b": 2, "a": 1}) == [{"_id": 1}]
+    assert mock_collection.find.call_count == 1
+
+def test_cached_reads_shared_across_views_but_rbac_still_applies(caching_dao, mock_collection):
+    mock_collection.find.return_value = [{"_id": 1}]
+    caching_dao.get_all_records()
+    intern = caching_dao.with_credentials(Credentials(id=2, fName="Bob", lName="Jones", dept="IT", title="Intern", loc="HQ"))
+    assert intern.get_all_records().get_error_tag() == "PermissionIncongruency"
+    manager = caching_dao.with_credentials(Credentials(id=3, fName="Cy", lName="Lee", dept="IT", title="Manager", loc="HQ"))
+    assert manager.get_all_records() == [{"_id": 1}]
+    assert mock_collection.find.call_count == 1
+
+@pytest.mark.parametrize("method,args", [
+    ("create_record", ({"field": "value"},)),
+    ("update_record", ("1"*24, {"field": "value"})),
+    ("delete_record", ("1"*24,)),
+    ("delete_record_by_field", ({"field": "value"},)),
+])
+def test_writes_invalidate_cached_reads(caching_dao, mock_collection, method, args):
+    mock_collection.find.return_value = [{"_id": 1}]
+    caching_dao.get_all_records()
+    getattr(caching_dao, method)(*args)
+    caching_dao.get_all_records()
+    assert mock_collection.find.call_count == 2
+
 # ---- Tests for non-managers -----
 @pytest.mark.parametrize("action,method,args", [
     ("read", "get_short_record", {"numReturned": 1}),
+    ("read", "get_page", {}),
+    ("read", "iter_records", {}),
     ("update", "update_record", {"ID": "123456789012345678901234", "updates": {"field": "value"}}),
     ("create", "create_record", {"entry": {"field": "value"}}),
     ("delete", "delete_record", {"ID": "123456789012345678901234"}),
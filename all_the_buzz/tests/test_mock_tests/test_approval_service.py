@@ -0,0 +1,230 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import pytest
+from bson import ObjectId
+from unittest.mock import MagicMock
+from pymongo.errors import OperationFailure, AutoReconnect, BulkWriteError
+from all_the_buzz.database_operations.approval_service import ApprovalService, MAX_BATCH_IDS
+from all_the_buzz.database_operations.jokes_dao import PublicJokeDAO, PrivateJokeDAO
+from all_the_buzz.database_operations.quotes_dao import PublicQuoteDAO, PrivateQuoteDAO
+from all_the_buzz.entities.credentials_entity import Credentials
+from all_the_buzz.entities.record_entities import Joke, Quote
+
+"""
+This file creates and runs mock tests on the ApprovalService in approval_service.py
+"""
+
+manager = Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ")
+employee = Credentials(id=2, fName="Bob", lName="Jones", dept="IT", title="Employee", loc="HQ")
+
+def _joke_document(**fields):
+    document = {"_id": ObjectId(), "level": 1, "content": {"type": "one_liner", "text": "Funny"},
+                "explanation": "", "language": "english", "is_edit": False}
+    document.update(fields)
+    return document
+
+def _setup(topology="ReplicaSetWithPrimary", public_class=PublicJokeDAO, private_class=PrivateJokeDAO):
+    client = MagicMock()
+    client.topology_description.topology_type_name = topology
+    session = client.start_session.return_value.__enter__.return_value
+    session.with_transaction.side_effect = lambda callback: callback(session)
+    collections = {}
+    def collection(name):
+        if name not in collections:
+            collections[name] = MagicMock()
+            collections[name].database.client = client
+        return collections[name]
+    client.__getitem__.return_value.__getitem__.side_effect = collection
+    public_dao = public_class(client, "test_db")
+    private_dao = private_class(client, "test_db")
+    return client, session, public_dao, private_dao
+
+def test_approve_new_record_in_transaction():
+    client, session, public_dao, private_dao = _setup()
+    document = _joke_document()
+    private_dao._collection.find_one_and_delete.return_value = document
+    service = ApprovalService(Joke, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+
+    result = service.approve(str(document["_id"]))
+    assert result.get_error_tag() == "GeneralSuccess"
+    assert result.get_data()["public_id"] == str(document["_id"])
+    private_dao._collection.find_one_and_delete.assert_called_once_with({"_id": document["_id"]}, session=session)
+    filter, update = public_dao._collection.update_one.call_args.args
+    assert filter == {"_id": document["_id"]}
+    assert "is_edit" not in update["$setOnInsert"]
+    assert public_dao._collection.update_one.call_args.kwargs == {"upsert": True, "session": session}
+
+def test_approve_strips_unsanitized_content():
+    client, session, public_dao, private_dao = _setup()
+    document = _joke_document(content={"type": "one_liner", "text": "Funny<script>alert(1)</script>"})
+    private_dao._collection.find_one_and_delete.return_value = document
+    service = ApprovalService(Joke, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+
+    assert service.approve(str(document["_id"])).get_success()
+    filter, update = public_dao._collection.update_one.call_args.args
+    assert update["$setOnInsert"]["content"]["text"] == "Funny"
+
+def test_approve_edit_merges_into_original():
+    client, session, public_dao, private_dao = _setup()
+    original_id = str(ObjectId())
+    document = _joke_document(is_edit=True, original_id=original_id)
+    private_dao._collection.find_one_and_delete.return_value = document
+    public_dao._collection.update_one.return_value.matched_count = 1
+    service = ApprovalService(Joke, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+
+    result = service.approve(str(document["_id"]))
+    assert result.get_data()["public_id"] == original_id
+    filter, update = public_dao._collection.update_one.call_args.args
+    assert filter == {"_id": ObjectId(original_id)}
+    assert "original_id" not in update["$set"] and "is_edit" not in update["$set"]
+
+def test_approve_missing_original_aborts():
+    client, session, public_dao, private_dao = _setup()
+    document = _joke_document(is_edit=True, original_id=str(ObjectId()))
+    private_dao._collection.find_one_and_delete.return_value = document
+    public_dao._collection.update_one.return_value.matched_count = 0
+    service = ApprovalService(Joke, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+
+    result = service.approve(str(document["_id"]))
+    assert result.get_error_tag() == "ResourceNotFound"
+    #Raised inside with_transaction, so the delete is rolled back; nothing is re-inserted by hand
+    private_dao._collection.insert_one.assert_not_called()
+
+def test_approve_pending_not_found():
+    client, session, public_dao, private_dao = _setup()
+    private_dao._collection.find_one_and_delete.return_value = None
+    service = ApprovalService(Joke, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+    assert service.approve(str(ObjectId())).get_error_tag() == "ResourceNotFound"
+    public_dao._collection.update_one.assert_not_called()
+
+def test_approve_falls_back_without_transactions():
+    client, session, public_dao, private_dao = _setup()
+    session.with_transaction.side_effect = OperationFailure("Transaction numbers are only allowed on a replica set member or mongos", code=20)
+    document = _joke_document()
+    private_dao._collection.find_one_and_delete.return_value = document
+    service = ApprovalService(Joke, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+
+    result = service.approve(str(document["_id"]))
+    assert result.get_error_tag() == "GeneralSuccess"
+    private_dao._collection.find_one_and_delete.assert_called_once_with({"_id": document["_id"]})
+    assert public_dao._collection.update_one.call_args.kwargs["session"] is None
+
+def test_standalone_restores_pending_record_on_failure():
+    client, session, public_dao, private_dao = _setup(topology="Single")
+    document = _joke_document()
+    private_dao._collection.find_one_and_delete.return_value = document
+    public_dao._collection.update_one.side_effect = AutoReconnect()
+    service = ApprovalService(Joke, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+
+    result = service.approve(str(document["_id"]))
+    assert result.get_error_tag() == "AutoReconnect"
+    client.start_session.assert_not_called()
+    private_dao._collection.insert_one.assert_called_once_with(document)
+
+def test_standalone_restores_invalid_record():
+    client, session, public_dao, private_dao = _setup(topology="Single")
+    document = _joke_document(level=7)
+    private_dao._collection.find_one_and_delete.return_value = document
+    service = ApprovalService(Joke, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+
+    assert service.approve(str(document["_id"])).get_error_tag() == "InvalidRecord"
+    private_dao._collection.insert_one.assert_called_once_with(document)
+
+def test_approve_quote_sets_default_used_date():
+    client, session, public_dao, private_dao = _setup(public_class=PublicQuoteDAO, private_class=PrivateQuoteDAO)
+    document = {"_id": ObjectId(), "content": "Quote", "author": "Someone", "category": "life",
+                "language": "english", "is_edit": False}
+    private_dao._collection.find_one_and_delete.return_value = document
+    service = ApprovalService(Quote, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+
+    assert service.approve(str(document["_id"])).get_error_tag() == "GeneralSuccess"
+    assert public_dao._collection.update_one.call_args.args[1]["$setOnInsert"]["used_date"] == ""
+
+def test_approve_many_quote_edit_keeps_used_date():
+    client, session, public_dao, private_dao = _setup(public_class=PublicQuoteDAO, private_class=PrivateQuoteDAO)
+    original_id = ObjectId()
+    document = {"_id": ObjectId(), "content": "Quote", "author": "Someone", "language": "english",
+                "used_date": "", "is_edit": True, "original_id": original_id}
+    private_dao._collection.find.return_value = [document]
+    public_dao._collection.find.return_value = [{"_id": original_id}]
+    service = ApprovalService(Quote, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+
+    assert service.approve_many([str(document["_id"])]).get_error_tag() == "GeneralSuccess"
+    operation = public_dao._collection.bulk_write.call_args.args[0][0]
+    assert "used_date" not in operation._doc["$set"]
+
+@pytest.mark.parametrize("credentials, ID, error_tag", [
+    (employee, str(ObjectId()), "PermissionIncongruency"),
+    (manager, "not-an-id", "MalformedContent"),
+])
+def test_approve_rejects_before_any_write(credentials, ID, error_tag):
+    client, session, public_dao, private_dao = _setup()
+    service = ApprovalService(Joke, public_dao.with_credentials(credentials), private_dao.with_credentials(credentials))
+    assert service.approve(ID).get_error_tag() == error_tag
+    private_dao._collection.find_one_and_delete.assert_not_called()
+
+# ---------------- Batches ---------------- #
+
+def test_approve_many_reports_each_id():
+    client, session, public_dao, private_dao = _setup()
+    new = _joke_document()
+    edit = _joke_document(is_edit=True, original_id=str(ObjectId()))
+    orphan = _joke_document(is_edit=True, original_id=str(ObjectId()))
+    invalid = _joke_document(level=7)
+    missing = str(ObjectId())
+    private_dao._collection.find.return_value = [new, edit, orphan, invalid]
+    public_dao._collection.find.return_value = [{"_id": ObjectId(edit["original_id"])}]
+    service = ApprovalService(Joke, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+
+    IDs = [str(new["_id"]), str(edit["_id"]), str(orphan["_id"]), str(invalid["_id"]), missing, "bad-id", str(new["_id"])]
+    result = service.approve_many(IDs)
+    assert result.get_error_tag() == "BulkPartialSuccess"
+    outcomes = [(item["status"], item.get("code_tag")) for item in result.get_data()["results"]]
+    assert outcomes == [("approved", None), ("approved", None), ("failed", "ResourceNotFound"),
+                        ("failed", "InvalidRecord"), ("failed", "ResourceNotFound"), ("failed", "MalformedContent")]
+    operations = public_dao._collection.bulk_write.call_args.args[0]
+    assert [operation._filter for operation in operations] == [{"_id": new["_id"]}, {"_id": ObjectId(edit["original_id"])}]
+    assert public_dao._collection.bulk_write.call_args.kwargs == {"ordered": False}
+    private_dao._collection.delete_many.assert_called_once_with({"_id": {"$in": [new["_id"], edit["_id"]]}})
+
+def test_approve_many_strips_unsanitized_content():
+    client, session, public_dao, private_dao = _setup()
+    document = _joke_document(content={"type": "one_liner", "text": "Funny<script>alert(1)</script> {x}"})
+    private_dao._collection.find.return_value = [document]
+    service = ApprovalService(Joke, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+
+    assert service.approve_many([str(document["_id"])]).get_error_tag() == "GeneralSuccess"
+    operation = public_dao._collection.bulk_write.call_args.args[0][0]
+    assert operation._doc["$setOnInsert"]["content"]["text"] == "Funny "
+
+def test_approve_many_keeps_failed_writes_pending():
+    client, session, public_dao, private_dao = _setup()
+    first, second = _joke_document(), _joke_document()
+    private_dao._collection.find.return_value = [first, second]
+    public_dao._collection.bulk_write.side_effect = BulkWriteError(
+        {"writeErrors": [{"index": 0, "code": 121, "errmsg": "Document failed validation"}]})
+    service = ApprovalService(Joke, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+
+    result = service.approve_many([str(first["_id"]), str(second["_id"])])
+    assert result.get_data()["results"][0]["code_tag"] == "CollectionInvalid"
+    private_dao._collection.delete_many.assert_called_once_with({"_id": {"$in": [second["_id"]]}})
+
+def test_deny_many():
+    client, session, public_dao, private_dao = _setup()
+    found = ObjectId()
+    private_dao._collection.find.return_value = [{"_id": found}]
+    service = ApprovalService(Joke, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+
+    result = service.deny_many([str(found), str(ObjectId())])
+    assert result.get_error_tag() == "BulkPartialSuccess"
+    assert [item["status"] for item in result.get_data()["results"]] == ["denied", "failed"]
+    private_dao._collection.delete_many.assert_called_once_with({"_id": {"$in": [found]}})
+
+@pytest.mark.parametrize("IDs", [[], [str(ObjectId()) for _ in range(MAX_BATCH_IDS + 1)]])
+def test_batch_size_limits(IDs):
+    client, session, public_dao, private_dao = _setup()
+    service = ApprovalService(Joke, public_dao.with_credentials(manager), private_dao.with_credentials(manager))
+    assert service.approve_many(IDs).get_error_tag() == "MalformedContent"
+    assert service.deny_many(IDs).get_error_tag() == "MalformedContent"
@@ -0,0 +1,87 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import pytest
+import requests
+from all_the_buzz.utilities.auth_client import AuthClient
+
+"""
+This file runs mock tests on the pooled authentication server client in auth_client.py
+"""
+
+@pytest.fixture
+def session(mocker):
+    mock_session = mocker.Mock()
+    mock_session.headers = {}
+    mocker.patch("all_the_buzz.utilities.auth_client.requests.Session", return_value=mock_session)
+    mocker.patch("all_the_buzz.utilities.auth_client.time.sleep")
+    return mock_session
+
+@pytest.fixture
+def client(session):
+    return AuthClient("https://fake-auth.com/verify", "https://fake-auth.com/ping", pool_size=4,
+                      connect_timeout=1, read_timeout=2, max_retries=2, health_check_interval=0)
+
+def test_session_is_pooled_and_sends_json(session, client):
+    assert session.mount.call_count == 2
+    adapter = session.mount.call_args[0][1]
+    assert adapter._pool_maxsize == 4
+    assert session.headers["Content-Type"] == "application/json"
+
+def test_verify_uses_timeouts(session, client, mocker):
+    session.post.return_value = mocker.Mock(status_code=200, json=lambda: {"id": 1})
+    assert client.verify({"token": "abc"}) == {"id": 1}
+    session.post.assert_called_once_with("https://fake-auth.com/verify", json={"token": "abc"}, timeout=(1, 2))
+
+def test_verify_retries_connection_errors(session, client, mocker):
+    session.post.side_effect = [requests.ConnectionError(), mocker.Mock(status_code=200, json=lambda: {"id": 1})]
+    assert client.verify({"token": "abc"}) == {"id": 1}
+    assert session.post.call_count == 2
+    assert client.is_healthy() is True
+
+def test_verify_retries_are_bounded(session, client):
+    session.post.side_effect = requests.Timeout()
+    with pytest.raises(requests.Timeout):
+        client.verify({"token": "abc"})
+    assert session.post.call_count == 3
+    assert client.is_healthy() is False
+
+def test_verify_retries_gateway_errors(session, client, mocker):
+    response = mocker.Mock(status_code=503)
+    response.json.side_effect = ValueError("not JSON")
+    session.post.return_value = response
+    with pytest.raises(requests.HTTPError, match="503"):
+        client.verify({"token": "abc"})
+    assert session.post.call_count == 3
+    response.json.assert_not_called()
+    session.get.return_value = mocker.Mock(status_code=503)
+    assert client.is_healthy() is False
+
+def test_verify_gateway_error_then_success(session, client, mocker):
+    session.post.side_effect = [mocker.Mock(status_code=502), mocker.Mock(status_code=200, json=lambda: {"id": 1})]
+    assert client.verify({"token": "abc"}) == {"id": 1}
+    assert client.is_healthy() is True
+
+def test_backoff_has_jitter(client):
+    delays = {client._backoff_delay(1) for _ in range(20)}
+    assert len(delays) > 1
+    assert all(0.2 <= delay <= 0.6 for delay in delays)
+
+def test_health_is_checked_once_then_cached(session, client, mocker):
+    session.get.return_value = mocker.Mock(status_code=200)
+    assert client.is_healthy() is True
+    assert client.is_healthy() is True
+    session.get.assert_called_once()
+
+def test_health_check_failure(session, client):
+    session.get.side_effect = requests.ConnectionError()
+    assert client.check_health() is False
+    assert client.is_healthy() is False
+
+def test_unhealthy_server_is_pinged_again(session, client, mocker):
+    session.get.side_effect = [requests.ConnectionError(), mocker.Mock(status_code=200)]
+    assert client.is_healthy() is False
+    assert client.is_healthy() is True
+    assert client.is_healthy() is True
+    assert session.get.call_count == 2
@@ -2,12 +2,37 @@
 # Licensed under the MIT License
 # See LICENSE for more details
 
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
 import pytest
+import all_the_buzz.utilities.authentication as auth_module
+from all_the_buzz.utilities.async_authentication import AsyncAuthVerifier
 from all_the_buzz.utilities.authentication import authentication
 from all_the_buzz.entities.credentials_entity import Credentials
 from all_the_buzz.utilities.error_handler import ResponseCode
 
 
+# Every test starts with an empty credential cache so results do not leak between tests
+@pytest.fixture(autouse=True)
+def reset_credential_cache():
+    auth_module._credential_cache = None
+    auth_module._cache_settings = None
+    auth_module._auth_client = None
+    auth_module._local_verifier = None
+    auth_module._local_verifier_loaded = False
+    yield
+    auth_module._credential_cache = None
+    auth_module._cache_settings = None
+    auth_module._auth_client = None
+    auth_module._local_verifier = None
+    auth_module._local_verifier_loaded = False
+
+
 # --- SUCCESS CASE ---
 def test_authentication_success(mocker):
     # Mock config file reader
@@ -24,13 +49,11 @@ def test_authentication_success(mocker):
     mock_token_obj.to_json_object.return_value = {"token": "abc123"}
     mocker.patch("all_the_buzz.utilities.authentication.Token.from_json_object", return_value=mock_token_obj)
 
-    # Mock requests.get (ping)
-    mocker.patch("all_the_buzz.utilities.authentication.requests.get", return_value=mocker.Mock(status_code=200))
-
-    # Mock requests.post (auth server)
-    mock_post_response = mocker.Mock()
-    mock_post_response.text = '{"id":1,"fName":"Alice","lName":"Smith","dept":"IT","title":"Manager","loc":"HQ"}'
-    mocker.patch("all_the_buzz.utilities.authentication.requests.post", return_value=mock_post_response)
+    # Mock the pooled auth client (health state and verify call)
+    mock_client = mocker.Mock()
+    mock_client.is_healthy.return_value = True
+    mock_client.verify.return_value = {"id":1,"fName":"Alice","lName":"Smith","dept":"IT","title":"Manager","loc":"HQ"}
+    mocker.patch("all_the_buzz.utilities.authentication.get_auth_client", return_value=mock_client)
 
     # Mock Credentials.from_json_object
     mock_creds = Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Manager", loc="HQ")
@@ -75,7 +98,7 @@ def test_authentication_server_down(mocker):
     mocker.patch("all_the_buzz.utilities.authentication.Token.from_json_object", return_value=mocker.Mock(to_json_object=lambda: {"token": "abc123"}))
 
     # Simulate server down
-    mocker.patch("all_the_buzz.utilities.authentication.requests.get", side_effect=Exception("Server down"))
+    mocker.patch("all_the_buzz.utilities.authentication.get_auth_client", return_value=mocker.Mock(is_healthy=lambda: False))
 
     result = authentication({"token": "abc123"})
     assert isinstance(result, ResponseCode)
@@ -90,10 +113,12 @@ def test_authentication_auth_server_error(mocker):
     })
     mocker.patch("all_the_buzz.utilities.authentication.sanitize_json", side_effect=lambda x: x)
     mocker.patch("all_the_buzz.utilities.authentication.Token.from_json_object", return_value=mocker.Mock(to_json_object=lambda: {"token": "abc123"}))
-    mocker.patch("all_the_buzz.utilities.authentication.requests.get", return_value=mocker.Mock(status_code=200))
+    mock_client = mocker.Mock()
+    mock_client.is_healthy.return_value = True
 
     # Simulate POST failure
-    mocker.patch("all_the_buzz.utilities.authentication.requests.post", side_effect=Exception("Auth server error"))
+    mock_client.verify.side_effect = Exception("Auth server error")
+    mocker.patch("all_the_buzz.utilities.authentication.get_auth_client", return_value=mock_client)
 
     result = authentication({"token": "abc123"})
     assert isinstance(result, ResponseCode)
@@ -108,15 +133,191 @@ def test_authentication_unauthorized_token(mocker):
     })
     mocker.patch("all_the_buzz.utilities.authentication.sanitize_json", side_effect=lambda x: x)
     mocker.patch("all_the_buzz.utilities.authentication.Token.from_json_object", return_value=mocker.Mock(to_json_object=lambda: {"token": "abc123"}))
-    mocker.patch("all_the_buzz.utilities.authentication.requests.get", return_value=mocker.Mock(status_code=200))
-
-    mock_post_response = mocker.Mock()
-    mock_post_response.text = '{"id":1,"fName":"Alice"}'  # incomplete data
-    mocker.patch("all_the_buzz.utilities.authentication.requests.post", return_value=mock_post_response)
+    mock_client = mocker.Mock()
+    mock_client.is_healthy.return_value = True
+    mock_client.verify.return_value = {"id":1,"fName":"Alice"}  # incomplete data
+    mocker.patch("all_the_buzz.utilities.authentication.get_auth_client", return_value=mock_client)
 
     # Simulate Credentials validation failure
     mocker.patch("all_the_buzz.utilities.authentication.Credentials.from_json_object", side_effect=ValueError("Unauthorized"))
 
     result = authentication({"token": "abc123"})
     assert isinstance(result, ResponseCode)
-    assert result.get_error_tag() == "UnauthorizedToken"
\ No newline at end of file
+    assert result.get_error_tag() == "UnauthorizedToken"
+
+
+# --- CREDENTIAL CACHE ---
+def _mock_auth_server(mocker, response):
+    mocker.patch("all_the_buzz.utilities.authentication.sanitize_json", side_effect=lambda x: x)
+    mocker.patch("all_the_buzz.utilities.authentication.Token.from_json_object", return_value=mocker.Mock(to_json_object=lambda: {"token": "abc123"}))
+    mock_client = mocker.Mock()
+    mock_client.is_healthy.return_value = True
+    mock_client.verify.return_value = response
+    mocker.patch("all_the_buzz.utilities.authentication.get_auth_client", return_value=mock_client)
+    return mock_client.is_healthy, mock_client.verify
+
+def test_authentication_cache_hit_skips_server(mocker):
+    ping, post = _mock_auth_server(mocker, {"id":1,"fName":"Alice","lName":"Smith","dept":"IT","title":"Manager","loc":"HQ"})
+
+    first = authentication({"token": "abc123"})
+    second = authentication({"token": "abc123"})
+
+    assert isinstance(second, Credentials)
+    assert second is first
+    assert post.call_count == 1
+    assert ping.call_count == 1
+    stats = auth_module.get_credential_cache().stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+def test_authentication_caches_rejected_token(mocker):
+    ping, post = _mock_auth_server(mocker, {"id":1,"fName":"Alice"})
+
+    first = authentication({"token": "abc123"})
+    second = authentication({"token": "abc123"})
+
+    assert first.get_error_tag() == "UnauthorizedToken"
+    assert second.get_error_tag() == "UnauthorizedToken"
+    assert post.call_count == 1
+
+def test_authentication_does_not_cache_server_errors(mocker):
+    ping, post = _mock_auth_server(mocker, None)
+    post.side_effect = [Exception("Auth server error"), {"id":1,"fName":"Alice","lName":"Smith","dept":"IT","title":"Manager","loc":"HQ"}]
+
+    assert authentication({"token": "abc123"}).get_error_tag() == "AuthServerError"
+    assert isinstance(authentication({"token": "abc123"}), Credentials)
+    assert post.call_count == 2
+
+# --- REQUEST COALESCING ---
+def test_concurrent_authentications_share_one_server_call(mocker):
+    ping, post = _mock_auth_server(mocker, None)
+    started = threading.Event()
+
+    def slow_verify(token):
+        started.set()
+        time.sleep(0.2)
+        return {"id":1,"fName":"Alice","lName":"Smith","dept":"IT","title":"Manager","loc":"HQ"}
+    post.side_effect = slow_verify
+
+    results = []
+    def worker():
+        results.append(authentication({"token": "abc123"}))
+
+    leader = threading.Thread(target=worker)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in followers:
+        thread.start()
+    for thread in followers + [leader]:
+        thread.join()
+
+    assert post.call_count == 1
+    assert len(results) == 5
+    assert all(result is results[0] for result in results)
+
+def test_concurrent_first_requests_create_one_client(mocker):
+    mocker.patch("all_the_buzz.utilities.authentication.config_file_reader", return_value={
+        "uri": "https://fake-auth.com/login",
+        "ping_uri": "https://fake-auth.com/ping"
+    })
+    def slow_client(*args, **kwargs):
+        time.sleep(0.05)
+        return mocker.Mock()
+    client_class = mocker.patch("all_the_buzz.utilities.authentication.AuthClient", side_effect=slow_client)
+    mocker.patch("all_the_buzz.utilities.authentication.atexit.register")
+
+    clients = []
+    threads = [threading.Thread(target=lambda: clients.append(auth_module.get_auth_client())) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert client_class.call_count == 1
+    assert all(client is clients[0] for client in clients)
+
+def test_async_verifier_coalesces_and_runs_concurrently(mocker):
+    calls = []
+    def fake_authentication(token):
+        calls.append(token["token"])
+        time.sleep(0.1)
+        return Credentials(id=1, fName=token["token"], lName="Smith", dept="IT", title="Manager", loc="HQ")
+    mocker.patch("all_the_buzz.utilities.async_authentication.authentication", side_effect=fake_authentication)
+
+    verifier = AsyncAuthVerifier(max_concurrency=8)
+    tokens = [{"token": "a"}, {"token": "b"}, {"token": "a"}, {"token": "c"}]
+    start = time.monotonic()
+    results = asyncio.run(verifier.verify_many(tokens))
+    elapsed = time.monotonic() - start
+    verifier.close()
+
+    assert [result.fName for result in results] == ["a", "b", "a", "c"]
+    assert results[0] is results[2]
+    assert sorted(calls) == ["a", "b", "c"]
+    assert elapsed < 0.3
+
+def _hs256_token(secret, claims, kid="local-1"):
+    encode = lambda data: base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+    header = encode(json.dumps({"alg": "HS256", "kid": kid}).encode())
+    payload = encode(json.dumps(claims).encode())
+    signature = hmac.new(secret, f"{header}.{payload}".encode(), hashlib.sha256).digest()
+    return f"{header}.{payload}.{encode(signature)}"
+
+def _enable_local_verification(mocker, tmp_path, secret):
+    key_file = tmp_path / "jwt_keys.json"
+    key_file.write_text(json.dumps({"keys": [{"kty": "oct", "kid": "local-1", "alg": "HS256",
+        "k": base64.urlsafe_b64encode(secret).rstrip(b"=").decode("ascii")}]}))
+    mocker.patch("all_the_buzz.utilities.authentication.config_file_reader", return_value={
+        "uri": "https://fake-auth.com/login",
+        "ping_uri": "https://fake-auth.com/ping",
+        "local_verification": {"enabled": True, "key_file": str(key_file)},
+    })
+    mock_client = mocker.Mock()
+    mock_client.is_healthy.return_value = True
+    mock_client.verify.return_value = {"id":1,"fName":"Alice","lName":"Smith","dept":"IT","title":"Manager","loc":"HQ"}
+    mocker.patch("all_the_buzz.utilities.authentication.get_auth_client", return_value=mock_client)
+    return mock_client.verify
+
+_CLAIMS = {"id": 577, "first_name": "Auguste", "last_name": "Tweed", "department": "Sales",
+           "title": "Manager", "location": "United States", "sub": "Auguste Tweed"}
+
+def test_local_verification_skips_auth_server(mocker, tmp_path):
+    secret = b"local-test-secret"
+    verify = _enable_local_verification(mocker, tmp_path, secret)
+
+    token = _hs256_token(secret, dict(_CLAIMS, exp=time.time() + 600))
+    result = authentication({"token": token})
+    assert isinstance(result, Credentials)
+    assert (result.id, result.fName, result.dept, result.loc) == (577, "Auguste", "Sales", "United States")
+    verify.assert_not_called()
+
+def test_local_verification_rejects_bad_signature(mocker, tmp_path):
+    verify = _enable_local_verification(mocker, tmp_path, b"local-test-secret")
+
+    token = _hs256_token(b"wrong-secret", dict(_CLAIMS, exp=time.time() + 600))
+    result = authentication({"token": token})
+    assert isinstance(result, ResponseCode)
+    assert result.get_error_tag() == 'UnauthorizedToken'
+    verify.assert_not_called()
+
+def test_local_verification_falls_back_for_unknown_key(mocker, tmp_path):
+    secret = b"local-test-secret"
+    verify = _enable_local_verification(mocker, tmp_path, secret)
+
+    token = _hs256_token(secret, dict(_CLAIMS, exp=time.time() + 600), kid="rotated-2")
+    result = authentication({"token": token})
+    assert isinstance(result, Credentials)
+    assert result.fName == "Alice"
+    verify.assert_called_once()
+
+def test_local_verification_io_error_falls_back_to_server(mocker, tmp_path):
+    secret = b"local-test-secret"
+    verify = _enable_local_verification(mocker, tmp_path, secret)
+    mocker.patch("all_the_buzz.utilities.authentication.LocalJWTVerifier.verify", side_effect=OSError("disk error"))
+
+    token = _hs256_token(secret, dict(_CLAIMS, exp=time.time() + 600))
+    result = authentication({"token": token})
+    assert isinstance(result, Credentials)
+    assert result.fName == "Alice"
+    verify.assert_called_once()
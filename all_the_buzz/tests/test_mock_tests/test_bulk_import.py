@@ -0,0 +1,112 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import io
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from all_the_buzz.database_operations import bulk_import
+from all_the_buzz.database_operations.bulk_import import MalformedRecord, iter_json_records, import_records
+from all_the_buzz.entities.record_entities import Joke
+from all_the_buzz.utilities.error_handler import ResponseCode
+
+"""
+This file runs tests on the streaming parser and the batched import in bulk_import.py
+"""
+
+def _joke(text):
+    return {"level": 1, "content": {"type": "one_liner", "text": text}, "language": "english"}
+
+@pytest.fixture
+def small_reads():
+    #Forces values to cross chunk boundaries
+    with patch.object(bulk_import, "_READ_SIZE", 3):
+        yield
+
+# ---------------- iter_json_records ---------------- #
+
+def test_json_array_across_chunks(small_reads):
+    records = [_joke("a,]"), {"n": 12345678901234567890}, [1, 2.5], None, True]
+    assert list(iter_json_records(io.BytesIO(json.dumps(records).encode()))) == records
+
+def test_ndjson_reports_malformed_lines(small_reads):
+    stream = io.BytesIO(b'{"a": 1}\r\n\nnot json\n{"b": 2}')
+    records = list(iter_json_records(stream))
+    assert records[0] == {"a": 1} and records[2] == {"b": 2}
+    assert isinstance(records[1], MalformedRecord)
+
+def test_text_stream_and_empty_input():
+    assert list(iter_json_records(io.StringIO(' [ ] '))) == []
+    assert list(iter_json_records(io.BytesIO(b"   "))) == []
+
+@pytest.mark.parametrize("read_size", [1, 2, 3, 4])
+def test_json_array_numbers_across_chunks(read_size):
+    records = [1.5, 2e3, -0.25, 10, {"a": 1.75e-2}, 3E+2, 7]
+    with patch.object(bulk_import, "_READ_SIZE", read_size):
+        assert list(iter_json_records(io.BytesIO(b"[1.5, 2e3,-0.25 ,10,{\"a\": 1.75e-2},3E+2,7]"))) == records
+
+@pytest.mark.parametrize("content", [b"[1, 2", b"[1 2]", b"[tru]", b"[1,}", b"[1.]", b"[1.5x]"])
+def test_malformed_array_raises(content):
+    with pytest.raises(ValueError):
+        list(iter_json_records(io.BytesIO(content)))
+
+# ---------------- import_records ---------------- #
+
+def _dao_inserting_all():
+    dao = MagicMock()
+    def create_records(documents, chunk_size):
+        results = [{"index": i, "status": "inserted", "id": str(i)} for i in range(len(documents))]
+        return ResponseCode("PostSuccess", {"inserted": len(documents), "failed": 0, "results": results})
+    dao.create_records.side_effect = create_records
+    return dao
+
+def test_import_records_success_in_batches():
+    dao = _dao_inserting_all()
+    response = import_records(dao, Joke, [_joke(str(i)) for i in range(5)], batch_size=2)
+    assert response.get_error_tag() == "PostSuccess"
+    assert response.get_data()["inserted"] == 5
+    assert dao.create_records.call_count == 3
+
+def test_import_records_maps_indexes_across_batches():
+    dao = MagicMock()
+    def create_records(documents, chunk_size):
+        results = [{"index": 0, "status": "failed", "code_tag": "DuplicateKeyError", "message": "dup"}]
+        results += [{"index": i, "status": "inserted", "id": str(i)} for i in range(1, len(documents))]
+        return ResponseCode("BulkPartialSuccess", {"inserted": len(documents) - 1, "failed": 1, "results": results})
+    dao.create_records.side_effect = create_records
+    records = [_joke("a"), {"level": 7}, _joke("b"), MalformedRecord("Malformed JSON"), _joke("c"), _joke("d")]
+    response = import_records(dao, Joke, records, batch_size=3)
+    data = response.get_data()
+    assert response.get_error_tag() == "BulkPartialSuccess"
+    assert (data["received"], data["inserted"], data["invalid"], data["failed"]) == (6, 2, 2, 2)
+    assert [(item["index"], item["status"]) for item in data["errors"]] == [
+        (0, "failed"), (1, "invalid"), (3, "invalid"), (4, "failed")]
+
+def test_import_records_keeps_records_before_malformed_array(small_reads):
+    dao = _dao_inserting_all()
+    body = json.dumps([_joke("a"), _joke("b")])[:-1] + ', {"level": 1, "con'
+    response = import_records(dao, Joke, iter_json_records(io.BytesIO(body.encode())), batch_size=1)
+    data = response.get_data()
+    assert response.get_error_tag() == "BulkPartialSuccess"
+    assert dao.create_records.call_count == 2
+    assert (data["received"], data["inserted"], data["invalid"]) == (2, 2, 1)
+    assert data["errors"] == [{"index": 2, "status": "invalid", "errors": ["JSON array is malformed"]}]
+
+def test_import_records_malformed_array_with_nothing_written():
+    dao = _dao_inserting_all()
+    response = import_records(dao, Joke, iter_json_records(io.BytesIO(b"[1 2]")))
+    assert response.get_error_tag() == "MalformedContent"
+    assert response.get_data()["errors"][-1]["index"] == 1
+    dao.create_records.assert_not_called()
+
+def test_import_records_applies_overrides():
+    dao = _dao_inserting_all()
+    import_records(dao, Joke, [_joke("a")], overrides={"is_edit": False})
+    assert dao.create_records.call_args.args[0][0]["is_edit"] is False
+
+def test_import_records_returns_dao_errors():
+    dao = MagicMock()
+    dao.create_records.return_value = ResponseCode("PermissionIncongruency")
+    response = import_records(dao, Joke, [_joke("a")])
+    assert response.get_error_tag() == "PermissionIncongruency"
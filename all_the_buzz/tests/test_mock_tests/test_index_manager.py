@@ -0,0 +1,55 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+from unittest.mock import MagicMock
+from pymongo.errors import OperationFailure
+from all_the_buzz.database_operations.index_manager import ensure_indexes, indexed_filter_fields, uncovered_filters, main
+from all_the_buzz.db_schemas.index_specs import INDEX_SPECS, FILTERABLE_FIELDS
+
+"""
+This file runs mock tests on the index creation in index_manager.py
+"""
+
+def test_ensure_indexes_creates_each_declared_index():
+    database = MagicMock()
+    report = ensure_indexes(database)
+    assert set(report) == set(INDEX_SPECS)
+    total = sum(len(specs) for specs in INDEX_SPECS.values())
+    assert database.__getitem__.return_value.create_indexes.call_count == total
+
+def test_ensure_indexes_passes_partial_filter():
+    database = MagicMock()
+    specs = {"quotes_public": [{"name": "unused_quotes", "keys": [("used_date", 1), ("_id", 1)],
+                                "partialFilterExpression": {"used_date": ""}}]}
+    ensure_indexes(database, specs)
+    model = database["quotes_public"].create_indexes.call_args.args[0][0]
+    assert model.document["name"] == "unused_quotes"
+    assert model.document["partialFilterExpression"] == {"used_date": ""}
+    assert list(model.document["key"].items()) == [("used_date", 1), ("_id", 1)]
+
+def test_ensure_indexes_continues_after_conflict():
+    database = MagicMock()
+    database["jokes_public"].create_indexes.side_effect = [OperationFailure("IndexOptionsConflict"), None]
+    specs = {"jokes_public": [{"name": "a", "keys": [("a", 1)]}, {"name": "b", "keys": [("b", 1)]}]}
+    assert ensure_indexes(database, specs) == {"jokes_public": {"ensured": ["b"], "failed": ["a"]}}
+
+def test_declared_indexes_cover_api_filters():
+    assert uncovered_filters() == {}
+    assert set(FILTERABLE_FIELDS) <= set(INDEX_SPECS)
+
+def test_uncovered_filters_ignores_partial_and_non_prefix_indexes():
+    specs = {"quotes_public": [
+        {"name": "category_language", "keys": [("category", 1), ("language", 1)]},
+        {"name": "used", "keys": [("used_date", 1)], "partialFilterExpression": {"used_date": {"$gt": ""}}},
+    ]}
+    filterable = {"quotes_public": ["category", "language", "used_date"]}
+    assert uncovered_filters(specs, filterable) == {"quotes_public": ["language", "used_date"]}
+
+def test_indexed_filter_fields():
+    assert indexed_filter_fields("quotes_public") == {"_id", "category", "language"}
+    assert indexed_filter_fields("unknown_collection") == {"_id"}
+
+def test_main_report_only(capsys):
+    assert main(["--report-only"]) == 0
+    assert "covered" in capsys.readouterr().out
@@ -0,0 +1,91 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import pytest
+from datetime import date
+from unittest.mock import MagicMock, patch
+from bson import ObjectId
+from all_the_buzz.database_operations.quotes_dao import PublicQuoteDAO
+from all_the_buzz.entities.credentials_entity import Credentials
+from all_the_buzz.utilities.error_handler import ResponseCode
+
+"""
+This file runs mock tests on the quote of the day selection in quotes_dao.py
+"""
+
+TODAY = date(2025, 3, 14)
+TODAY_STRING = "03/14/2025"
+
+@pytest.fixture
+def mock_collection():
+    collection = MagicMock()
+    collection.find_one.return_value = None
+    collection.count_documents.return_value = 5
+    return collection
+
+@pytest.fixture
+def dao(mock_collection):
+    mock_client = MagicMock()
+    mock_client.__getitem__.return_value.__getitem__.return_value = mock_collection
+    dao = PublicQuoteDAO(mock_client, "test_db")
+    return dao.with_credentials(Credentials(id=1, fName="Alice", lName="Smith", dept="IT", title="Employee", loc="HQ"))
+
+@pytest.fixture(autouse=True)
+def fixed_today():
+    with patch("all_the_buzz.database_operations.quotes_dao.date") as mock_date:
+        mock_date.today.return_value = TODAY
+        yield
+
+def candidate_cursor(mock_collection, candidate):
+    mock_collection.find.return_value.sort.return_value.skip.return_value.limit.return_value = [candidate] if candidate else []
+    return mock_collection.find.return_value.sort.return_value.skip
+
+def test_quote_of_day_claims_ranked_quote(dao, mock_collection):
+    quote_id = ObjectId()
+    skip = candidate_cursor(mock_collection, {"_id": quote_id})
+    claimed = {"_id": quote_id, "content": "Carpe diem", "used_date": TODAY_STRING}
+    mock_collection.find_one_and_update.return_value = claimed
+
+    result = dao.get_quote_of_day()
+    assert result.get_data() == claimed
+    skip.assert_called_once_with(PublicQuoteDAO._daily_rank(TODAY, 5))
+    mock_collection.find.assert_called_once_with({"used_date": ""}, {"_id": 1})
+    filter, update = mock_collection.find_one_and_update.call_args.args
+    assert filter == {"_id": quote_id, "used_date": ""}
+    assert update == {"$set": {"used_date": TODAY_STRING}}
+
+def test_quote_of_day_is_memoized_across_views(dao, mock_collection):
+    candidate_cursor(mock_collection, {"_id": ObjectId()})
+    mock_collection.find_one_and_update.return_value = {"_id": 1, "used_date": TODAY_STRING}
+    first = dao.get_quote_of_day().get_data()
+    other_view = dao.with_credentials(Credentials(id=2, fName="Bob", lName="Jones", dept="IT", title="Manager", loc="HQ"))
+    assert other_view.get_quote_of_day().get_data() is first
+    assert mock_collection.find_one_and_update.call_count == 1
+    assert mock_collection.find_one.call_count == 1
+
+def test_quote_of_day_reuses_existing_record(dao, mock_collection):
+    existing = {"_id": 1, "content": "Already chosen", "used_date": TODAY_STRING}
+    mock_collection.find_one.return_value = existing
+    assert dao.get_quote_of_day().get_data() == existing
+    mock_collection.find_one_and_update.assert_not_called()
+
+def test_quote_of_day_lost_race_returns_winner(dao, mock_collection):
+    candidate_cursor(mock_collection, {"_id": ObjectId()})
+    winner = {"_id": 2, "content": "Claimed elsewhere", "used_date": TODAY_STRING}
+    mock_collection.find_one.side_effect = [None, winner]
+    mock_collection.find_one_and_update.return_value = None
+    assert dao.get_quote_of_day().get_data() == winner
+
+def test_quote_of_day_resets_when_all_used(dao, mock_collection):
+    mock_collection.count_documents.side_effect = [0, 3]
+    candidate_cursor(mock_collection, {"_id": ObjectId()})
+    mock_collection.find_one_and_update.return_value = {"_id": 3, "used_date": TODAY_STRING}
+    assert dao.get_quote_of_day().get_data()["_id"] == 3
+    mock_collection.update_many.assert_called_once_with({}, {"$set": {"used_date": ""}})
+
+def test_quote_of_day_not_found(dao, mock_collection):
+    mock_collection.count_documents.return_value = 0
+    result = dao.get_quote_of_day()
+    assert isinstance(result, ResponseCode)
+    assert result.get_error_tag() == "ResourceNotFound"
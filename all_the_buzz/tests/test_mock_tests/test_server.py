@@ -2,11 +2,14 @@
 # Licensed under the MIT License
 # See LICENSE for more details
 
+import json
 import pytest
 from unittest.mock import patch, MagicMock
 from flask import Flask, jsonify
-from all_the_buzz.server import authentication_middleware, retrieve_daily_quote, approve_joke,retrieve_random_bio, retrieve_private_jokes_collection, create_a_new_joke, retrieve_public_jokes_collection, Credentials, ResponseCode
+from all_the_buzz.server import authentication_middleware, approve_jokes_batch, bulk_create_jokes, retrieve_daily_quote, approve_joke,retrieve_random_bio, retrieve_private_jokes_collection, create_a_new_joke, retrieve_public_jokes_collection, Credentials, ResponseCode
 from all_the_buzz.entities.record_entities import Joke
+from all_the_buzz.database_operations.jokes_dao import PublicJokeDAO, PrivateJokeDAO
+from bson import ObjectId
 
 """
 This file runs tests over the essential functionalities of the project, as specifically stated in the TeamWhite.pdf file
@@ -27,8 +30,10 @@ employee_creds = Credentials(id=2, fName="Bob", lName="Jones", dept="Eng", title
 app = Flask(__name__)
 app.add_url_rule("/jokes", view_func=retrieve_public_jokes_collection, methods=["GET"])
 app.add_url_rule("/jokes", view_func=create_a_new_joke, methods=["POST"])
+app.add_url_rule("/jokes/bulk", view_func=bulk_create_jokes, methods=["POST"])
 app.add_url_rule("/pending_jokes", view_func=retrieve_private_jokes_collection, methods=["GET"])
 app.add_url_rule("/jokes/<id>/approve", view_func=approve_joke, methods=["POST"])
+app.add_url_rule("/jokes/approve", view_func=approve_jokes_batch, methods=["POST"])
 app.add_url_rule("/bios/random/<int:amount>", view_func=retrieve_random_bio, methods=["GET"])
 app.add_url_rule("/daily-quotes", view_func=retrieve_daily_quote, methods=["GET"])
 
@@ -46,6 +51,12 @@ def client():
         with app.app_context():
             yield client
 
+@patch("all_the_buzz.server.authentication", side_effect=OSError("key file missing"))
+def test_authentication_exception_returns_auth_server_error(mock_auth, client):
+    response = client.get("/test", headers={"Bearer": "token"})
+    assert response.status_code == 502
+    assert response.json["code_tag"] == "AuthServerError"
+
 def test_missing_token(client):
     # with app.app_context():
     response = client.get("/test")  # No Bearer header
@@ -106,7 +117,7 @@ def test_get_filtered_jokes(mock_convert, mock_dao_factory, mock_auth, client):
     response = client.get("/jokes?difficulty=2", headers={"Bearer": "valid"})
     assert response.status_code == 200
     assert "filtered" in response.data.decode()
-    mock_dao.get_by_fields.assert_called_once_with({"difficulty": 2})
+    mock_dao.get_by_fields.assert_called_once_with({"difficulty": 2}, fields=None, raw=True)
 
 # --- Authorized user, invalid filter ---
 @patch("all_the_buzz.server.authentication")
@@ -130,6 +141,84 @@ def test_unauthorized_user(mock_auth, client):
     assert response.status_code == 401
 
 
+# --- Keyset pagination ---
+@patch("all_the_buzz.server.authentication")
+@patch("all_the_buzz.server.get_dao_set_credentials")
+def test_get_jokes_page(mock_dao_factory, mock_auth, client):
+    mock_auth.return_value = Credentials(id=1, fName="Test", lName="User", dept="Eng", title="Employee", loc="USA")
+    mock_dao = MagicMock()
+    mock_dao.get_page.return_value = {"records": [{"joke": "paged"}], "next_cursor": "655f1c2e9b1e8a3f4c2d1e0f"}
+    mock_dao_factory.return_value = mock_dao
+
+    response = client.get("/jokes?difficulty=2&limit=1&after=655f1c2e9b1e8a3f4c2d1e0e", headers={"Bearer": "valid"})
+    assert response.status_code == 200
+    assert json.loads(response.data) == {"records": [{"joke": "paged"}], "next_cursor": "655f1c2e9b1e8a3f4c2d1e0f"}
+    mock_dao.get_page.assert_called_once_with({"difficulty": "2"}, after="655f1c2e9b1e8a3f4c2d1e0e", limit=1, fields=None, raw=True)
+    mock_dao.get_all_records.assert_not_called()
+    mock_dao.get_by_fields.assert_not_called()
+
+@patch("all_the_buzz.server.authentication")
+@patch("all_the_buzz.server.get_dao_set_credentials")
+def test_get_jokes_page_invalid_limit(mock_dao_factory, mock_auth, client):
+    mock_auth.return_value = Credentials(id=1, fName="Test", lName="User", dept="Eng", title="Employee", loc="USA")
+    mock_dao_factory.return_value = MagicMock()
+
+    response = client.get("/jokes?limit=zero", headers={"Bearer": "valid"})
+    assert response.status_code == 400
+
+# --- Field projection ---
+@patch("all_the_buzz.server.authentication")
+@patch("all_the_buzz.server.get_dao_set_credentials")
+def test_get_jokes_with_fields(mock_dao_factory, mock_auth, client):
+    mock_auth.return_value = Credentials(id=1, fName="Test", lName="User", dept="Eng", title="Employee", loc="USA")
+    mock_dao = MagicMock()
+    mock_dao.get_all_records.return_value = [{"level": 2}]
+    mock_dao_factory.return_value = mock_dao
+
+    response = client.get("/jokes?fields=level,language", headers={"Bearer": "valid"})
+    assert response.status_code == 200
+    mock_dao.get_all_records.assert_called_once_with(fields=["level", "language"], raw=True)
+
+@patch("all_the_buzz.server.authentication")
+@patch("all_the_buzz.server.get_dao_set_credentials")
+def test_get_jokes_with_invalid_fields(mock_dao_factory, mock_auth, client):
+    mock_auth.return_value = Credentials(id=1, fName="Test", lName="User", dept="Eng", title="Employee", loc="USA")
+    mock_dao = MagicMock()
+    mock_dao.get_all_records.return_value = ResponseCode("InvalidFilter", "Fields cannot be selected: secret")
+    mock_dao_factory.return_value = mock_dao
+
+    response = client.get("/jokes?fields=secret", headers={"Bearer": "valid"})
+    assert response.status_code == 400
+    assert response.json["code_tag"] == "InvalidFilter"
+
+# --- Streaming ---
+@patch("all_the_buzz.server.authentication")
+@patch("all_the_buzz.server.get_dao_set_credentials")
+def test_stream_jokes_ndjson(mock_dao_factory, mock_auth, client):
+    mock_auth.return_value = Credentials(id=1, fName="Test", lName="User", dept="Eng", title="Manager", loc="USA")
+    mock_dao = MagicMock()
+    mock_dao.iter_records.return_value = iter([{"joke": "one"}, {"joke": "two"}])
+    mock_dao_factory.return_value = mock_dao
+
+    response = client.get("/jokes?stream=ndjson", headers={"Bearer": "valid"})
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert response.data.decode().splitlines() == ['{"joke":"one"}', '{"joke":"two"}']
+
+@patch("all_the_buzz.server.authentication")
+@patch("all_the_buzz.server.get_dao_set_credentials")
+def test_stream_pending_jokes_json_array(mock_dao_factory, mock_auth, client):
+    mock_auth.return_value = Credentials(id=1, fName="Test", lName="User", dept="Eng", title="Manager", loc="USA")
+    mock_dao = MagicMock()
+    mock_dao.iter_records.return_value = iter([{"joke": "one"}, {"joke": "two"}])
+    mock_dao_factory.return_value = mock_dao
+
+    response = client.get("/pending_jokes?stream=json", headers={"Bearer": "valid"})
+    assert response.status_code == 200
+    assert response.json == [{"joke": "one"}, {"joke": "two"}]
+    mock_dao.get_all_records.assert_not_called()
+
+
 # ------------------------------- create_a_new_joke as employee -------------------------------
 
 @patch("all_the_buzz.server.get_dao_set_credentials")
@@ -150,6 +239,52 @@ def test_employee_creates_joke_success(mock_auth, mock_joke, mock_dao, client):
     mock_dao_instance.create_record.assert_called_once()
 
 
+@patch("all_the_buzz.server.get_dao_set_credentials")
+@patch("all_the_buzz.server.authentication", return_value=employee_creds)
+def test_employee_joke_is_stored_sanitized(mock_auth, mock_dao, client):
+    mock_dao_instance = MagicMock()
+    mock_dao_instance.create_record.return_value = ResponseCode("PendingSuccess")
+    mock_dao.return_value = mock_dao_instance
+
+    response = client.post("/jokes", json={
+        "level": 1,
+        "content": {"type": "one_liner", "text": "Funny <script>alert(1)</script>joke {x} $var"},
+        "language": "english"
+    })
+    assert response.status_code == 202
+    stored = mock_dao_instance.create_record.call_args.args[0]
+    assert stored["content"]["text"] == "Funny joke  "
+    assert stored["is_edit"] is False
+
+
+# ------------------------------- bulk create jokes -------------------------------
+
+@patch("all_the_buzz.server.get_dao_set_credentials")
+@patch("all_the_buzz.server.authentication", return_value=employee_creds)
+def test_employee_bulk_creates_jokes(mock_auth, mock_dao, client):
+    mock_dao_instance = MagicMock()
+    mock_dao_instance.create_records.return_value = ResponseCode("BulkPartialSuccess", {
+        "inserted": 1, "failed": 1, "results": [{"index": 0, "status": "inserted", "id": "x"},
+            {"index": 1, "status": "failed", "code_tag": "DuplicateKeyError", "message": "dup"}]})
+    mock_dao.return_value = mock_dao_instance
+    joke = {"level": 1, "content": {"type": "one_liner", "text": "Funny joke"}, "language": "english"}
+    body = "\n".join(json.dumps(record) for record in (joke, {"level": 1}, joke))
+
+    response = client.post("/jokes/bulk?chunk_size=50", data=body, content_type="application/x-ndjson")
+    assert response.status_code == 207
+    assert mock_dao.call_args.args[1] == "PrivateJokeDAO"
+    documents, chunk_size = mock_dao_instance.create_records.call_args.args
+    assert chunk_size == 50 and all(document["is_edit"] is False for document in documents)
+    assert [item["index"] for item in response.json["data"]["errors"]] == [1, 2]
+
+@patch("all_the_buzz.server.get_dao_set_credentials")
+@patch("all_the_buzz.server.authentication", return_value=manager_creds)
+def test_bulk_create_rejects_malformed_array(mock_auth, mock_dao, client):
+    response = client.post("/jokes/bulk", data="[{}", content_type="application/json")
+    assert response.status_code == 400
+    assert response.json["code_tag"] == "MalformedContent"
+
+
 # ------------------------------- retrieve private jokes collection -------------------------------
 
 @patch("all_the_buzz.server.get_dao_set_credentials")
@@ -165,6 +300,14 @@ def test_manager_retrieves_private_jokes(mock_auth, mock_dao, client):
     mock_dao_instance.get_all_records.assert_called_once()
     mock_dao_instance.clear_credentials.assert_called_once()
 
+@patch("all_the_buzz.server.get_dao_set_credentials")
+@patch("all_the_buzz.server.authentication", return_value=manager_creds)
+def test_empty_private_jokes_returns_not_found(mock_auth, mock_dao, client):
+    mock_dao.return_value.get_all_records.return_value = ResponseCode("ResourceNotFound")
+    response = client.get("/pending_jokes")
+    assert response.status_code == 404
+    assert response.json["code_tag"] == "ResourceNotFound"
+
 @patch("all_the_buzz.server.authentication", return_value=employee_creds)
 def test_employee_unauthorized_access(mock_auth, client):
     response = client.get("/pending_jokes")
@@ -175,28 +318,38 @@ def test_employee_unauthorized_access(mock_auth, client):
 # ------------------------------- approve joke -------------------------------
 
 @patch("all_the_buzz.server.get_dao_set_credentials")
-@patch("all_the_buzz.server.Joke.from_json_object")
+@patch("all_the_buzz.server.ApprovalService")
 @patch("all_the_buzz.server.authentication", return_value=manager_creds)
-def test_manager_approves_new_joke(mock_auth, mock_joke, mock_dao, client):
-    # Mock Joke with is_edit=False
-    joke_instance = Joke()
-    joke_instance.is_edit = False
-    joke_instance.to_json_object = lambda: {"content": "Funny joke"}
-    mock_joke.return_value = joke_instance
-
-    # Mock DAOs
-    private_dao = MagicMock()
+def test_manager_approves_new_joke(mock_auth, mock_service, mock_dao, client):
+    # The move itself is covered in test_approval_service.py
     public_dao = MagicMock()
-    private_dao.get_by_key.return_value = {"id": "123", "content": "Funny joke"}
-    private_dao.delete_record.return_value = ResponseCode("GeneralSuccess")
-    public_dao.create_record.return_value = ResponseCode("PostSuccess")
-    mock_dao.side_effect = [private_dao, public_dao]
+    private_dao = MagicMock()
+    mock_dao.side_effect = [public_dao, private_dao]
+    mock_service.return_value.approve.return_value = ResponseCode("GeneralSuccess", {"public_id": "123", "deleted_count": 1})
 
     response = client.post("/jokes/123/approve")
     assert response.status_code == 200
-    private_dao.get_by_key.assert_called_once_with("123")
-    public_dao.create_record.assert_called_once()
-    private_dao.delete_record.assert_called_once_with("123")
+    assert response.json["data"]["public_id"] == "123"
+    mock_service.assert_called_once_with(Joke, public_dao, private_dao)
+    mock_service.return_value.approve.assert_called_once_with("123")
+
+@patch("all_the_buzz.server.get_dao_set_credentials")
+@patch("all_the_buzz.server.ApprovalService")
+@patch("all_the_buzz.server.authentication", return_value=manager_creds)
+def test_manager_approves_jokes_in_batch(mock_auth, mock_service, mock_dao, client):
+    mock_service.return_value.approve_many.return_value = ResponseCode("BulkPartialSuccess", {"approved": 1, "failed": 1, "results": [
+        {"id": "a", "status": "approved", "public_id": "a"}, {"id": "b", "status": "failed", "code_tag": "ResourceNotFound"}]})
+
+    response = client.post("/jokes/approve", json={"ids": ["a", "b"]})
+    assert response.status_code == 207
+    mock_service.return_value.approve_many.assert_called_once_with(["a", "b"])
+    assert [item["status"] for item in response.json["data"]["results"]] == ["approved", "failed"]
+
+@patch("all_the_buzz.server.authentication", return_value=manager_creds)
+def test_batch_approve_rejects_non_list(mock_auth, client):
+    response = client.post("/jokes/approve", json={"ids": "a"})
+    assert response.status_code == 400
+    assert response.json["code_tag"] == "MalformedContent"
 
 @patch("all_the_buzz.server.authentication", return_value=employee_creds)
 def test_employee_unauthorized(mock_auth, client):
@@ -206,15 +359,18 @@ def test_employee_unauthorized(mock_auth, client):
 
 @patch("all_the_buzz.server.get_dao_set_credentials")
 @patch("all_the_buzz.server.authentication", return_value=manager_creds)
-def test_get_by_key_failure(mock_auth, mock_dao, client):
-    private_dao = MagicMock()
-    public_dao = MagicMock()
-    private_dao.get_by_key.side_effect = Exception("RecordNotFound")
-    mock_dao.side_effect = [private_dao, public_dao]
+def test_approve_pending_joke_not_found(mock_auth, mock_dao, client):
+    mongo_client = MagicMock()
+    mongo_client.topology_description.topology_type_name = "Single"
+    public_dao = PublicJokeDAO(mongo_client, "test_db").with_credentials(manager_creds)
+    private_dao = PrivateJokeDAO(mongo_client, "test_db").with_credentials(manager_creds)
+    private_dao._collection.database.client = mongo_client
+    private_dao._collection.find_one_and_delete.return_value = None
+    mock_dao.side_effect = [public_dao, private_dao]
 
-    response = client.post("/jokes/123/approve")
-    assert response.status_code == 500
-    assert "RecordNotFound" in response.json["code_tag"]
+    response = client.post(f"/jokes/{ObjectId()}/approve")
+    assert response.status_code == 404
+    assert response.json["code_tag"] == "ResourceNotFound"
 
 
 # ------------------------------- retrieve public joke by difficulty -------------------------------
@@ -239,7 +395,7 @@ def test_employee_retrieves_jokes_by_difficulty(mock_auth, mock_filter, mock_dao
     data = response.data.decode()
     assert "Tech joke" in data
     assert "Another tech joke" in data
-    mock_dao_instance.get_by_fields.assert_called_once_with({"difficulty": 2})
+    mock_dao_instance.get_by_fields.assert_called_once_with({"difficulty": 2}, fields=None, raw=True)
     mock_dao_instance.clear_credentials.assert_called_once()
 
 
@@ -264,7 +420,7 @@ def test_employee_retrieves_random_bios(mock_auth, mock_dao, client):
     data = response.data.decode()
     assert "Funny bio" in data
     assert "Another bio" in data
-    mock_dao_instance.get_random.assert_called_once_with(2)
+    mock_dao_instance.get_random.assert_called_once_with(2, fields=None)
     mock_dao_instance.clear_credentials.assert_called_once()
 
 
@@ -300,3 +456,86 @@ def test_employee_retrieves_unused_quote(mock_auth, mock_dao, client):
 
 
 
+
+def test_request_log_context_sets_request_id_and_outcome():
+    from all_the_buzz.server import begin_request_log_context, finish_request_log_context, clear_request_log_context
+    from all_the_buzz.utilities.structured_logging import get_log_context
+    context_app = Flask("context_app")
+    seen = {}
+
+    @context_app.route("/context")
+    def context_route():
+        ResponseCode("ResourceNotFound")
+        seen.update(get_log_context())
+        return jsonify({}), 404
+
+    context_app.before_request(begin_request_log_context)
+    context_app.after_request(finish_request_log_context)
+    context_app.teardown_request(clear_request_log_context)
+    with context_app.test_client() as context_client:
+        response = context_client.get("/context", headers={"X-Request-ID": "req-42"})
+    assert response.headers["X-Request-ID"] == "req-42"
+    assert seen["route"] == "/context"
+    assert seen["outcome"] == "ResourceNotFound"
+    assert get_log_context() is None
+
+
+# ------------------------------- resource registry -------------------------------
+
+def test_every_resource_registers_the_generic_routes():
+    from all_the_buzz.server import RESOURCES, MyFlask
+    registry_app = MyFlask("registry_app")
+    for resource in RESOURCES.values():
+        for rule, view_func, methods in resource.routes:
+            registry_app.add_url_rule(rule, view_func=view_func, methods=methods, provide_automatic_options=False)
+    rules = {(rule.rule, method) for rule in registry_app.url_map.iter_rules() for method in rule.methods - {"HEAD"}}
+    for name in ("jokes", "quotes", "trivias", "bios"):
+        assert (f"/{name}", "GET") in rules
+        assert (f"/{name}", "POST") in rules
+        assert (f"/pending-{name}", "GET") in rules
+        assert (f"/{name}/<string:record_id>", "PUT") in rules
+        assert (f"/random-{name}/<int:amount>", "GET") in rules
+        assert (f"/{name}/bulk", "POST") in rules
+        assert (f"/{name}/approve", "POST") in rules
+    assert ("/daily-quotes", "GET") in rules
+    assert ("/short-quotes/<int:amount>", "GET") in rules
+    assert "update_trivia" in registry_app.view_functions
+
+@patch("all_the_buzz.server.get_dao_set_credentials")
+@patch("all_the_buzz.server.authentication", return_value=employee_creds)
+def test_employee_update_is_stored_as_pending_edit(mock_auth, mock_dao, client):
+    from all_the_buzz.server import update_joke
+    update_app = Flask("update_app")
+    update_app.add_url_rule("/jokes/<string:record_id>", view_func=update_joke, methods=["PUT"])
+    mock_dao_instance = MagicMock()
+    mock_dao_instance.create_record.return_value = ResponseCode("PostSuccess")
+    mock_dao.return_value = mock_dao_instance
+    record_id = str(ObjectId())
+
+    with update_app.test_client() as update_client:
+        response = update_client.put(f"/jokes/{record_id}", json={
+            "level": 1,
+            "content": {"type": "one_liner", "text": "Funny joke"},
+            "language": "english"
+        })
+    assert response.status_code == 202
+    assert mock_dao.call_args.args[1] == "PrivateJokeDAO"
+    created = mock_dao_instance.create_record.call_args.args[0]
+    assert created["original_id"] == ObjectId(record_id)
+    assert created["is_edit"] is True
+    mock_dao_instance.clear_credentials.assert_called_once()
+
+@patch("all_the_buzz.server.DAOFactory.get_dao")
+def test_bound_resource_skips_dao_lookup(mock_get_dao):
+    from all_the_buzz.server import RESOURCES, get_dao_set_credentials
+    resource = RESOURCES["bios"]
+    public_dao, private_dao = MagicMock(), MagicMock()
+    resource.bind(public_dao, private_dao)
+    try:
+        assert resource.public_dao is public_dao
+        get_dao_set_credentials(manager_creds, resource.private_dao)
+    finally:
+        resource.bind(None, None)
+    mock_get_dao.assert_not_called()
+    private_dao.with_credentials.assert_called_once_with(manager_creds)
+    assert resource.public_dao == "PublicBioDAO"
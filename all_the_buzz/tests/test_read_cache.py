@@ -0,0 +1,53 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+from datetime import datetime
+from all_the_buzz.database_operations.read_cache import ReadCache, make_key, seconds_until_midnight
+from all_the_buzz.utilities.error_handler import ResponseCode
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_make_key_normalizes_filter_order():
+    assert make_key("get_by_fields", {"level": 2, "language": "en"}) == make_key("get_by_fields", {"language": "en", "level": 2})
+    assert make_key("get_by_fields", {"level": 2}) != make_key("get_all_records", {"level": 2})
+
+def test_get_or_load_caches_until_ttl():
+    clock = FakeClock()
+    cache = ReadCache(max_size=4, ttl_seconds=10, clock=clock)
+    calls = []
+    loader = lambda: calls.append(1) or ["doc"]
+    assert cache.get_or_load("k", loader) == ["doc"]
+    assert cache.get_or_load("k", loader) == ["doc"]
+    assert len(calls) == 1
+    clock.now = 11
+    cache.get_or_load("k", loader)
+    assert len(calls) == 2
+
+def test_error_results_are_not_cached():
+    cache = ReadCache()
+    calls = []
+    def loader():
+        calls.append(1)
+        return ResponseCode("ResourceNotFound")
+    cache.get_or_load("k", loader)
+    cache.get_or_load("k", loader)
+    assert len(calls) == 2
+
+def test_invalidation_during_load_discards_stale_result():
+    cache = ReadCache()
+    def loader():
+        cache.invalidate_all()  # a write lands while the read is in progress
+        return ["stale"]
+    assert cache.get_or_load("k", loader) == ["stale"]
+    assert cache.get("k") is None
+    assert cache.stats()["generation"] == 1
+
+def test_seconds_until_midnight():
+    assert seconds_until_midnight(datetime(2025, 3, 14, 23, 59, 30)) == 30
+    assert seconds_until_midnight(datetime(2025, 12, 31, 0, 0, 0)) == 86400
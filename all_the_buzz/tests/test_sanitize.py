@@ -43,3 +43,72 @@ def test_sanitize_non_supported_type():
     input_val = 12345
     result = sanitize_json(input_val)
     assert result == 12345  # unchanged
+
+def _reference_clean(text):
+    #The original per-string cleaning, used to check the fast path does not change results
+    import re
+    import nh3
+    text = nh3.clean(text, tags=set())
+    text = re.sub(r"\{[^{}]*\}", "", text)
+    return re.sub(r"\$[a-zA-Z]+", "", text)
+
+def test_fast_path_returns_unchanged_string():
+    text = "Plain English text, with punctuation: 'quotes' \"too\" and 100%!"
+    assert sanitize_json(text) is text
+
+@pytest.mark.parametrize("text", [
+    "a & b", "1 < 2", "x > y", "line\r\nbreak", "non\xa0breaking", "\ufeffBOM", "nul\x00byte",
+    "{a}{b}", "{nested {x}}", "$$dollar", "$5 price", "<b>{x}</b>$y", "&amp; already", "x" * 100 + "<i>y</i>",
+])
+def test_matches_reference_cleaning(text):
+    assert sanitize_json(text) == _reference_clean(text)
+
+def test_random_strings_match_reference_cleaning():
+    import random
+    alphabet = "ab <>&{}$\r\n\x00\xa0\ufeff/\"'=;"
+    rng = random.Random(15)
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert sanitize_json(text) == _reference_clean(text)
+
+def test_nested_structure_is_preserved():
+    content = {"a": [{"b": "<b>x</b>"}, ["$y", 3, None]], "c": {"d": {"e": "{z}ok"}}, "f": 1.5}
+    assert sanitize_json(content) == {"a": [{"b": "x"}, ["", 3, None]], "c": {"d": {"e": "ok"}}, "f": 1.5}
+
+def test_deeply_nested_document_does_not_recurse():
+    content = "<b>deep</b>"
+    for _ in range(5000):
+        content = {"next": [content]}
+    result = sanitize_json(content)
+    for _ in range(5000):
+        result = result["next"][0]
+    assert result == "deep"
+
+def test_input_is_not_modified():
+    content = {"name": "<b>John</b>", "tags": ["$x"]}
+    sanitize_json(content)
+    assert content == {"name": "<b>John</b>", "tags": ["$x"]}
+
+def test_sanitize_many_matches_sanitize_json():
+    from all_the_buzz.utilities.sanitize import sanitize_many
+    documents = [
+        {"content": "<b>joke</b> {x}", "language": "English", "tags": ["$a", "ok", 1]},
+        ["<i>a</i>", {"n": None}],
+        "$plain text",
+        42,
+        {"content": "<b>joke</b> {x}"},
+    ]
+    assert sanitize_many(documents) == [sanitize_json(document) for document in documents]
+
+def test_sanitize_many_with_workers():
+    from all_the_buzz.utilities.sanitize import sanitize_many
+    documents = [{"content": f"<b>record {i}</b> &", "language": "English"} for i in range(1000)]
+    result = sanitize_many(documents, workers=4)
+    assert result == [{"content": f"record {i} &amp;", "language": "English"} for i in range(1000)]
+
+def test_sanitize_many_does_not_share_containers():
+    from all_the_buzz.utilities.sanitize import sanitize_many
+    documents = [{"name": "<b>x</b>"}, {"name": "<b>x</b>"}]
+    result = sanitize_many(documents)
+    result[0]["name"] = "changed"
+    assert result[1]["name"] == "x"
@@ -0,0 +1,78 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import threading
+import time
+import pytest
+from all_the_buzz.utilities.single_flight import SingleFlight
+
+def _run_concurrently(count, target):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def test_concurrent_calls_share_one_result():
+    flight = SingleFlight()
+    calls = []
+    results = []
+    started = threading.Event()
+
+    def slow():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return object()
+
+    def worker():
+        results.append(flight.do("key", slow))
+
+    leader = threading.Thread(target=worker)
+    leader.start()
+    started.wait()
+    _run_concurrently(5, worker)
+    leader.join()
+
+    assert len(calls) == 1
+    assert len(results) == 6
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"in_flight": 0, "shared": 5}
+
+def test_errors_are_shared_with_waiters():
+    flight = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise RuntimeError("boom")
+
+    def worker():
+        try:
+            flight.do("key", failing)
+        except RuntimeError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=worker)
+    leader.start()
+    started.wait()
+    _run_concurrently(3, worker)
+    leader.join()
+
+    assert len(errors) == 4
+    assert all(error is errors[0] for error in errors)
+
+def test_sequential_calls_run_again():
+    flight = SingleFlight()
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+
+def test_different_keys_do_not_share():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: "a") == "a"
+    assert flight.do("b", lambda: "b") == "b"
+    with pytest.raises(ValueError):
+        flight.do("c", int, "not a number")
@@ -0,0 +1,88 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import json
+import logging
+from unittest.mock import MagicMock
+from all_the_buzz.utilities.logger import _SmartLogger
+from all_the_buzz.utilities.structured_logging import (JsonLinesFormatter, LogSampler, RequestContextFilter,
+                                                       end_request, get_log_context, set_log_context, start_request)
+
+def _record(msg: str, *args) -> logging.LogRecord:
+    return logging.LogRecord("generalLogger", logging.DEBUG, __file__, 10, msg, args, None)
+
+def test_context_filter_outside_request_sets_empty_fields():
+    record = _record("hello")
+    assert RequestContextFilter().filter(record)
+    assert record.request_id is None
+    assert record.elapsed_ms is None
+
+def test_context_filter_copies_request_fields():
+    token = start_request("/jokes", "abc")
+    try:
+        set_log_context(dao="PublicJokeDAO", outcome="GeneralSuccess")
+        record = _record("hello")
+        RequestContextFilter().filter(record)
+    finally:
+        end_request(token)
+    assert (record.request_id, record.route, record.dao, record.outcome) == ("abc", "/jokes", "PublicJokeDAO", "GeneralSuccess")
+    assert record.elapsed_ms >= 0
+    assert get_log_context() is None
+
+def test_start_request_generates_request_id():
+    token = start_request("/jokes")
+    try:
+        assert len(get_log_context()["request_id"]) == 32
+    finally:
+        end_request(token)
+
+def test_set_log_context_outside_request_is_ignored():
+    set_log_context(outcome="GeneralSuccess")
+    assert get_log_context() is None
+
+def test_json_formatter_writes_one_object_per_record():
+    token = start_request("/quotes", "req-1")
+    try:
+        record = _record("Getting %s record by ID %s.", "PublicQuoteDAO", 5)
+        RequestContextFilter().filter(record)
+    finally:
+        end_request(token)
+    line = JsonLinesFormatter().format(record)
+    entry = json.loads(line)
+    assert "\n" not in line
+    assert entry["key"] == "Getting %s record by ID %s."
+    assert entry["message"] == "Getting PublicQuoteDAO record by ID 5."
+    assert entry["request_id"] == "req-1"
+    assert entry["route"] == "/quotes"
+    assert "dao" not in entry
+
+def test_sampler_message_rate_overrides_logger_rate():
+    sampler = LogSampler(1.0, {"generalLogger": 0.0}, {"kept": 1.0}, rand=lambda: 0.5)
+    assert sampler.keep("generalLogger", "kept")
+    assert not sampler.keep("generalLogger", "other")
+    assert sampler.keep("securityLogger", "other")
+
+def test_sampler_keeps_fraction_below_rate():
+    values = iter([0.001, 0.5])
+    sampler = LogSampler(0.01, rand=lambda: next(values))
+    assert sampler.keep("generalLogger", "msg")
+    assert not sampler.keep("generalLogger", "msg")
+
+def test_sampler_from_config_skips_when_everything_is_kept():
+    assert LogSampler.from_config({}) is None
+    assert LogSampler.from_config({"default_debug_rate": 1.0, "loggers": {"generalLogger": 1}}) is None
+    assert LogSampler.from_config({"loggers": {"generalLogger": 0.01}}) is not None
+
+def test_smart_logger_samples_debug_only():
+    sampler = MagicMock()
+    sampler.keep.return_value = False
+    logger = _SmartLogger("sampledTestLogger", sampler)
+    logger._logger = MagicMock()
+    logger._logger.name = "sampledTestLogger"
+    logger._logger.isEnabledFor.return_value = True
+    logger.debug("dropped %s", 1)
+    logger.info("kept %s", 1)
+    sampler.keep.assert_called_once_with("sampledTestLogger", "dropped %s")
+    logger._logger.debug.assert_not_called()
+    logger._logger.info.assert_called_once()
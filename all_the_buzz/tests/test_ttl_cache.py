@@ -0,0 +1,62 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import pytest
+from all_the_buzz.utilities.ttl_cache import TTLCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_get_and_set():
+    cache = TTLCache(max_size=2, ttl_seconds=10)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("missing", "default") == "default"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+def test_entries_expire():
+    clock = FakeClock()
+    cache = TTLCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_seconds=30)
+    clock.now = 11
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.stats()["expirations"] == 1
+
+def test_least_recently_used_is_evicted():
+    cache = TTLCache(max_size=2, ttl_seconds=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+def test_non_positive_ttl_is_not_stored():
+    cache = TTLCache()
+    cache.set("a", 1, ttl_seconds=0)
+    assert len(cache) == 0
+
+def test_invalidate_and_clear():
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
+
+@pytest.mark.parametrize("kwargs", [{"max_size": 0}, {"ttl_seconds": 0}])
+def test_invalid_settings(kwargs):
+    with pytest.raises(ValueError):
+        TTLCache(**kwargs)
@@ -0,0 +1,77 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, Union
+from all_the_buzz.entities.credentials_entity import Credentials
+from all_the_buzz.utilities.error_handler import ResponseCode
+from all_the_buzz.utilities.authentication import authentication
+
+'''
+async_authentication.py
+
+This module lets many tokens be authenticated concurrently from a single asyncio event loop.
+
+Classes:
+    AsyncAuthVerifier: runs authentication() for many tokens at once and coalesces duplicate tokens
+'''
+
+class AsyncAuthVerifier:
+    '''
+    Verifies tokens from an asyncio event loop. The authentication server client is blocking, so each
+    verification runs on a bounded thread pool while the event loop waits on all of them together.
+    Identical tokens that are being verified at the same time share one task and one result.
+    '''
+    def __init__(self, max_concurrency: int = 32, executor: Optional[ThreadPoolExecutor] = None):
+        '''
+        Args:
+            max_concurrency (int optional): the maximum number of verifications running at once
+            executor (ThreadPoolExecutor optional): the pool verifications run on; one is created if not given
+        '''
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+        self.__executor = executor or ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="auth-verify")
+        self.__in_flight: dict[str, asyncio.Task] = {}
+
+    async def verify(self, token: dict[str, str]) -> Union[Credentials, ResponseCode]:
+        '''
+        Authenticates one token
+
+        Args:
+            token (dict[str, str]): a dictionary in format {'token': <token string>}
+
+        Returns:
+            result (Credentials | ResponseCode): the same result authentication() would return
+        '''
+        key = str(token.get("token")) if isinstance(token, dict) else repr(token)
+        task = self.__in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.__run(token))
+            self.__in_flight[key] = task
+            task.add_done_callback(lambda _: self.__in_flight.pop(key, None))
+        #Shield the shared task so that one cancelled waiter does not cancel it for the others
+        return await asyncio.shield(task)
+
+    async def verify_many(self, tokens: Iterable[dict[str, str]]) -> list[Union[Credentials, ResponseCode]]:
+        '''
+        Authenticates many tokens concurrently
+
+        Args:
+            tokens (Iterable[dict[str, str]]): dictionaries in format {'token': <token string>}
+
+        Returns:
+            results (list[Credentials | ResponseCode]): one result per token, in the same order
+        '''
+        return list(await asyncio.gather(*(self.verify(token) for token in tokens)))
+
+    async def __run(self, token: dict[str, str]) -> Union[Credentials, ResponseCode]:
+        async with self.__semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.__executor, authentication, token)
+
+    def close(self) -> None:
+        '''
+        Shuts down the thread pool once running verifications finish
+        '''
+        self.__executor.shutdown(wait=True)
@@ -0,0 +1,164 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import random
+import threading
+import time
+from typing import Any, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from all_the_buzz.utilities.logger import LoggerFactory
+
+'''
+auth_client.py
+
+This module contains the HTTP client used to talk to the authentication server. A single client
+keeps a pool of keep-alive connections so that requests do not pay for a new TCP connection
+each time.
+
+Classes:
+    AuthClient: pooled client with timeouts, bounded retries and background health checks
+'''
+
+#Status codes that are worth retrying; anything else is returned to the caller as-is
+_RETRY_STATUS_CODES = {502, 503, 504}
+
+class AuthClient:
+    '''
+    Client for the authentication server. Connections are pooled in a requests.Session, every call
+    has a connect and read timeout, and verification is retried a bounded number of times with
+    jittered exponential backoff. Server health is tracked by a background thread so requests do not
+    have to ping the server themselves.
+    '''
+    def __init__(self, uri: str, ping_uri: str, pool_size: int = 16, connect_timeout: float = 2.0,
+                 read_timeout: float = 5.0, max_retries: int = 2, backoff_seconds: float = 0.2,
+                 health_check_interval: float = 30.0):
+        '''
+        Args:
+            uri (str): the verify endpoint of the authentication server
+            ping_uri (str): the ping endpoint of the authentication server
+            pool_size (int optional): the number of kept-alive connections; match the server's worker count
+            connect_timeout (float optional): seconds to wait for a connection to be established
+            read_timeout (float optional): seconds to wait for the server to respond
+            max_retries (int optional): how many times a failed verification is retried
+            backoff_seconds (float optional): base delay between retries; doubled on each attempt
+            health_check_interval (float optional): seconds between background pings; 0 disables them
+        '''
+        self.__logger = LoggerFactory.get_general_logger()
+        self.__uri = uri
+        self.__ping_uri = ping_uri
+        self.__timeout = (connect_timeout, read_timeout)
+        self.__max_retries = max_retries
+        self.__backoff_seconds = backoff_seconds
+        self.__health_check_interval = health_check_interval
+        self.__healthy: Optional[bool] = None
+        self.__stop_event = threading.Event()
+        self.__health_thread: Optional[threading.Thread] = None
+
+        self.__session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.__session.mount("http://", adapter)
+        self.__session.mount("https://", adapter)
+        self.__session.headers.update({"Content-Type": "application/json"})
+
+    def check_health(self) -> bool:
+        '''
+        Pings the authentication server once and records the result
+
+        Returns:
+            healthy (bool): True if the server answered the ping with a 200
+        '''
+        try:
+            response = self.__session.get(self.__ping_uri, timeout=self.__timeout)
+            healthy = response.status_code == 200
+        except requests.RequestException:
+            healthy = False
+        if healthy != self.__healthy:
+            self.__logger.info(f"Authentication server health changed to {'up' if healthy else 'down'}.")
+        self.__healthy = healthy
+        return healthy
+
+    def is_healthy(self) -> bool:
+        '''
+        Returns the last known health of the server. If it has never been checked or was last seen
+        down, it is pinged again now so a recovered server is used without waiting for the next
+        background check.
+        '''
+        if not self.__healthy:
+            return self.check_health()
+        return self.__healthy
+
+    def start_health_checks(self) -> None:
+        '''
+        Starts the background thread that pings the server every health_check_interval seconds
+        '''
+        if self.__health_check_interval <= 0:
+            return
+        if self.__health_thread is not None and self.__health_thread.is_alive():
+            return
+        self.__stop_event.clear()
+        self.__health_thread = threading.Thread(target=self.__health_loop, name="auth-health-check", daemon=True)
+        self.__health_thread.start()
+
+    def stop_health_checks(self) -> None:
+        '''
+        Stops the background health check thread if it is running
+        '''
+        self.__stop_event.set()
+        if self.__health_thread is not None:
+            self.__health_thread.join(timeout=self.__timeout[0] + self.__timeout[1])
+            self.__health_thread = None
+
+    def __health_loop(self) -> None:
+        while not self.__stop_event.wait(self.__health_check_interval):
+            self.check_health()
+
+    def _backoff_delay(self, attempt: int) -> float:
+        #Exponential backoff with jitter so that retries from many workers do not line up
+        return self.__backoff_seconds * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+    def verify(self, token: dict[str, str]) -> Any:
+        '''
+        Sends a token to the verify endpoint and returns the decoded JSON response. Connection errors,
+        timeouts and 502/503/504 responses are retried up to max_retries times; if every attempt fails,
+        the server is marked unhealthy.
+
+        Args:
+            token (dict[str, str]): a dictionary in format {'token': <token string>}
+
+        Returns:
+            content (Any): the decoded JSON body of the server's response
+
+        Exceptions:
+            requests.RequestException: the server could not be reached or answered 502/503/504 after every
+            retry (requests.HTTPError in the latter case)
+            ValueError: the server's response was not valid JSON
+        '''
+        attempt = 0
+        while True:
+            try:
+                response = self.__session.post(self.__uri, json=token, timeout=self.__timeout)
+                if response.status_code not in _RETRY_STATUS_CODES:
+                    self.__healthy = True
+                    return response.json()
+                if attempt >= self.__max_retries:
+                    #The body of a gateway error is usually an HTML page, so it is not parsed
+                    self.__healthy = False
+                    raise requests.HTTPError(f"Authentication server returned {response.status_code} after {attempt + 1} attempts",
+                                             response=response)
+                self.__logger.warning(f"Authentication server returned {response.status_code}; retrying.")
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.__max_retries:
+                    self.__healthy = False
+                    raise
+                self.__logger.warning("Authentication server unreachable; retrying.")
+            time.sleep(self._backoff_delay(attempt))
+            attempt += 1
+
+    def close(self) -> None:
+        '''
+        Stops background health checks and closes every pooled connection
+        '''
+        self.stop_health_checks()
+        self.__session.close()
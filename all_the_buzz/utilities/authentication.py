@@ -2,7 +2,6 @@
 # Licensed under the MIT License
 # See LICENSE for more details
 
-import requests
 from all_the_buzz.utilities.config import config_file_reader
 from all_the_buzz.entities.credentials_entity import Credentials, Token
 from all_the_buzz.utilities.sanitize import sanitize_json
@@ -14,7 +13,15 @@ from all_the_buzz.utilities.error_handler import ResponseCode
 from all_the_buzz.utilities.logger import LoggerFactory
 # from utilities.error_handler import ResponseCode
 # from utilities.logger import LoggerFactory
-from requests.exceptions import ConnectionError
+from all_the_buzz.utilities.ttl_cache import TTLCache
+from all_the_buzz.utilities.auth_client import AuthClient
+from all_the_buzz.utilities.single_flight import SingleFlight
+from all_the_buzz.utilities.jwt_verifier import LocalJWTVerifier, UnknownKeyError, claims_to_credentials_json
+import atexit
+import base64
+import hashlib
+import threading
+import time
 
 '''
 authentication.py
@@ -24,8 +31,136 @@ for obtaining credentials based on a passed token.
 
 Functions:
     - authentication: recieved a token and returns a credential object or error response.
+    - get_credential_cache: returns the cache of verified tokens, creating it on first use.
+    - get_auth_client: returns the pooled authentication server client, creating it on first use.
+    - get_local_verifier: returns the local JWT verifier if local verification is enabled.
 '''
 
+AUTH_CONFIG_PATH = "./all_the_buzz/configs/authentication_params.yaml"
+
+#Defaults for the verified-token cache; override them under "cache" in authentication_params.yaml
+_DEFAULT_CACHE_SETTINGS = {
+    "max_size": 1024,
+    "ttl_seconds": 300,
+    "negative_ttl_seconds": 30,
+}
+
+#Rejected tokens are cached as this tag instead of a Credentials object
+_REJECTED = "UnauthorizedToken"
+
+#Client settings read from "client" in authentication_params.yaml; anything missing uses AuthClient's defaults
+_CLIENT_SETTING_KEYS = ("pool_size", "connect_timeout", "read_timeout", "max_retries",
+                        "backoff_seconds", "health_check_interval")
+
+_credential_cache = None
+_cache_settings = None
+_auth_client = None
+_verify_in_flight = SingleFlight()
+_local_verifier = None
+_local_verifier_loaded = False
+#Guards the lazy creation above so concurrent first requests share one client, cache and verifier
+_init_lock = threading.Lock()
+
+#Settings read from "local_verification" in authentication_params.yaml
+_LOCAL_VERIFIER_SETTING_KEYS = ("refresh_seconds", "leeway_seconds", "issuer", "audience")
+
+def get_local_verifier():
+    '''
+    Returns the shared local JWT verifier. On first use, the "local_verification" section of the
+    config is read; if it is missing, disabled or its key file cannot be loaded, None is returned and
+    every token is verified by the authentication server.
+
+    Returns:
+        verifier (LocalJWTVerifier | None): the local verifier or None if local verification is off
+    '''
+    global _local_verifier, _local_verifier_loaded
+    if not _local_verifier_loaded:
+        with _init_lock:
+            if not _local_verifier_loaded:
+                try:
+                    settings = config_file_reader(AUTH_CONFIG_PATH).get("local_verification") or {}
+                    if settings.get("enabled"):
+                        _local_verifier = LocalJWTVerifier(
+                            settings["key_file"],
+                            **{key: settings[key] for key in _LOCAL_VERIFIER_SETTING_KEYS if key in settings})
+                except Exception:
+                    LoggerFactory.get_general_logger().warning("Could not load local JWT keys. Using authentication server only.")
+                    _local_verifier = None
+                _local_verifier_loaded = True
+    return _local_verifier
+
+def get_auth_client() -> AuthClient:
+    '''
+    Returns the shared authentication server client. On first use, the config file is read, the
+    client is created and its background health checks are started.
+
+    Returns:
+        client (AuthClient): the pooled client for the authentication server
+
+    Exceptions:
+        Exception: the config file could not be read or is missing the uris
+    '''
+    global _auth_client
+    if _auth_client is None:
+        with _init_lock:
+            if _auth_client is None:
+                data=config_file_reader(AUTH_CONFIG_PATH)
+                settings=data.get("client") or {}
+                client=AuthClient(data["uri"], data["ping_uri"],
+                                  **{key: settings[key] for key in _CLIENT_SETTING_KEYS if key in settings})
+                client.start_health_checks()
+                atexit.register(client.close)
+                _auth_client=client
+    return _auth_client
+
+def get_credential_cache() -> TTLCache:
+    '''
+    Returns the shared cache of verified tokens. On first use, the cache settings are read from
+    the authentication config; if they cannot be read, the defaults are used.
+
+    Returns:
+        cache (TTLCache): cache mapping a token hash to Credentials or a rejection tag
+    '''
+    global _credential_cache, _cache_settings
+    if _credential_cache is None:
+        with _init_lock:
+            if _credential_cache is None:
+                settings = dict(_DEFAULT_CACHE_SETTINGS)
+                try:
+                    settings.update(config_file_reader(AUTH_CONFIG_PATH).get("cache") or {})
+                except Exception:
+                    LoggerFactory.get_general_logger().warning("Could not read cache settings. Using defaults.")
+                _cache_settings = settings
+                _credential_cache = TTLCache(max_size=settings["max_size"], ttl_seconds=settings["ttl_seconds"])
+    return _credential_cache
+
+def _token_cache_key(token: str) -> str:
+    #Tokens are never stored in memory as-is; only their digest is
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+def _token_seconds_left(token: str):
+    '''
+    Reads the unverified "exp" claim of a JWT so that a cache entry never outlives its token.
+    This is only used to bound the cache lifetime, never to decide whether a token is valid.
+
+    Returns:
+        seconds_left (float | None): seconds until the token expires or None if it has no readable exp
+    '''
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload))["exp"]
+        return float(exp) - time.time()
+    except Exception:
+        return None
+
+def _cache_result(cache_key: str, token: str, result) -> None:
+    ttl = _cache_settings["negative_ttl_seconds"] if result == _REJECTED else _cache_settings["ttl_seconds"]
+    seconds_left = _token_seconds_left(token)
+    if seconds_left is not None:
+        ttl = min(ttl, seconds_left)
+    get_credential_cache().set(cache_key, result, ttl_seconds=ttl)
+
 def authentication(token) -> Credentials:
     '''
     Authenticates users credentials given generated json web token.
@@ -37,7 +172,6 @@ def authentication(token) -> Credentials:
         cred: a Credential object initialized from returned credentials.
     '''
     logger=LoggerFactory.get_general_logger()
-    secure_logger=LoggerFactory.get_security_logger()
 
     logger.debug("Begin authenticating token")
 
@@ -55,36 +189,70 @@ def authentication(token) -> Credentials:
     except ValueError as e:
         logger.error(e)
         return ResponseCode('InvalidToken')
+
+    # serve repeat tokens from the cache so they skip the authentication server
+    cache_key=_token_cache_key(valid_token["token"])
+    cached=get_credential_cache().get(cache_key)
+    if isinstance(cached, Credentials):
+        logger.debug("Credentials served from cache")
+        return cached
+    elif cached == _REJECTED:
+        logger.debug("Rejected token served from cache")
+        return ResponseCode('UnauthorizedToken')
+
+    # verify locally when the signing key is known; unknown keys fall through to the server
+    verifier=get_local_verifier()
+    if verifier is not None:
+        try:
+            claims=verifier.verify(valid_token["token"])
+            creds=Credentials.from_json_object(sanitize_json(claims_to_credentials_json(claims)))
+            logger.debug("Token verified locally")
+            _cache_result(cache_key, valid_token["token"], creds)
+            return creds
+        except UnknownKeyError:
+            logger.debug("Token key not in local key set. Falling back to authentication server.")
+        except OSError as e:
+            logger.error(f"Local token verification failed: {e}. Falling back to authentication server.")
+        except ValueError as e:
+            logger.error(e)
+            _cache_result(cache_key, valid_token["token"], _REJECTED)
+            return ResponseCode('UnauthorizedToken')
     
-    # load authenication server uris
-    logger.debug("Begin read in config file")
+    # concurrent requests carrying the same token share one authentication server call
+    return _verify_in_flight.do(cache_key, _verify_with_server, valid_token, cache_key)
+
+def _verify_with_server(valid_token: dict, cache_key: str):
+    '''
+    Verifies a validated token with the authentication server and caches the outcome. Only one
+    call per token runs at a time; see authentication().
+
+    Args:
+        valid_token: a validated dictionary in format {'token': <token string>}
+        cache_key: the digest of the token used as its cache key
+
+    Returns:
+        cred: a Credential object initialized from returned credentials or an error ResponseCode
+    '''
+    logger=LoggerFactory.get_general_logger()
+    secure_logger=LoggerFactory.get_security_logger()
+
+    # get the pooled authentication server client (config is only read the first time)
+    logger.debug("Begin loading authentication client")
     try:
-        data=config_file_reader("./all_the_buzz/configs/authentication_params.yaml")
-        uri=data["uri"]
-        ping_uri=data["ping_uri"]
-        logger.debug("Successfully loaded config file")
+        client=get_auth_client()
+        logger.debug("Successfully loaded authentication client")
     except:
         return ResponseCode("ConfigLoadError")
     
-    # check if server online
-    logger.debug("Pinging authentication server.")
-    try:
-        response=requests.get(ping_uri)
-        if response.status_code == 200:
-            logger.debug("Authentication Server is up.")
-        else:
-            raise ConnectionError("Could not connect to server")
-    except:
+    # check if server online using the health state kept by the client
+    if not client.is_healthy():
         return ResponseCode("ServerConnectionError")
+    logger.debug("Authentication Server is up.")
     
     # send sanitized and valid token to authenication server
-    headers={
-        "Content-Type": 'application/json'
-    }
     try:
         logger.debug("Begin requesting credentionals from authentication server.")
-        response=requests.post(uri, json=valid_token, headers=headers)
-        json_content=json.loads(response.text)
+        json_content=client.verify(valid_token)
         logger.debug("Successfully recieved response from authentication server.")
     except:
         # issue reaching server
@@ -106,10 +274,12 @@ def authentication(token) -> Credentials:
         logger.debug("Successfully loaded credentials.")
         # return credentials object
         secure_logger.info(f"{creds.fName} {creds.lName} credentials successfully validated")
+        _cache_result(cache_key, valid_token["token"], creds)
         return creds
     except ValueError as e:
         #print(e)
         logger.error(e)
+        _cache_result(cache_key, valid_token["token"], _REJECTED)
         return ResponseCode('UnauthorizedToken') # returns ResponseCode object which logs to general log
         
     
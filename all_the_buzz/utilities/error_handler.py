@@ -3,7 +3,46 @@
 # See LICENSE for more details
 
 from typing import Optional, Any
+import reprlib
 from all_the_buzz.utilities.logger import LoggerFactory
+from all_the_buzz.utilities.structured_logging import set_log_context
+
+_DEFAULT_PREVIEW_CHARS = 200
+
+class _PayloadSummary:
+    '''
+    Wraps a ResponseCode payload for logging. Nothing is formatted until a handler actually writes the
+    record, and then only a bounded summary is produced: type, length, record count and a truncated
+    preview. The full payload is only formatted if log_full_payload is set in the logging config.
+    '''
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Any):
+        self._data = data
+
+    def __str__(self) -> str:
+        data = self._data
+        if data is None:
+            return "None"
+        settings = LoggerFactory.get_response_logging_settings()
+        if settings.get("log_full_payload", False):
+            return str(data)
+        preview_chars = settings.get("preview_chars", _DEFAULT_PREVIEW_CHARS)
+        if isinstance(data, (str, bytes)):
+            preview = data[:preview_chars]
+            summary = f"<{type(data).__name__} length={len(data)}> "
+            return summary + (preview if isinstance(preview, str) else repr(preview)) + ("..." if len(data) > preview_chars else "")
+        limiter = reprlib.Repr()
+        limiter.maxstring = limiter.maxother = preview_chars
+        limiter.maxlist = limiter.maxtuple = 3
+        limiter.maxdict = 5
+        limiter.maxlevel = 3
+        preview = limiter.repr(data)
+        if len(preview) > preview_chars:
+            preview = preview[:preview_chars] + "..."
+        if isinstance(data, (list, tuple, set, dict)):
+            return f"<{type(data).__name__} count={len(data)}> {preview}"
+        return preview
 
 _RESPONSE_MAP = {
     #PyMongo Errors
@@ -54,6 +93,7 @@ _RESPONSE_MAP = {
     #Success Codes
     "GeneralSuccess": (200, "OK! Success!"),
     "PostSuccess": (201, "POST succeeded. Here is your database ID."),
+    "BulkPartialSuccess": (207, "Some of the records were written. See the per-item results for the others."),
     "PendingSuccess": (202, "Your edit or suggested file creation is being processed. It will be denied or approved by a moderator at a later time."),
 
     #employee title error
@@ -71,6 +111,19 @@ _RESPONSE_MAP = {
     "Missing required fields": (400, "Missing required fields")
 }
 
+def describe_error_tag(error_tag: str) -> tuple[int, str]:
+    '''
+    Looks up the HTTP code and message of a tag without creating (and logging) a ResponseCode; used for
+    per-item results of bulk operations
+    
+    Args:
+        error_tag (str): the name of the error in the RESPONSE_MAP
+
+    Returns:
+        description (tuple[int, str]): the HTTP code and message, or 500 and a generic message if the tag is unknown
+    '''
+    return _RESPONSE_MAP.get(error_tag, (500, "An unexpected error occurred."))
+
 class ResponseCode:
     '''
     This class wraps a detailed HTTP response code with a custom message and added data and automatically
@@ -88,10 +141,13 @@ class ResponseCode:
         self.__error_code, self.__message = _RESPONSE_MAP.get(error_tag, (500, "An unexpected error occurred."))
         self.__success = (self.__error_code < 300)
         self.__data = data
+        #The latest ResponseCode of a request is its outcome tag in the structured logs
+        set_log_context(outcome=str(error_tag))
+        #Formatting is deferred to the logging handlers and the payload is only summarized
         if(not self.__success):
-            self.__logger.error(f"{self.__error_code}. {error_tag}: {self.__message}\n\t\t\tdata: {self.__data}")
+            self.__logger.error("%s. %s: %s\n\t\t\tdata: %s", self.__error_code, error_tag, self.__message, _PayloadSummary(self.__data))
         else:
-            self.__logger.info(f"{self.__error_code}. {error_tag}: {self.__message}\n\t\t\tdata: {self.__data}")
+            self.__logger.info("%s. %s: %s\n\t\t\tdata: %s", self.__error_code, error_tag, self.__message, _PayloadSummary(self.__data))
 
     def get_success(self) -> bool:
         return self.__success
@@ -0,0 +1,101 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import datetime
+import json
+from typing import Any
+import bson
+from bson import json_util
+from bson.objectid import ObjectId
+from bson.raw_bson import RawBSONDocument
+
+try:
+    import orjson
+except ImportError: #the standard library encoder is used instead
+    orjson = None
+
+'''
+json_encoder.py
+
+This module serializes API responses to JSON bytes. It uses orjson when it is installed and the
+standard library json module otherwise; ObjectId and datetime values are converted by small handlers
+instead of walking every document with bson.json_util.
+
+Two output modes are supported:
+    extended: ObjectId and datetime are written as MongoDB relaxed extended JSON ({"$oid": ...} and
+        {"$date": "<ISO-8601>"}), the same as bson.json_util.dumps
+    plain: ObjectId is written as its hex string and datetime as an ISO-8601 UTC string
+
+Other BSON types (Decimal128, Binary, ...) are written as extended JSON in both modes. RawBSONDocuments
+(from DAO reads with raw=True) are decoded one at a time while they are written, so a listing never
+holds more than one decoded document.
+
+Classes:
+    JSONResponseEncoder: encodes values to JSON bytes in one of the output modes
+'''
+
+EXTENDED = "extended"
+PLAIN = "plain"
+JSON_MODES = (EXTENDED, PLAIN)
+
+class JSONResponseEncoder:
+    '''
+    Encodes documents and response bodies to UTF-8 JSON bytes
+    '''
+    def __init__(self, mode: str = EXTENDED):
+        '''
+        Args:
+            mode (str optional): "extended" or "plain" (defaults to extended)
+
+        Exceptions:
+            ValueError: the mode is not one of JSON_MODES
+        '''
+        if mode not in JSON_MODES:
+            raise ValueError(f"JSON output mode must be one of {', '.join(JSON_MODES)}, not {mode!r}")
+        self.__mode = mode
+        self.__default = self._extended if mode == EXTENDED else self._plain
+
+    @property
+    def mode(self) -> str:
+        return self.__mode
+
+    @staticmethod
+    def _extended(value: Any) -> Any:
+        if isinstance(value, ObjectId):
+            return {"$oid": str(value)}
+        if isinstance(value, RawBSONDocument):
+            return bson.decode(value.raw)
+        return json_util.default(value, json_util.RELAXED_JSON_OPTIONS)
+
+    @staticmethod
+    def _plain(value: Any) -> Any:
+        if isinstance(value, ObjectId):
+            return str(value)
+        if isinstance(value, RawBSONDocument):
+            return bson.decode(value.raw)
+        if isinstance(value, datetime.datetime):
+            return json_util.default(value, json_util.RELAXED_JSON_OPTIONS)["$date"]
+        return json_util.default(value, json_util.RELAXED_JSON_OPTIONS)
+
+    def encode(self, value: Any) -> bytes:
+        '''
+        Encodes a value to compact JSON
+
+        Args:
+            value (Any): a document, a list of documents or a response body
+
+        Returns:
+            encoded (bytes): the UTF-8 encoded JSON
+
+        Exceptions:
+            TypeError: the value contains a type that cannot be written as JSON
+        '''
+        if orjson is not None:
+            try:
+                #datetimes are passed to the handler so both backends write them the same way
+                return orjson.dumps(value, default=self.__default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+            except orjson.JSONEncodeError:
+                #orjson rejects some values json accepts, e.g. integers over 64 bits or non-string keys
+                pass
+        return json.dumps(value, default=self.__default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
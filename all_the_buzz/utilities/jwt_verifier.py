@@ -0,0 +1,230 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
+from typing import Any, Callable, Optional
+from all_the_buzz.utilities.logger import LoggerFactory
+
+'''
+jwt_verifier.py
+
+This module verifies JSON web tokens locally, without a round trip to the authentication server.
+Keys are read from a JSON key set file (JWKS format) and reloaded periodically.
+
+Supported algorithms: HS256, HS384, HS512 (shared secret, "k") and RS256, RS384, RS512 (RSA public
+key, "n" and "e").
+
+Classes:
+    UnknownKeyError: raised when a token was signed by a key that is not in the key set
+    LocalJWTVerifier: checks the signature, expiry and claims of a token
+
+Functions:
+    claims_to_credentials_json: maps verified claims to the dictionary Credentials.from_json_object expects
+'''
+
+_HASHES = {"256": hashlib.sha256, "384": hashlib.sha384, "512": hashlib.sha512}
+
+#DER prefixes of the DigestInfo structure used by RSASSA-PKCS1-v1_5 (RFC 8017, section 9.2)
+_DIGEST_INFO_PREFIXES = {
+    "256": bytes.fromhex("3031300d060960864801650304020105000420"),
+    "384": bytes.fromhex("3041300d060960864801650304020205000430"),
+    "512": bytes.fromhex("3051300d060960864801650304020305000440"),
+}
+
+#Claim names issued by the authentication server mapped to Credentials field names
+_CLAIM_TO_CREDENTIAL = {
+    "id": "id",
+    "first_name": "fName",
+    "last_name": "lName",
+    "department": "dept",
+    "title": "title",
+    "location": "loc",
+}
+
+class UnknownKeyError(Exception):
+    '''
+    The token was signed with a key ID or algorithm that the local key set does not contain.
+    Callers should fall back to the remote verifier.
+    '''
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+def _b64url_int(segment: str) -> int:
+    return int.from_bytes(_b64url_decode(segment), "big")
+
+def claims_to_credentials_json(claims: dict[str, Any]) -> dict[str, Any]:
+    '''
+    Maps verified token claims to the dictionary format accepted by Credentials.from_json_object
+
+    Args:
+        claims (dict[str, Any]): the verified claims of a token
+
+    Returns:
+        credentials_json (dict[str, Any]): {'id', 'fName', 'lName', 'dept', 'title', 'loc'} for every claim present
+    '''
+    return {field: claims[claim] for claim, field in _CLAIM_TO_CREDENTIAL.items() if claim in claims}
+
+class LocalJWTVerifier:
+    '''
+    Verifies tokens against a locally cached key set. The key set file is reloaded every
+    refresh_seconds, and at most once per refresh interval when a token names an unknown key ID.
+    '''
+    def __init__(self, key_file: str, refresh_seconds: float = 3600, leeway_seconds: float = 30,
+                 issuer: Optional[str] = None, audience: Optional[str] = None,
+                 clock: Callable[[], float] = time.time):
+        '''
+        Args:
+            key_file (str): path to the JSON key set, in format {"keys": [<jwk>, ...]}
+            refresh_seconds (float optional): how often the key set is reloaded
+            leeway_seconds (float optional): allowed clock skew when checking exp, nbf and iat
+            issuer (str optional): if given, the "iss" claim must equal it
+            audience (str optional): if given, the "aud" claim must equal or contain it
+            clock (Callable optional): wall-clock time source; only overridden in tests
+        '''
+        self.__key_file = key_file
+        self.__refresh_seconds = refresh_seconds
+        self.__leeway_seconds = leeway_seconds
+        self.__issuer = issuer
+        self.__audience = audience
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__keys: list[dict[str, Any]] = []
+        self.__loaded_at = float("-inf")
+        self.reload_keys()
+
+    def reload_keys(self) -> None:
+        '''
+        Reads the key set file and replaces the cached keys. Keys with an unsupported algorithm are skipped.
+        If the file cannot be read or parsed, the cached keys are left as they were.
+
+        Exceptions:
+            OSError: the key set file could not be read
+            ValueError: the key set file is not valid JSON or holds a malformed key
+        '''
+        with open(self.__key_file, "r") as file:
+            key_set = json.load(file)
+        keys = []
+        for jwk in key_set.get("keys", []):
+            alg = jwk.get("alg", "")
+            if alg[:2] == "HS" and alg[2:] in _HASHES and "k" in jwk:
+                keys.append({"kid": jwk.get("kid"), "alg": alg, "secret": _b64url_decode(jwk["k"])})
+            elif alg[:2] == "RS" and alg[2:] in _HASHES and "n" in jwk and "e" in jwk:
+                keys.append({"kid": jwk.get("kid"), "alg": alg,
+                             "n": _b64url_int(jwk["n"]), "e": _b64url_int(jwk["e"])})
+        with self.__lock:
+            self.__keys = keys
+            self.__loaded_at = self.__clock()
+
+    def __reload_keeping_previous(self) -> None:
+        #A missing or half-written key file must not fail requests; the previous keys stay in use and
+        #the next attempt waits for the next refresh window instead of retrying on every token
+        try:
+            self.reload_keys()
+        except Exception as e:
+            LoggerFactory.get_general_logger().error(f"Could not reload JWT keys from {self.__key_file}; keeping the previous key set: {e}")
+            with self.__lock:
+                self.__loaded_at = self.__clock()
+
+    def __refresh_if_stale(self) -> None:
+        if self.__clock() - self.__loaded_at >= self.__refresh_seconds:
+            self.__reload_keeping_previous()
+
+    def __candidate_keys(self, header: dict[str, Any]) -> list[dict[str, Any]]:
+        kid = header.get("kid")
+        alg = header.get("alg")
+        with self.__lock:
+            return [key for key in self.__keys
+                    if key["alg"] == alg and (kid is None or key["kid"] == kid)]
+
+    @staticmethod
+    def __signature_matches(key: dict[str, Any], signing_input: bytes, signature: bytes) -> bool:
+        bits = key["alg"][2:]
+        if key["alg"][:2] == "HS":
+            expected = hmac.new(key["secret"], signing_input, _HASHES[bits]).digest()
+            return hmac.compare_digest(expected, signature)
+        #RSASSA-PKCS1-v1_5: signature^e mod n must equal 0x00 01 FF..FF 00 || DigestInfo || hash
+        n, e = key["n"], key["e"]
+        size = (n.bit_length() + 7) // 8
+        if len(signature) != size:
+            return False
+        signature_int = int.from_bytes(signature, "big")
+        if signature_int >= n:
+            return False
+        encoded = pow(signature_int, e, n).to_bytes(size, "big")
+        digest_info = _DIGEST_INFO_PREFIXES[bits] + _HASHES[bits](signing_input).digest()
+        padding = size - len(digest_info) - 3
+        if padding < 8:
+            return False
+        expected = b"\x00\x01" + b"\xff" * padding + b"\x00" + digest_info
+        return hmac.compare_digest(expected, encoded)
+
+    def __check_claims(self, claims: dict[str, Any]) -> None:
+        now = self.__clock()
+        if not isinstance(claims.get("exp"), (int, float)):
+            raise ValueError("Token has no expiry")
+        if claims["exp"] + self.__leeway_seconds <= now:
+            raise ValueError("Token has expired")
+        if isinstance(claims.get("nbf"), (int, float)) and claims["nbf"] - self.__leeway_seconds > now:
+            raise ValueError("Token is not valid yet")
+        if isinstance(claims.get("iat"), (int, float)) and claims["iat"] - self.__leeway_seconds > now:
+            raise ValueError("Token was issued in the future")
+        if self.__issuer is not None and claims.get("iss") != self.__issuer:
+            raise ValueError("Token issuer is not trusted")
+        if self.__audience is not None:
+            audience = claims.get("aud")
+            audiences = audience if isinstance(audience, list) else [audience]
+            if self.__audience not in audiences:
+                raise ValueError("Token audience is not accepted")
+
+    def verify(self, token: str) -> dict[str, Any]:
+        '''
+        Verifies the signature, expiry and claims of a token
+
+        Args:
+            token (str): the compact-serialized JSON web token
+
+        Returns:
+            claims (dict[str, Any]): the verified claims
+
+        Exceptions:
+            UnknownKeyError: no local key matches the token's key ID and algorithm
+            ValueError: the token is malformed, its signature is invalid or a claim check failed
+        '''
+        self.__refresh_if_stale()
+        try:
+            header_segment, payload_segment, signature_segment = token.split(".")
+            header = json.loads(_b64url_decode(header_segment))
+            signature = _b64url_decode(signature_segment)
+        except Exception:
+            raise ValueError("Malformed token")
+        if not isinstance(header, dict):
+            raise ValueError("Malformed token")
+
+        keys = self.__candidate_keys(header)
+        if not keys:
+            #The key set may have rotated since the last load; retry once per refresh window
+            if self.__clock() - self.__loaded_at >= min(self.__refresh_seconds, 60):
+                self.__reload_keeping_previous()
+                keys = self.__candidate_keys(header)
+            if not keys:
+                raise UnknownKeyError(f"No local key for kid={header.get('kid')} alg={header.get('alg')}")
+
+        signing_input = f"{header_segment}.{payload_segment}".encode("ascii")
+        if not any(self.__signature_matches(key, signing_input, signature) for key in keys):
+            raise ValueError("Invalid token signature")
+
+        try:
+            claims = json.loads(_b64url_decode(payload_segment))
+        except Exception:
+            raise ValueError("Malformed token")
+        if not isinstance(claims, dict):
+            raise ValueError("Malformed token")
+        self.__check_claims(claims)
+        return claims
@@ -0,0 +1,186 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import copy
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler
+from typing import Optional
+
+'''
+log_pipeline.py
+
+This module moves log writing off the request threads. Loggers get a handler that only puts the
+record on a bounded queue; a single background thread takes records off the queue in batches and
+hands them to the real (file/console) handlers, writing each stream once per batch.
+
+Classes:
+    OverflowQueueHandler: enqueues records and applies the overflow policy when the queue is full
+    BatchingLogWriter: background thread that drains the queue and writes records in batches
+'''
+
+OVERFLOW_POLICIES = ("drop_debug", "block")
+
+class OverflowQueueHandler(QueueHandler):
+    '''
+    Puts records on a bounded queue with their message already merged with its arguments; the
+    lines are formatted by the writer thread. When the queue is full:
+        "drop_debug": DEBUG records are dropped; more important records wait up to block_timeout
+        "block": every record waits up to block_timeout
+    A record that still does not fit after block_timeout is dropped and counted.
+    '''
+    def __init__(self, log_queue: queue.Queue, overflow_policy: str = "drop_debug", block_timeout: float = 1.0):
+        '''
+        Args:
+            log_queue (queue.Queue): the bounded queue shared with the BatchingLogWriter
+            overflow_policy (str optional): "drop_debug" or "block"
+            block_timeout (float optional): the longest a request thread waits for room in the queue
+        '''
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow_policy}; use one of {OVERFLOW_POLICIES}")
+        super().__init__(log_queue)
+        self.__overflow_policy = overflow_policy
+        self.__block_timeout = block_timeout
+        self.__dropped = 0
+        self.__dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        #Like QueueHandler.prepare, the message is merged with its arguments on the calling thread, so
+        #arguments that are changed after the call (entries, filters) are logged as they were. The
+        #line itself is still formatted by the writer thread's handlers.
+        record = copy.copy(record)
+        #The template is kept for formatters that group on it (JsonLinesFormatter)
+        record.template = record.msg
+        record.msg = record.getMessage()
+        record.args = None
+        #Tracebacks are rendered now because the exception objects cannot safely outlive the request
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if self.__overflow_policy == "drop_debug" and record.levelno <= logging.DEBUG:
+            self.__count_drop()
+            return
+        try:
+            self.queue.put(record, timeout=self.__block_timeout)
+        except queue.Full:
+            self.__count_drop()
+
+    def __count_drop(self) -> None:
+        with self.__dropped_lock:
+            self.__dropped += 1
+
+    def dropped(self) -> int:
+        '''
+        Returns:
+            dropped (int): how many records were discarded because the queue was full
+        '''
+        with self.__dropped_lock:
+            return self.__dropped
+
+class BatchingLogWriter:
+    '''
+    Background thread that writes queued records. Records are routed to the handlers of the logger
+    that created them. For stream handlers (files and console) a whole batch is formatted and written
+    with one write and one flush; any other handler receives the records one at a time.
+    '''
+    _STOP = object()
+
+    def __init__(self, log_queue: queue.Queue, routes: dict[str, list[logging.Handler]], batch_size: int = 256):
+        '''
+        Args:
+            log_queue (queue.Queue): the bounded queue filled by OverflowQueueHandler
+            routes (dict[str, list[logging.Handler]]): the real handlers of each logger, keyed by logger name
+            batch_size (int optional): the most records written per batch
+        '''
+        self.__queue = log_queue
+        self.__routes = routes
+        self.__batch_size = batch_size
+        self.__thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        '''
+        Starts the writer thread if it is not running
+        '''
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+        self.__thread = threading.Thread(target=self.__run, name="log-writer", daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        '''
+        Writes every record still in the queue, flushes the handlers and stops the thread. Registered
+        with atexit so that logs are not lost on shutdown.
+        '''
+        if self.__thread is None:
+            return
+        self.__queue.put(self._STOP)
+        self.__thread.join(timeout)
+        self.__thread = None
+
+    def __run(self) -> None:
+        while True:
+            batch = [self.__queue.get()]
+            while len(batch) < self.__batch_size:
+                try:
+                    batch.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = any(record is self._STOP for record in batch)
+            self.write_batch([record for record in batch if record is not self._STOP])
+            if stopping:
+                return
+
+    def write_batch(self, records: list[logging.LogRecord]) -> None:
+        '''
+        Writes a batch of records to the handlers of their loggers
+
+        Args:
+            records (list[logging.LogRecord]): the records to write, in the order they were logged
+        '''
+        by_handler: dict[logging.Handler, list[logging.LogRecord]] = {}
+        for record in records:
+            for handler in self.__routes.get(record.name, ()):
+                if record.levelno >= handler.level:
+                    by_handler.setdefault(handler, []).append(record)
+        for handler, handler_records in by_handler.items():
+            try:
+                if isinstance(handler, logging.StreamHandler):
+                    self.__write_stream(handler, handler_records)
+                else:
+                    for record in handler_records:
+                        handler.handle(record)
+            except Exception:
+                #A failing handler must never stop the writer thread
+                for record in handler_records:
+                    handler.handleError(record)
+
+    @staticmethod
+    def __write_stream(handler: logging.StreamHandler, records: list[logging.LogRecord]) -> None:
+        lines = []
+        for record in records:
+            try:
+                if handler.filter(record):
+                    lines.append(handler.format(record) + handler.terminator)
+            except Exception:
+                #One record that cannot be formatted is reported and skipped, not the whole batch
+                handler.handleError(record)
+        if not lines:
+            return
+        with handler.lock:
+            #Let rotating handlers roll over before the batch is written
+            if hasattr(handler, "shouldRollover") and handler.shouldRollover(records[0]):
+                handler.doRollover()
+            if handler.stream is None and hasattr(handler, "_open"):
+                handler.stream = handler._open()
+            handler.stream.write("".join(lines))
+            handler.flush()
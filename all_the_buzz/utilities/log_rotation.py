@@ -0,0 +1,172 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import gzip
+import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging.handlers import BaseRotatingHandler
+from typing import Optional
+from all_the_buzz.utilities.logger import LoggerFactory
+
+'''
+log_rotation.py
+
+This module contains the file handler used for general.log and security.log. The active file is
+rotated by size and by age; rotated segments are gzipped on a background thread and only the newest
+ones are kept.
+
+Classes:
+    CompressedRotatingFileHandler: size/time rotating file handler with background gzip and retention
+'''
+
+#One shared worker compresses and prunes segments for every handler so rotation never blocks a write
+_compressor: Optional[ThreadPoolExecutor] = None
+_compressor_lock = threading.Lock()
+
+def _get_compressor() -> ThreadPoolExecutor:
+    global _compressor
+    with _compressor_lock:
+        if _compressor is None:
+            _compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+        return _compressor
+
+class CompressedRotatingFileHandler(BaseRotatingHandler):
+    '''
+    Writes to a single log file and rotates it once it reaches max_bytes or is interval_seconds old.
+    A rotated segment is renamed to <file>.<YYYYmmdd-HHMMSS> and gzipped in the background. Only the
+    newest backup_count segments are kept, and the oldest are also removed while all segments together
+    exceed max_total_bytes. Every path the handler renames, creates or deletes must pass
+    LoggerFactory._is_safe_log_path.
+    '''
+    def __init__(self, filename: str, max_bytes: int = 50 * 1024 * 1024, interval_seconds: float = 86400,
+                 backup_count: int = 14, max_total_bytes: Optional[int] = None, compress: bool = True,
+                 encoding: Optional[str] = "utf-8", delay: bool = False):
+        '''
+        Args:
+            filename (str): the active log file
+            max_bytes (int optional): rotate once the file would grow past this size; 0 disables size rotation
+            interval_seconds (float optional): rotate once the file has been written to this long; 0 disables time rotation
+            backup_count (int optional): the number of rotated segments kept
+            max_total_bytes (int optional): the most disk space rotated segments may use together
+            compress (bool optional): gzip rotated segments in the background
+            encoding (str optional): the encoding of the log file
+            delay (bool optional): open the file on the first write instead of now
+
+        Exceptions:
+            ValueError: the log file is outside of the allowed log directory
+        '''
+        self.__check_path(filename)
+        super().__init__(filename, "a", encoding=encoding, delay=delay)
+        self.__max_bytes = max_bytes
+        self.__interval_seconds = interval_seconds
+        self.__backup_count = backup_count
+        self.__max_total_bytes = max_total_bytes
+        self.__compress = compress
+        self.__rollover_at = self.__next_rollover_time()
+        self.__segment_pattern = re.compile(
+            re.escape(os.path.basename(self.baseFilename)) + r"\.(\d{8}-\d{6})(?:-(\d+))?(\.gz)?$")
+        self.__pending: Optional[Future] = None
+        self.__last_segment = ("", 0)
+
+    @staticmethod
+    def __check_path(path: str) -> None:
+        if not LoggerFactory._is_safe_log_path(path):
+            raise ValueError(f"Unsafe log path detected: {path}")
+
+    def __next_rollover_time(self) -> float:
+        if self.__interval_seconds <= 0:
+            return float("inf")
+        return time.time() + self.__interval_seconds
+
+    def shouldRollover(self, record) -> bool:
+        '''
+        Returns True if writing record would pass max_bytes or the file is older than interval_seconds
+        '''
+        if time.time() >= self.__rollover_at:
+            return True
+        if self.__max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            if self.stream.tell() + len(self.format(record)) + 1 >= self.__max_bytes:
+                return self.stream.tell() > 0
+        return False
+
+    def __segment_path(self) -> str:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        #Segments rotated within the same second get an increasing counter so they stay in order
+        counter = self.__last_segment[1] + 1 if self.__last_segment[0] == stamp else 0
+        path = f"{self.baseFilename}.{stamp}" + (f"-{counter}" if counter else "")
+        while os.path.exists(path) or os.path.exists(path + ".gz"):
+            counter += 1
+            path = f"{self.baseFilename}.{stamp}-{counter}"
+        self.__last_segment = (stamp, counter)
+        self.__check_path(path)
+        return path
+
+    def doRollover(self) -> None:
+        '''
+        Closes the active file, renames it to a timestamped segment, reopens a new file and hands the
+        segment to the background worker for compression and pruning
+        '''
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+        segment = None
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            segment = self.__segment_path()
+            os.replace(self.baseFilename, segment)
+        self.stream = self._open()
+        self.__rollover_at = self.__next_rollover_time()
+        self.__pending = _get_compressor().submit(self._finish_segment, segment)
+
+    def _finish_segment(self, segment: Optional[str]) -> None:
+        #Runs on the compressor thread: gzip the new segment, then enforce retention
+        if segment is not None and self.__compress:
+            compressed = segment + ".gz"
+            self.__check_path(compressed)
+            temporary = compressed + ".tmp"
+            with open(segment, "rb") as source, gzip.open(temporary, "wb") as target:
+                shutil.copyfileobj(source, target, 1024 * 1024)
+            os.replace(temporary, compressed)
+            os.remove(segment)
+        self.prune()
+
+    def segments(self) -> list[str]:
+        '''
+        Returns:
+            segments (list[str]): paths of the rotated segments of this file, oldest first
+        '''
+        directory = os.path.dirname(self.baseFilename)
+        found = []
+        for name in os.listdir(directory):
+            match = self.__segment_pattern.match(name)
+            if match:
+                found.append(((match.group(1), int(match.group(2) or 0)), os.path.join(directory, name)))
+        return [path for _, path in sorted(found)]
+
+    def prune(self) -> None:
+        '''
+        Deletes the oldest rotated segments until at most backup_count remain and, if max_total_bytes
+        is set, until they fit within it
+        '''
+        segments = self.segments()
+        sizes = {path: os.path.getsize(path) for path in segments}
+        total = sum(sizes.values())
+        while segments and (len(segments) > self.__backup_count or
+                            (self.__max_total_bytes is not None and total > self.__max_total_bytes)):
+            oldest = segments.pop(0)
+            self.__check_path(oldest)
+            os.remove(oldest)
+            total -= sizes[oldest]
+
+    def wait_for_compression(self, timeout: Optional[float] = None) -> None:
+        '''
+        Blocks until the last rotated segment has been compressed and pruned
+        '''
+        if self.__pending is not None:
+            self.__pending.result(timeout)
@@ -3,10 +3,14 @@
 # See LICENSE for more details
 
 #utilities/logger.py
+import atexit
 import logging
 import logging.config
+import queue
 import yaml
 import os
+from all_the_buzz.utilities.log_pipeline import BatchingLogWriter, OverflowQueueHandler
+from all_the_buzz.utilities.structured_logging import LogSampler
 #from utilities.config import YamlReader
 
 #Ensures logging security so that malicious user cannot define a new path
@@ -14,17 +18,18 @@ ALLOWED_LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..",
 
 #Create private SmartLogger wrapper class that optimizes the logging by only calling if the yaml
 #is set to that level or above. Stacklevel is set to 2 to ensure the original call's file will be
-#output and not the wrapper.
+#output and not the wrapper. DEBUG records may additionally be sampled (see debug_sampling in config).
 class _SmartLogger:
     '''
     This class optimizes the speed of the loggers by discarding logs below the currently set
     sensitivity. To change this, disable the SmartLogger variable in the log config
     '''
-    def __init__(self, name):
+    def __init__(self, name, sampler = None):
         self._logger = logging.getLogger(name)
+        self._sampler = sampler
 
     def debug(self, msg, *args, **kwargs):
-        if self._logger.isEnabledFor(logging.DEBUG):
+        if self._logger.isEnabledFor(logging.DEBUG) and (self._sampler is None or self._sampler.keep(self._logger.name, msg)):
             self._logger.debug(msg, *args, stacklevel = 2, **kwargs)
 
     def info(self, msg, *args, **kwargs):
@@ -56,6 +61,10 @@ class LoggerFactory:
     _general_logger = None
     _security_logger = None
     _use_smart_logger = True #Default; change in config!
+    _response_logging = {} #Settings for how ResponseCode payloads are logged; see response_logging in config
+    _log_writer = None #Background writer thread when async_logging is enabled in config
+    _debug_sampler = None #Samples DEBUG records when debug_sampling rates below 1 are set in config
+    _queue_handlers = []
 
     def _is_safe_log_path(path: str) -> bool:
         '''
@@ -97,6 +106,8 @@ class LoggerFactory:
             config = yaml.safe_load(f)
 
         LoggerFactory._use_smart_logger = config.get("use_smart_logger", True)
+        LoggerFactory._response_logging = config.get("response_logging") or {}
+        LoggerFactory._debug_sampler = LogSampler.from_config(config.get("debug_sampling") or {})
         
         #Set the absolute path of the log files inside the config file
         for _, handler in config.get("handlers", {}).items():
@@ -107,8 +118,56 @@ class LoggerFactory:
                 handler["filename"] = resolved_path
 
         logging.config.dictConfig(config)
+        async_settings = config.get("async_logging") or {}
+        if async_settings.get("enabled", False):
+            LoggerFactory._start_log_pipeline(async_settings, list(config.get("loggers", {})))
         LoggerFactory._initialized = True
 
+    @staticmethod
+    def _start_log_pipeline(settings: dict, logger_names: list[str]) -> None:
+        '''
+        Moves the handlers of each configured logger behind a bounded queue so that logging calls only
+        pay for an enqueue. A single background thread writes the queued records in batches, and the
+        queue is flushed when the interpreter exits.
+
+        Args:
+            settings (dict): the async_logging section of the logging config
+            logger_names (list[str]): the loggers whose handlers are moved behind the queue
+        '''
+        log_queue = queue.Queue(maxsize=settings.get("queue_size", 10000))
+        queue_handler = OverflowQueueHandler(log_queue, settings.get("overflow_policy", "drop_debug"),
+                                             settings.get("block_timeout", 1.0))
+        routes = {}
+        for name in logger_names:
+            logger = logging.getLogger(name)
+            routes[name] = list(logger.handlers)
+            for handler in routes[name]:
+                logger.removeHandler(handler)
+            logger.addHandler(queue_handler)
+
+        LoggerFactory._log_writer = BatchingLogWriter(log_queue, routes, settings.get("batch_size", 256))
+        LoggerFactory._log_writer.start()
+        LoggerFactory._queue_handlers = [queue_handler]
+        atexit.register(LoggerFactory.shutdown)
+
+    @staticmethod
+    def shutdown() -> None:
+        '''
+        Writes every queued log record and stops the background writer. Does nothing unless
+        async_logging is enabled.
+        '''
+        if LoggerFactory._log_writer is not None:
+            LoggerFactory._log_writer.stop()
+            LoggerFactory._log_writer = None
+
+    @staticmethod
+    def get_dropped_log_count() -> int:
+        '''
+        Returns:
+            dropped (int): how many log records were discarded because the async_logging queue was full
+        '''
+        return sum(handler.dropped() for handler in LoggerFactory._queue_handlers)
+
     @staticmethod
     def get_general_logger() -> logging.Logger:
         '''
@@ -120,7 +179,7 @@ class LoggerFactory:
         LoggerFactory.initialize()
         if LoggerFactory._general_logger is None:
             if LoggerFactory._use_smart_logger:
-                LoggerFactory._general_logger = _SmartLogger("generalLogger")
+                LoggerFactory._general_logger = _SmartLogger("generalLogger", LoggerFactory._debug_sampler)
             else:
                 LoggerFactory._general_logger = logging.getLogger("generalLogger")
         return LoggerFactory._general_logger
@@ -136,7 +195,18 @@ class LoggerFactory:
         LoggerFactory.initialize()
         if LoggerFactory._security_logger is None:
             if LoggerFactory._use_smart_logger:
-                LoggerFactory._security_logger = _SmartLogger("securityLogger")
+                LoggerFactory._security_logger = _SmartLogger("securityLogger", LoggerFactory._debug_sampler)
             else:
                 LoggerFactory._security_logger = logging.getLogger("securityLogger")
-        return LoggerFactory._security_logger
\ No newline at end of file
+        return LoggerFactory._security_logger
+
+    @staticmethod
+    def get_response_logging_settings() -> dict:
+        '''
+        Returns the response_logging section of the logging config. First initalizes LoggerFactory if not already initialized
+        
+        Returns:
+            settings (dict): how ResponseCode payloads are summarized in the logs (may be empty)
+        '''
+        LoggerFactory.initialize()
+        return LoggerFactory._response_logging
@@ -4,6 +4,9 @@
 
 import nh3
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Optional
 from all_the_buzz.utilities.logger import LoggerFactory
 '''
 sanitize.py
@@ -13,11 +16,117 @@ code injection.
 
 Functions:
     sanitize_json: function that uses the nh3 and re library to sanitize strings
+    sanitize_string: sanitizes a single string
+    sanitize_many: sanitizes a batch of documents in one pass
     '''
 
-def sanitize_json(content):
+#Patterns are compiled once instead of on every string
+_TEMPLATE_PATTERN = re.compile(r"\{[^{}]*\}")
+_VARIABLE_PATTERN = re.compile(r"\$[a-zA-Z]+")
+#Every character that nh3.clean (with no allowed tags) or the patterns above can change. A string
+#without any of them comes out of the cleaning unchanged, so it is returned as-is.
+_NEEDS_CLEANING = re.compile("[\x00\r&<>\xa0\ufeff{}$]")
+#Strings up to this length are memoized; these are mostly repeated values such as language or category
+_CACHED_STRING_LENGTH = 64
+#Below this many distinct strings a thread pool costs more than it saves
+_MIN_PARALLEL_STRINGS = 256
+
+def _clean(text: str) -> str:
+    text = nh3.clean(text, tags=set())
+    text = _TEMPLATE_PATTERN.sub("", text)
+    return _VARIABLE_PATTERN.sub("", text)
+
+@lru_cache(maxsize=4096)
+def _clean_short(text: str) -> str:
+    return _clean(text)
+
+def sanitize_string(text: str) -> str:
+    """
+    Strips HTML, {...} templates and $variables from a single string.
+
+    Args:
+        text (str): the string to clean
+
+    Returns:
+        the cleaned string (the same object if nothing needed cleaning)
+        """
+    if _NEEDS_CLEANING.search(text) is None:
+        return text
+    return _clean_needed(text)
+
+def _clean_needed(text: str) -> str:
+    #Only called for strings that failed the fast path check
+    if len(text) <= _CACHED_STRING_LENGTH:
+        return _clean_short(text)
+    return _clean(text)
+
+def _copy_without_strings(documents: list, pending: dict[str, list[tuple[Any, Any]]]) -> list:
+    #Copies the dict/list structure of documents. Strings that need cleaning are left as None and
+    #their (container, key) slots are collected in pending, keyed by the string
+    root = []
+    stack = [(documents, root)]
+    while stack:
+        source, target = stack.pop()
+        is_dict = isinstance(source, dict)
+        for key, value in (source.items() if is_dict else enumerate(source)):
+            slot = None
+            if isinstance(value, str):
+                if _NEEDS_CLEANING.search(value) is not None:
+                    slot = value
+                    value = None
+            elif isinstance(value, dict):
+                child = {}
+                stack.append((value, child))
+                value = child
+            elif isinstance(value, list):
+                child = []
+                stack.append((value, child))
+                value = child
+            if is_dict:
+                target[key] = value
+            else:
+                key = len(target)
+                target.append(value)
+            if slot is not None:
+                pending.setdefault(slot, []).append((target, key))
+    return root
+
+def sanitize_many(documents: list, workers: Optional[int] = None) -> list:
     """
-    This function uses the nh3 library to clean inputs.
+    Sanitizes a batch of documents in one pass. Every string in the batch is collected
+    first, each distinct string is cleaned once (optionally across a thread pool; nh3
+    releases the GIL while cleaning) and the results are put back into copies of the
+    documents.
+
+    Args:
+        documents (list): the dictionaries, lists or strings to sanitize
+        workers (int optional): the number of threads used for cleaning; None cleans on this thread
+
+    Returns:
+        a list of the cleaned documents, in the same order
+        """
+    logger=LoggerFactory.get_general_logger()
+
+    logger.debug("Begin batch sanitization of %d documents", len(documents))
+
+    pending: dict[str, list[tuple[Any, Any]]] = {}
+    cleaned_documents = _copy_without_strings(documents, pending)
+    texts = list(pending)
+    if workers is not None and workers > 1 and len(texts) >= _MIN_PARALLEL_STRINGS:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            cleaned = list(pool.map(_clean_needed, texts, chunksize=max(1, len(texts) // (workers * 4))))
+    else:
+        cleaned = [_clean_needed(text) for text in texts]
+    for text, clean_text in zip(texts, cleaned):
+        for container, key in pending[text]:
+            container[key] = clean_text
+    return cleaned_documents
+
+def sanitize_json(content: Any) -> Any:
+    """
+    This function uses the nh3 library to clean inputs. Nested dictionaries and lists
+    are walked with an explicit stack, so deeply nested documents cannot hit the
+    recursion limit.
     
     Args:
         content: this is either a dictionary, list, or string that needs to be
@@ -26,20 +135,6 @@ def sanitize_json(content):
     Returns:
         either cleaned content if proper format or the original content input
         """
-    logger=LoggerFactory.get_general_logger()
-
-    logger.debug("Begin sanitization")
-
-    if isinstance(content, dict):
-        return {key:sanitize_json(value) for key, value in content.items()}
-    elif isinstance(content, list):
-        return [sanitize_json(value) for value in content]
-    elif isinstance(content, str):
-        text = nh3.clean(content, tags=set())
-        text = re.sub(r"\{[^{}]*\}", "", text)
-        text = re.sub(r"\$[a-zA-Z]+", "", text)
-        return text
-    else:
+    if not isinstance(content, (dict, list, str)):
         return content
-    
-
+    return sanitize_many([content])[0]
@@ -0,0 +1,83 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import threading
+from typing import Any, Callable, Hashable
+
+'''
+single_flight.py
+
+This module contains a helper that coalesces concurrent calls for the same key so that only one
+of them does the work and every caller receives its result.
+
+Classes:
+    SingleFlight: runs at most one call per key at a time and shares the result with all waiters
+'''
+
+class _Call:
+    #Holds the outcome of one in-flight call so that waiters can read it once it is done
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    '''
+    Coalesces concurrent calls. The first caller for a key runs the function; callers that arrive
+    for the same key while it is running block until it finishes and receive the same result (or
+    the same exception). Once the call finishes, the key is forgotten so later calls run again.
+    '''
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__calls: dict[Hashable, _Call] = {}
+        self.__shared = 0
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        '''
+        Runs func(*args, **kwargs) unless a call for key is already in flight, in which case the
+        in-flight call's result is returned instead
+
+        Args:
+            key (Hashable): identifies calls that may share a result
+            func (Callable): the function to run
+
+        Returns:
+            result (Any): the return value of the call that ran for this key
+        '''
+        with self.__lock:
+            call = self.__calls.get(key)
+            if call is not None:
+                self.__shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self.__calls[key] = call
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+
+    def stats(self) -> dict[str, int]:
+        '''
+        Returns:
+            stats (dict[str, int]): the number of calls in flight and how many calls shared a result
+        '''
+        with self.__lock:
+            return {"in_flight": len(self.__calls), "shared": self.__shared}
@@ -0,0 +1,170 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import json
+import logging
+import random
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+'''
+structured_logging.py
+
+This module adds request context and sampling to the loggers. Each request records its request id,
+route, DAO class, start time and outcome tag in a context variable; RequestContextFilter copies them
+onto every log record, and JsonLinesFormatter writes records as one JSON object per line. LogSampler
+decides which DEBUG records are kept so DEBUG can stay enabled in production at a low rate.
+
+Classes:
+    RequestContextFilter: logging filter that adds the request context fields to each record
+    JsonLinesFormatter: formats records as JSON lines
+    LogSampler: per-logger and per-message sampling rates for DEBUG records
+
+Functions:
+    start_request: begins a new log context for a request
+    end_request: discards the log context of a request
+    set_log_context: updates fields of the current request's log context
+    get_log_context: returns the current request's log context
+'''
+
+CONTEXT_FIELDS = ("request_id", "route", "dao", "outcome")
+
+#Holds a mutable dict per request (or None outside of a request); set once per request, updated in place
+_request_context: ContextVar[Optional[dict[str, Any]]] = ContextVar("request_context", default=None)
+
+def start_request(route: str, request_id: Optional[str] = None) -> Any:
+    '''
+    Begins a new log context for the current request
+
+    Args:
+        route (str): the route being served
+        request_id (str optional): the caller-supplied request id; a new one is generated if missing
+
+    Returns:
+        token (contextvars.Token): pass to end_request once the request is done
+    '''
+    context = {"request_id": request_id or uuid.uuid4().hex, "route": route, "dao": None,
+               "outcome": None, "start": time.perf_counter()}
+    return _request_context.set(context)
+
+def end_request(token: Any) -> None:
+    '''
+    Discards the log context created by start_request
+
+    Args:
+        token (contextvars.Token): the value returned by start_request
+    '''
+    _request_context.reset(token)
+
+def set_log_context(**fields: Any) -> None:
+    '''
+    Updates fields of the current request's log context. Does nothing outside of a request.
+    '''
+    context = _request_context.get()
+    if context is not None:
+        context.update(fields)
+
+def get_log_context() -> Optional[dict[str, Any]]:
+    '''
+    Returns:
+        context (dict[str, Any] | None): the current request's log context, or None outside of a request
+    '''
+    return _request_context.get()
+
+class RequestContextFilter(logging.Filter):
+    '''
+    Copies the current request's context onto each record as request_id, route, dao, outcome and
+    elapsed_ms (milliseconds since the request started). Attach it to loggers rather than handlers so it
+    runs on the thread that logged the record, before the record is queued.
+    '''
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _request_context.get()
+        if context is None:
+            for field in CONTEXT_FIELDS:
+                setattr(record, field, None)
+            record.elapsed_ms = None
+            return True
+        for field in CONTEXT_FIELDS:
+            setattr(record, field, context[field])
+        record.elapsed_ms = round((time.perf_counter() - context["start"]) * 1000, 3)
+        return True
+
+class JsonLinesFormatter(logging.Formatter):
+    '''
+    Formats each record as a single JSON object. "key" is the unformatted message template, which
+    stays the same across calls when messages use %-style arguments, so it can be grouped and sampled on.
+    '''
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "location": f"{record.module}.{record.funcName}:{record.lineno}",
+            #log_pipeline merges msg with its arguments before queueing and keeps the template apart
+            "key": str(getattr(record, "template", record.msg)),
+            "message": record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS + ("elapsed_ms",):
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+class LogSampler:
+    '''
+    Keeps a fraction of DEBUG records. A rate set for the message template wins over a rate set for the
+    logger, which wins over the default rate. A rate of 1 keeps every record and 0 drops every record.
+    '''
+    def __init__(self, default_rate: float = 1.0, logger_rates: Optional[dict[str, float]] = None,
+                 message_rates: Optional[dict[str, float]] = None, rand: Callable[[], float] = random.random):
+        '''
+        Args:
+            default_rate (float optional): the fraction of DEBUG records kept when no other rate applies
+            logger_rates (dict[str, float] optional): rates by logger name
+            message_rates (dict[str, float] optional): rates by message template
+            rand (Callable optional): random number source in [0, 1); only overridden in tests
+        '''
+        self.__default_rate = default_rate
+        self.__logger_rates = logger_rates or {}
+        self.__message_rates = message_rates or {}
+        self.__rand = rand
+
+    @classmethod
+    def from_config(cls, settings: dict[str, Any]) -> Optional["LogSampler"]:
+        '''
+        Builds a sampler from the sampling section of the logging config
+
+        Returns:
+            sampler (LogSampler | None): None when every rate is 1, so callers can skip sampling entirely
+        '''
+        default_rate = settings.get("default_debug_rate", 1.0)
+        logger_rates = settings.get("loggers") or {}
+        message_rates = settings.get("messages") or {}
+        if default_rate >= 1 and all(rate >= 1 for rate in (*logger_rates.values(), *message_rates.values())):
+            return None
+        return cls(default_rate, logger_rates, message_rates)
+
+    def keep(self, logger_name: str, msg: Any) -> bool:
+        '''
+        Decides whether a DEBUG record is kept
+
+        Args:
+            logger_name (str): the name of the logger
+            msg (Any): the unformatted message template
+
+        Returns:
+            keep (bool): True if the record should be logged
+        '''
+        rate = self.__message_rates.get(msg) if isinstance(msg, str) else None
+        if rate is None:
+            rate = self.__logger_rates.get(logger_name, self.__default_rate)
+        if rate >= 1:
+            return True
+        return rate > 0 and self.__rand() < rate
@@ -0,0 +1,126 @@
+# Copyright (C) 2025 Team White 
+# Licensed under the MIT License
+# See LICENSE for more details
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+'''
+ttl_cache.py
+
+This module contains a small in-process cache that is bounded both by size and by age.
+
+Classes:
+    TTLCache: thread-safe LRU cache whose entries expire after a time-to-live
+'''
+
+class TTLCache:
+    '''
+    Thread-safe cache that keeps at most max_size entries. Once full, the least recently used
+    entry is evicted. Entries older than their time-to-live are treated as misses and dropped.
+    Hit, miss, eviction and expiration counters are kept so the cache can be sized.
+    '''
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        '''
+        Args:
+            max_size (int): the maximum number of entries kept before the LRU entry is evicted
+            ttl_seconds (float): the default number of seconds an entry stays valid
+            clock (Callable optional): monotonic time source; only overridden in tests
+        '''
+        if max_size <= 0:
+            raise ValueError("Cache max_size must be positive")
+        if ttl_seconds <= 0:
+            raise ValueError("Cache ttl_seconds must be positive")
+        self.__max_size = max_size
+        self.__ttl_seconds = ttl_seconds
+        self.__clock = clock
+        self.__entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        '''
+        Returns the cached value for key, or default if it is missing or expired
+
+        Args:
+            key (Hashable): the cache key
+            default (Any optional): the value returned on a miss (defaults to None)
+
+        Returns:
+            value (Any): the cached value or default
+        '''
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.__misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= self.__clock():
+                del self.__entries[key]
+                self.__expirations += 1
+                self.__misses += 1
+                return default
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        '''
+        Stores value under key, evicting the least recently used entry if the cache is full
+
+        Args:
+            key (Hashable): the cache key
+            value (Any): the value to store
+            ttl_seconds (float optional): overrides the default time-to-live for this entry
+        '''
+        ttl = self.__ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+            self.__entries[key] = (self.__clock() + ttl, value)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        '''
+        Removes a single key from the cache if present
+        '''
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        '''
+        Removes every entry from the cache; the counters are kept
+        '''
+        with self.__lock:
+            self.__entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        '''
+        Returns the cache counters
+
+        Returns:
+            stats (dict[str, int]): size, max_size, hits, misses, evictions and expirations
+        '''
+        with self.__lock:
+            return {
+                "size": len(self.__entries),
+                "max_size": self.__max_size,
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "evictions": self.__evictions,
+                "expirations": self.__expirations,
+            }
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)